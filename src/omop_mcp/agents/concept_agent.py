@@ -9,7 +9,7 @@ import structlog
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent, RunContext
 
-from omop_mcp.models import OMOPConcept
+from omop_mcp.models import CONCEPT_LIST_ADAPTER, OMOPConcept
 from omop_mcp.tools.athena import discover_concepts
 
 logger = structlog.get_logger(__name__)
@@ -104,7 +104,7 @@ class ConceptDiscoveryAgent:
             )
 
             return {
-                "concepts": [c.model_dump() for c in result.concepts],
+                "concepts": CONCEPT_LIST_ADAPTER.dump_python(result.concepts),
                 "total_found": len(result.concepts),
                 "query": query,
             }
@@ -192,7 +192,7 @@ Always provide the concept_ids list for downstream SQL generation."""
                 concepts_found=len(result.output.concepts),
             )
 
-            return ConceptSearchResult(**result.output.model_dump())
+            return result.output
 
         except Exception as e:
             logger.error(
@@ -259,7 +259,7 @@ Provide reasoning for inclusions/exclusions."""
                 refined_count=len(result.output.concepts),
             )
 
-            return ConceptSearchResult(**result.output.model_dump())
+            return result.output
 
         except Exception as e:
             logger.error(
@@ -299,7 +299,7 @@ Analyze the question and generate appropriate SQL.""",
                 is_valid=result.output.is_valid,
             )
 
-            return SQLGenerationResult(**result.output.model_dump())
+            return result.output
 
         except Exception as e:
             logger.error(
@@ -366,7 +366,7 @@ Provide:
 
             logger.info("optimize_sql_success", original_length=len(sql))
 
-            return SQLGenerationResult(**result.output.model_dump())
+            return result.output
 
         except Exception as e:
             logger.error("optimize_sql_failed", error=str(e), exc_info=True)
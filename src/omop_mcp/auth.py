@@ -4,16 +4,69 @@ OAuth 2.1 authentication and authorization middleware for OMOP MCP server.
 Provides JWT token validation, role-based access control, and audit logging.
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import sys
+import threading
+import time
 from typing import Any
 
+import httpx
 import jwt
 import structlog
-from jwt import PyJWKClient
+from cachetools import TLRUCache
+from jwt import PyJWKClient, PyJWKSet
 
 from omop_mcp.config import config
 
 logger = structlog.get_logger(__name__)
 
+# Resolved once so hot-path info/debug events skip building kwargs when filtered out
+_LOG_LEVEL = logging.getLevelNamesMapping().get(config.log_level.upper(), logging.INFO)
+_INFO_ENABLED = _LOG_LEVEL <= logging.INFO
+_DEBUG_ENABLED = _LOG_LEVEL <= logging.DEBUG
+
+# Validated-token cache: successful decodes are reused until min(exp, now + TTL),
+# failed validations are remembered briefly to blunt brute-force retries.
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SEC = 300
+NEGATIVE_TOKEN_CACHE_TTL_SEC = 5
+
+# jwt.decode arguments shared by every call (OAuth 2.1 requires asymmetric signing)
+_JWT_ALGS = ("RS256",)
+_JWT_OPTIONS = {
+    "verify_signature": True,
+    "verify_exp": True,
+    "verify_iat": True,
+    "verify_aud": True,
+    "verify_iss": True,
+}
+
+# Async JWKS cache: keys are refreshed in the background shortly before they go stale
+JWKS_CACHE_TTL_SEC = 3600
+JWKS_REFRESH_AHEAD_SEC = 300
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash a bearer token so raw credentials are never kept as cache keys."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _roles_claim(payload: dict[str, Any]) -> list[str]:
+    """Return the payload's roles claim as a list; a single-role string claim is wrapped."""
+    roles = payload.get("roles") or []
+    if isinstance(roles, str):
+        # Avoid substring matches such as "admin" in "administrator"
+        return [roles]
+    return roles
+
+
+def _token_cache_ttu(_key: bytes, value: tuple[float, Any, str | None], _now: float) -> float:
+    """Per-entry expiry: each cache value carries its own absolute expiry time."""
+    return value[0]
+
 
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
@@ -27,6 +80,88 @@ class AuthorizationError(Exception):
     pass
 
 
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive HTTP client for JWKS fetches (HTTP/2 when h2 is installed)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=4),
+            timeout=httpx.Timeout(10.0),
+        )
+    return _http_client
+
+
+class AsyncJWKSClient:
+    """
+    Non-blocking JWKS client with an in-memory key cache.
+
+    Keys are stored as parsed public key objects so jwt.decode skips PEM/JWK
+    loading. Concurrent cache misses share a single fetch, and keys nearing
+    expiry are refreshed in the background (refresh-ahead).
+    """
+
+    def __init__(self, jwks_uri: str, ttl: float = JWKS_CACHE_TTL_SEC):
+        """
+        Initialize async JWKS client.
+
+        Args:
+            jwks_uri: JWKS endpoint URL
+            ttl: Seconds before cached keys are considered stale
+        """
+        self.jwks_uri = jwks_uri
+        self.ttl = ttl
+        self._keys: dict[str, Any] = {}
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    async def get_signing_key(self, kid: str | None) -> Any:
+        """
+        Return the public key for a key ID, fetching the JWKS if needed.
+
+        Args:
+            kid: Key ID from the JWT header
+
+        Returns:
+            Parsed public key usable with jwt.decode
+
+        Raises:
+            AuthenticationError: If no matching key exists
+        """
+        age = time.monotonic() - self._fetched_at
+        if kid in self._keys and age < self.ttl:
+            if age > self.ttl - JWKS_REFRESH_AHEAD_SEC:
+                self._schedule_refresh()
+            return self._keys[kid]
+
+        await self._refresh(self._fetched_at)
+        if kid not in self._keys:
+            raise AuthenticationError(f"Unable to find a signing key that matches: {kid}")
+        return self._keys[kid]
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh(self._fetched_at))
+
+    async def _refresh(self, seen_fetched_at: float) -> None:
+        async with self._lock:
+            # Another coroutine refreshed while we waited for the lock
+            if self._fetched_at != seen_fetched_at:
+                return
+
+            response = await _get_http_client().get(self.jwks_uri)
+            response.raise_for_status()
+            jwk_set = PyJWKSet.from_dict(response.json())
+
+            self._keys = {jwk.key_id: jwk.key for jwk in jwk_set.keys if jwk.key_id}
+            self._fetched_at = time.monotonic()
+            logger.info("jwks_refreshed", jwks_uri=self.jwks_uri, key_count=len(self._keys))
+
+
 class OAuthValidator:
     """
     OAuth 2.1 token validator with JWT verification.
@@ -52,12 +187,18 @@ class OAuthValidator:
             jwks_uri: JWKS endpoint for public key fetching
                      (default: {issuer}/.well-known/jwks.json)
         """
+        self._token_cache: TLRUCache[bytes, tuple[float, dict[str, Any] | None, str | None]] = (
+            TLRUCache(maxsize=TOKEN_CACHE_MAXSIZE, ttu=_token_cache_ttu, timer=time.time)
+        )
+        self._token_cache_lock = threading.Lock()
+
         # Allow explicit None to disable OAuth even if config has values
         if issuer is None and audience is None:
             self.issuer = None
             self.audience = None
             self.enabled = False
             self.jwks_client = None
+            self.async_jwks_client = None
             logger.warning(
                 "oauth_disabled",
                 message="OAuth explicitly disabled (issuer and audience are None)",
@@ -74,11 +215,18 @@ class OAuthValidator:
                 )
                 self.enabled = False
                 self.jwks_client = None
+                self.async_jwks_client = None
             else:
                 self.enabled = True
+                # Interned so PyJWT's issuer/audience equality checks hit the identity fast path
+                self.issuer = sys.intern(self.issuer)
+                self.audience = sys.intern(self.audience)
                 # JWKS client for fetching public keys
                 self.jwks_uri = jwks_uri or f"{self.issuer}/.well-known/jwks.json"
-                self.jwks_client = PyJWKClient(self.jwks_uri)
+                # cache_keys keeps parsed RSAPublicKey objects per kid, so jwt.decode
+                # never re-loads key material on the hot path
+                self.jwks_client = PyJWKClient(self.jwks_uri, cache_keys=True)
+                self.async_jwks_client = AsyncJWKSClient(self.jwks_uri)
                 logger.info(
                     "oauth_configured",
                     issuer=self.issuer,
@@ -90,6 +238,9 @@ class OAuthValidator:
         """
         Validate JWT bearer token.
 
+        Decoded payloads are cached by token hash until the token expires (at most
+        TOKEN_CACHE_TTL_SEC), so repeat tokens skip RSA signature verification.
+
         Args:
             token: JWT token string (without "Bearer " prefix)
 
@@ -101,45 +252,142 @@ class OAuthValidator:
         """
         if not self.enabled:
             # OAuth disabled - return anonymous user
-            logger.debug("oauth_disabled", message="Skipping token validation")
+            if _DEBUG_ENABLED:
+                logger.debug("oauth_disabled", message="Skipping token validation")
             return {"sub": "anonymous", "roles": []}
 
+        key = _token_cache_key(token)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        now = time.time()
+        try:
+            payload = self._decode_token(token)
+        except AuthenticationError as e:
+            self._cache_failure(key, now, e)
+            raise
+
+        return self._cache_payload(key, now, payload)
+
+    async def avalidate_token(self, token: str) -> dict[str, Any]:
+        """
+        Validate JWT bearer token without blocking the event loop.
+
+        JWKS fetches are async and signature verification runs in a worker thread.
+
+        Shares the validated-token cache with validate_token().
+
+        Args:
+            token: JWT token string (without "Bearer " prefix)
+
+        Returns:
+            Decoded JWT payload with claims
+
+        Raises:
+            AuthenticationError: If token invalid, expired, or malformed
+        """
+        if not self.enabled or self.async_jwks_client is None:
+            return self.validate_token(token)
+
+        key = _token_cache_key(token)
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached
+
+        now = time.time()
+        try:
+            try:
+                kid = jwt.get_unverified_header(token).get("kid")
+                signing_key = await self.async_jwks_client.get_signing_key(kid)
+            except AuthenticationError:
+                raise
+            except jwt.InvalidTokenError as e:
+                logger.error("invalid_token", error=str(e), exc_info=True)
+                raise AuthenticationError(f"Invalid token: {str(e)}") from e
+            except Exception as e:
+                logger.error("token_validation_failed", error=str(e), exc_info=True)
+                raise AuthenticationError(f"Token validation failed: {str(e)}") from e
+            # RSA verification is CPU-bound and OpenSSL releases the GIL, so run it in a
+            # worker thread: concurrent verifications spread across cores instead of
+            # serializing on the event loop. Cache hits above never reach this point.
+            payload = await asyncio.to_thread(self._decode_token, token, signing_key)
+        except AuthenticationError as e:
+            self._cache_failure(key, now, e)
+            raise
+
+        return self._cache_payload(key, now, payload)
+
+    def _get_cached(self, key: bytes) -> dict[str, Any] | None:
+        """Return a copy of a cached payload, re-raise a cached failure, or None on miss."""
+        with self._token_cache_lock:
+            cached = self._token_cache.get(key)
+        if cached is None:
+            return None
+        _, cached_payload, cached_error = cached
+        if cached_error is not None:
+            raise AuthenticationError(cached_error)
+        return dict(cached_payload or {})
+
+    def _cache_failure(self, key: bytes, now: float, error: AuthenticationError) -> None:
+        with self._token_cache_lock:
+            self._token_cache[key] = (now + NEGATIVE_TOKEN_CACHE_TTL_SEC, None, str(error))
+
+    def _cache_payload(self, key: bytes, now: float, payload: dict[str, Any]) -> dict[str, Any]:
+        expires_at = now + TOKEN_CACHE_TTL_SEC
+        exp = payload.get("exp")
+        if isinstance(exp, int | float):
+            expires_at = min(float(exp), expires_at)
+        if expires_at <= now:
+            return payload
+
+        with self._token_cache_lock:
+            self._token_cache[key] = (expires_at, payload, None)
+
+        # The cached dict is shared across requests; hand callers their own copy
+        return dict(payload)
+
+    def _decode_token(self, token: str, signing_key: Any = None) -> dict[str, Any]:
+        """
+        Verify a JWT signature and claims against the JWKS (uncached).
+
+        Args:
+            token: JWT token string (without "Bearer " prefix)
+            signing_key: Pre-fetched public key; looked up via the sync JWKS client if None
+
+        Returns:
+            Decoded JWT payload with claims
+
+        Raises:
+            AuthenticationError: If token invalid, expired, or malformed
+        """
         try:
             # Get signing key from JWKS
-            if self.jwks_client is None:
-                raise ValueError("JWKS client not initialized")
-            signing_key = self.jwks_client.get_signing_key_from_jwt(token)
+            if signing_key is None:
+                if self.jwks_client is None:
+                    raise ValueError("JWKS client not initialized")
+                signing_key = self.jwks_client.get_signing_key_from_jwt(token).key
 
             # Decode and validate JWT
-            payload = jwt.decode(
+            payload: dict[str, Any] = jwt.decode(
                 token,
-                signing_key.key,
-                algorithms=["RS256"],  # OAuth 2.1 requires asymmetric signing
+                signing_key,
+                algorithms=_JWT_ALGS,
                 issuer=self.issuer,
                 audience=self.audience,
-                options={
-                    "verify_signature": True,
-                    "verify_exp": True,
-                    "verify_iat": True,
-                    "verify_aud": True,
-                    "verify_iss": True,
-                },
+                options=_JWT_OPTIONS,  # type: ignore[arg-type]
             )
 
-            # Extract user claims
-            user_id = payload.get("sub", "unknown")
-            roles = payload.get("roles", [])
-            scopes = payload.get("scope", "").split()
-
-            logger.info(
-                "token_validated",
-                user_id=user_id,
-                roles=roles,
-                scopes=scopes,
-                expires_at=payload.get("exp"),
-            )
+            if _INFO_ENABLED:
+                logger.info(
+                    "token_validated",
+                    user_id=payload.get("sub", "unknown"),
+                    roles=payload.get("roles", []),
+                    scopes=payload.get("scope", "").split(),
+                    expires_at=payload.get("exp"),
+                )
 
-            return dict(payload)  # Ensure return type is dict[str, Any]
+            return payload
 
         except jwt.ExpiredSignatureError as e:
             logger.warning("token_expired", error=str(e))
@@ -186,7 +434,8 @@ class OAuthValidator:
             # OAuth disabled - allow all
             return True
 
-        roles = token_payload.get("roles", [])
+        # Role lists are a handful of entries; a list scan beats building a set per call
+        roles = _roles_claim(token_payload)
 
         # Admin role bypasses all checks
         if "admin" in roles:
@@ -195,13 +444,14 @@ class OAuthValidator:
         # Check specific role
         has_permission = required_role in roles
 
-        logger.debug(
-            "permission_check",
-            user_id=token_payload.get("sub"),
-            required_role=required_role,
-            user_roles=roles,
-            granted=has_permission,
-        )
+        if _DEBUG_ENABLED:
+            logger.debug(
+                "permission_check",
+                user_id=token_payload.get("sub"),
+                required_role=required_role,
+                user_roles=token_payload.get("roles", []),
+                granted=has_permission,
+            )
 
         return has_permission
 
@@ -255,6 +505,14 @@ def parse_bearer_token(authorization_header: str) -> str:
     if not authorization_header:
         raise AuthenticationError("Missing Authorization header")
 
+    # Fast path: the header is almost always exactly "Bearer <token>"
+    if authorization_header[:7].lower() == "bearer ":
+        token = authorization_header[7:]
+        # isprintable() rejects tabs/newlines; together with the space check, no whitespace
+        if token and " " not in token and token.isprintable():
+            return token
+
+    # Slow path: tolerate surrounding/extra whitespace
     parts = authorization_header.split()
     if len(parts) != 2 or parts[0].lower() != "bearer":
         raise AuthenticationError("Invalid Authorization header. Expected: 'Bearer <token>'")
@@ -295,3 +553,21 @@ def validate_request_token(authorization_header: str) -> dict[str, Any]:
     token = parse_bearer_token(authorization_header)
     validator = get_validator()
     return validator.validate_token(token)
+
+
+async def avalidate_request_token(authorization_header: str) -> dict[str, Any]:
+    """
+    Async variant of validate_request_token() using the non-blocking JWKS client.
+
+    Args:
+        authorization_header: Authorization header from HTTP request
+
+    Returns:
+        Decoded JWT payload
+
+    Raises:
+        AuthenticationError: If token invalid or missing
+    """
+    token = parse_bearer_token(authorization_header)
+    validator = get_validator()
+    return await validator.avalidate_token(token)
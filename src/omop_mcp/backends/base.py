@@ -1,10 +1,125 @@
 """Backend protocol and base classes for database abstraction."""
 
-from dataclasses import dataclass
+import hashlib
+import operator
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any, Protocol
 
+from sqlglot import exp
+
+from omop_mcp.backends.dialect import contains_mutation
 from omop_mcp.models import SQLValidationResult
 
+# Single-pass, case-insensitive scan; word boundaries avoid matching columns like limit_value
+_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+
+def sql_id_list(ids: Sequence[int]) -> str:
+    """
+    Render integer IDs as a comma-separated SQL list body (e.g. ``1,2,3``).
+
+    A single ``%d`` format pass renders every ID in C, without one temporary
+    string per ID. IDs go through ``operator.index`` first, since ``%d`` would
+    silently truncate floats and Decimals; anything that is not an integer
+    raises TypeError.
+    """
+    return ("%d," * len(ids))[:-1] % tuple(map(operator.index, ids))
+
+
+def validation_cache_key(sql: str, params: dict[str, Any] | None = None) -> bytes:
+    """Hash whitespace-normalized SQL plus its bound parameters into a validation cache key."""
+    digest = hashlib.blake2b(" ".join(sql.split()).encode(), digest_size=16)
+    if params:
+        digest.update(repr(sorted(params.items())).encode())
+    return digest.digest()
+
+
+def ensure_safe_and_limited(
+    sql: str,
+    limit: int,
+    dialect: str,
+    *,
+    allowed: tuple[type[exp.Expression], ...] = (),
+    trusted: bool = False,
+) -> str:
+    """
+    Apply the execute_query guards: reject mutating SQL and add a LIMIT if missing.
+
+    Args:
+        sql: SQL query to run
+        limit: Row limit appended when the SQL has no LIMIT
+        dialect: SQL dialect to parse with
+        allowed: Mutation node types the backend permits (e.g. ``(exp.Insert,)``)
+        trusted: SQL built by this package from fixed templates; skips the mutation parse
+
+    Returns:
+        SQL with a LIMIT clause
+
+    Raises:
+        ValueError: If the SQL contains a disallowed mutating statement
+    """
+    if not trusted and contains_mutation(sql, dialect, allowed=allowed):
+        raise ValueError("Mutating queries not allowed")
+
+    if not _LIMIT_RE.search(sql):
+        sql = f"{sql}\nLIMIT {limit}"
+    return sql
+
+
+# Shared cohort SQL skeleton; each backend fills in its dialect's CohortDialect fragments.
+# The index date is each person's first exposure (one aggregate row per person), paired
+# with their earliest outcome inside the window, so no final window/QUALIFY pass is needed.
+_EXPOSURE_CTE_TPL = """WITH exposure AS (
+  SELECT
+    person_id,
+    MIN(drug_exposure_start_date) AS exposure_date
+  FROM {table}
+  WHERE drug_concept_id IN {ids}
+  GROUP BY person_id
+)"""
+
+_OUTCOME_CTE_TPL = """outcome AS (
+  SELECT
+    person_id,
+    condition_start_date AS outcome_date
+  FROM {table}
+  WHERE condition_concept_id IN {ids}
+    -- Outcomes before the earliest exposure can never match; bound the scan early
+    AND condition_start_date >= (SELECT MIN(exposure_date) FROM exposure)
+)"""
+
+# The window bounds outcome_date directly (no function around it) so scans can prune;
+# exposure_date is fixed per person, so the smallest day count belongs to the earliest outcome
+_COHORT_CTE_TPL = """cohort AS (
+  SELECT
+    e.person_id,
+    e.exposure_date,
+    MIN(o.outcome_date) AS outcome_date,
+    MIN({days_to_outcome}) AS days_to_outcome
+  FROM exposure e
+  INNER JOIN outcome o ON e.person_id = o.person_id
+  WHERE e.exposure_date <= o.outcome_date
+    AND o.outcome_date <= {window_end}
+  GROUP BY e.person_id, e.exposure_date
+)"""
+
+_FINAL_SELECT = "SELECT * FROM cohort"
+
+
+@dataclass(frozen=True)
+class CohortDialect:
+    """Dialect-specific SQL fragments substituted into the shared cohort query."""
+
+    # Parenthesized IN-list sources reading the bound exposure_ids / outcome_ids parameters
+    exposure_ids: str
+    outcome_ids: str
+    # Day count from e.exposure_date to o.outcome_date
+    days_to_outcome: str
+    # Latest matching outcome date; formatted with {days}
+    window_end: str
+
 
 @dataclass
 class CohortQueryParts:
@@ -14,12 +129,48 @@ class CohortQueryParts:
     outcome_cte: str
     cohort_cte: str
     final_select: str
+    # Named query parameters referenced by the SQL (e.g. @exposure_ids); empty when inlined
+    params: dict[str, Any] = field(default_factory=dict)
 
     def to_sql(self) -> str:
         """Combine parts into complete SQL."""
         return f"{self.exposure_cte},\n{self.outcome_cte},\n{self.cohort_cte}\n{self.final_select}"
 
 
+def build_cohort_parts(
+    dialect: CohortDialect,
+    exposure_table: str,
+    outcome_table: str,
+    exposure_ids: Sequence[int],
+    outcome_ids: Sequence[int],
+    pre_outcome_days: int,
+) -> CohortQueryParts:
+    """
+    Build cohort SQL from the shared template, binding concept IDs as parameters.
+
+    Args:
+        dialect: Backend's SQL fragments
+        exposure_table: Qualified drug_exposure table name
+        outcome_table: Qualified condition_occurrence table name
+        exposure_ids: Exposure (drug) concept IDs
+        outcome_ids: Outcome (condition) concept IDs
+        pre_outcome_days: Maximum days from exposure to outcome
+
+    Returns:
+        CohortQueryParts with ``exposure_ids`` / ``outcome_ids`` params
+    """
+    window_end = dialect.window_end.format(days=int(pre_outcome_days))
+    return CohortQueryParts(
+        exposure_cte=_EXPOSURE_CTE_TPL.format(table=exposure_table, ids=dialect.exposure_ids),
+        outcome_cte=_OUTCOME_CTE_TPL.format(table=outcome_table, ids=dialect.outcome_ids),
+        cohort_cte=_COHORT_CTE_TPL.format(
+            days_to_outcome=dialect.days_to_outcome, window_end=window_end
+        ),
+        final_select=_FINAL_SELECT,
+        params={"exposure_ids": list(exposure_ids), "outcome_ids": list(outcome_ids)},
+    )
+
+
 class Backend(Protocol):
     """Protocol for database backend implementations."""
 
@@ -36,12 +187,21 @@ class Backend(Protocol):
         """Build cohort SQL query parts."""
         ...
 
-    async def validate_sql(self, sql: str) -> SQLValidationResult:
+    async def validate_sql(
+        self, sql: str, params: dict[str, Any] | None = None
+    ) -> SQLValidationResult:
         """Validate SQL and estimate cost (dry-run)."""
         ...
 
-    async def execute_query(self, sql: str, limit: int = 1000) -> list[dict[str, Any]]:
-        """Execute SQL safely and return results."""
+    async def execute_query(
+        self,
+        sql: str,
+        limit: int = 1000,
+        params: dict[str, Any] | None = None,
+        *,
+        trusted: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Execute SQL safely and return results (``trusted`` skips the mutation check)."""
         ...
 
     def qualified_table(self, table: str) -> str:
@@ -1,19 +1,101 @@
 """BigQuery backend implementation."""
 
+import importlib.util
 import os
 from typing import Any
 
 import structlog
+from cachetools import TTLCache
 from google.api_core.exceptions import GoogleAPIError
 from google.auth import default as google_auth_default
 from google.cloud import bigquery
-
-from omop_mcp.backends.base import Backend, CohortQueryParts
+from sqlglot import exp
+
+from omop_mcp.backends.base import (
+    Backend,
+    CohortDialect,
+    CohortQueryParts,
+    build_cohort_parts,
+    ensure_safe_and_limited,
+    validation_cache_key,
+)
 from omop_mcp.config import config
 from omop_mcp.models import SQLValidationResult
 
 logger = structlog.get_logger()
 
+# Columnar fetch via the BigQuery Storage API when its optional deps are installed
+_ARROW_AVAILABLE = (
+    importlib.util.find_spec("pyarrow") is not None
+    and importlib.util.find_spec("google.cloud.bigquery_storage") is not None
+)
+
+# Dry-run results are reused for a while; table statistics change slowly
+DRY_RUN_CACHE_MAXSIZE = 8192
+DRY_RUN_CACHE_TTL_SEC = 900
+
+# Tables referenced by generated SQL; their qualified names are built once per backend
+_PRECOMPUTED_TABLES = (
+    "person",
+    "drug_exposure",
+    "condition_occurrence",
+    "procedure_occurrence",
+    "measurement",
+    "observation",
+    "visit_occurrence",
+    "death",
+)
+
+# Cohort SQL fragments; concept IDs are bound as array parameters so BigQuery can reuse plans
+_COHORT_DIALECT = CohortDialect(
+    exposure_ids="UNNEST(@exposure_ids)",
+    outcome_ids="UNNEST(@outcome_ids)",
+    days_to_outcome="DATE_DIFF(o.outcome_date, e.exposure_date, DAY)",
+    window_end="DATE_ADD(e.exposure_date, INTERVAL {days} DAY)",
+)
+
+
+def _scalar_type(value: Any) -> str:
+    """BigQuery type name for a scalar parameter value (bool is checked before int)."""
+    if isinstance(value, bool):
+        return "BOOL"
+    if isinstance(value, int):
+        return "INT64"
+    if isinstance(value, float):
+        return "FLOAT64"
+    return "STRING"
+
+
+def _array_type(name: str, values: list[Any]) -> str:
+    """BigQuery element type for an array parameter, taken from its elements."""
+    types = {_scalar_type(v) for v in values}
+    if types == {"INT64", "FLOAT64"}:
+        return "FLOAT64"
+    if len(types) > 1:
+        raise ValueError(f"Array parameter '{name}' mixes element types: {sorted(types)}")
+    # Empty lists carry no element type; the only array parameters built today are ID lists
+    return types.pop() if types else "INT64"
+
+
+def _query_parameters(params: dict[str, Any] | None) -> list[Any]:
+    """Convert named parameters to BigQuery query parameters, typed by their values."""
+    if not params:
+        return []
+    query_params: list[Any] = []
+    for name, value in params.items():
+        if isinstance(value, list | tuple):
+            values = list(value)
+            array_type = _array_type(name, values)
+            if array_type == "STRING":
+                values = [str(v) for v in values]
+            query_params.append(bigquery.ArrayQueryParameter(name, array_type, values))
+        else:
+            scalar_type = _scalar_type(value)
+            if scalar_type == "STRING":
+                value = str(value)
+            query_params.append(bigquery.ScalarQueryParameter(name, scalar_type, value))
+    return query_params
+
 
 class BigQueryBackend(Backend):
     """BigQuery implementation of Backend protocol."""
@@ -26,16 +108,34 @@ class BigQueryBackend(Backend):
         self.project_id = config.bigquery_project_id
         self.dataset_id = config.bigquery_dataset_id
         self.credentials_path = config.bigquery_credentials_path
+        self._client: bigquery.Client | None = None
+        self._client_credentials_mtime: float | None = None
+        self._tables = {table: self._qualify(table) for table in _PRECOMPUTED_TABLES}
+        self._validate_cache: TTLCache[bytes, SQLValidationResult] = TTLCache(
+            maxsize=DRY_RUN_CACHE_MAXSIZE, ttl=DRY_RUN_CACHE_TTL_SEC
+        )
 
         if not self.project_id or not self.dataset_id:
             logger.warning(
                 "bigquery_not_configured", msg="BigQuery project_id or dataset_id not set"
             )
 
+    def _credentials_mtime(self) -> float | None:
+        """Return the service account file's mtime, or None if unset/unreadable."""
+        if not self.credentials_path:
+            return None
+        try:
+            return os.path.getmtime(self.credentials_path)
+        except OSError:
+            return None
+
     def _get_client(self) -> "bigquery.Client":
         """
         Get authenticated BigQuery client using service account or ADC.
 
+        The client is built once and reused; it is rebuilt only if the service
+        account file changes on disk.
+
         Authentication priority:
         1. Service account JSON file (if BIGQUERY_CREDENTIALS_PATH is set and file exists)
         2. Application Default Credentials (ADC) - user credentials, metadata service, etc.
@@ -46,6 +146,16 @@ class BigQueryBackend(Backend):
         Raises:
             ValueError: If authentication fails or project ID is not available
         """
+        credentials_mtime = self._credentials_mtime()
+        if self._client is not None and credentials_mtime == self._client_credentials_mtime:
+            return self._client
+
+        self._client = self._build_client()
+        self._client_credentials_mtime = credentials_mtime
+        return self._client
+
+    def _build_client(self) -> "bigquery.Client":
+        """Construct a new authenticated BigQuery client."""
         if self.credentials_path and os.path.exists(self.credentials_path):
             # Use service account credentials
             logger.info("using_service_account", credentials_path=self.credentials_path)
@@ -80,55 +190,35 @@ class BigQueryBackend(Backend):
         cdm: str = "5.4",
     ) -> CohortQueryParts:
         """Build BigQuery cohort SQL."""
-        exposure_list = ",".join(map(str, exposure_ids))
-        outcome_list = ",".join(map(str, outcome_ids))
-
-        exposure_cte = f"""WITH exposure AS (
-  SELECT DISTINCT
-    person_id,
-    drug_exposure_start_date AS exposure_date
-  FROM {self.qualified_table("drug_exposure")}
-  WHERE drug_concept_id IN ({exposure_list})
-)"""
-
-        outcome_cte = f"""outcome AS (
-  SELECT DISTINCT
-    person_id,
-    condition_start_date AS outcome_date
-  FROM {self.qualified_table("condition_occurrence")}
-  WHERE condition_concept_id IN ({outcome_list})
-)"""
-
-        cohort_cte = f"""cohort AS (
-  SELECT
-    e.person_id,
-    e.exposure_date,
-    o.outcome_date,
-    DATE_DIFF(o.outcome_date, e.exposure_date, DAY) AS days_to_outcome
-  FROM exposure e
-  INNER JOIN outcome o ON e.person_id = o.person_id
-  WHERE e.exposure_date <= o.outcome_date
-    AND DATE_DIFF(o.outcome_date, e.exposure_date, DAY) <= {pre_outcome_days}
-)"""
-
-        final_select = """SELECT * FROM cohort
-QUALIFY ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY exposure_date) = 1"""
-
-        return CohortQueryParts(
-            exposure_cte=exposure_cte,
-            outcome_cte=outcome_cte,
-            cohort_cte=cohort_cte,
-            final_select=final_select,
+        return build_cohort_parts(
+            _COHORT_DIALECT,
+            exposure_table=self._tables["drug_exposure"],
+            outcome_table=self._tables["condition_occurrence"],
+            exposure_ids=exposure_ids,
+            outcome_ids=outcome_ids,
+            pre_outcome_days=pre_outcome_days,
         )
 
-    async def validate_sql(self, sql: str) -> SQLValidationResult:
-        """Validate SQL with BigQuery dry-run."""
+    async def validate_sql(
+        self, sql: str, params: dict[str, Any] | None = None
+    ) -> SQLValidationResult:
+        """Validate SQL with BigQuery dry-run (successful results cached by SQL hash)."""
+        cache_key = validation_cache_key(sql, params)
+        cached = self._validate_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("sql_validation_cache_hit", backend="bigquery")
+            return cached.model_copy()
+
         logger.info("validating_sql", backend="bigquery")
 
         try:
             client = self._get_client()
 
-            job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+            job_config = bigquery.QueryJobConfig(
+                dry_run=True,
+                use_query_cache=False,
+                query_parameters=_query_parameters(params),
+            )
 
             query_job = client.query(sql, job_config=job_config)
 
@@ -141,12 +231,14 @@ QUALIFY ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY exposure_date) = 1"""
                 estimated_cost_usd=estimated_cost_usd,
             )
 
-            return SQLValidationResult(
+            result = SQLValidationResult(
                 valid=True,
                 estimated_bytes=estimated_bytes,
                 estimated_cost_usd=round(estimated_cost_usd, 4),
                 error_message=None,
             )
+            self._validate_cache[cache_key] = result
+            return result.model_copy()
 
         except GoogleAPIError as e:
             logger.error("sql_validation_failed", error=str(e))
@@ -155,27 +247,37 @@ QUALIFY ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY exposure_date) = 1"""
                 valid=False, estimated_bytes=None, estimated_cost_usd=None, error_message=str(e)
             )
 
-    async def execute_query(self, sql: str, limit: int = 1000) -> list[dict[str, Any]]:
+    async def execute_query(
+        self,
+        sql: str,
+        limit: int = 1000,
+        params: dict[str, Any] | None = None,
+        *,
+        trusted: bool = False,
+    ) -> list[dict[str, Any]]:
         """Execute SQL and return results."""
-        # Security: block mutating queries
-        sql_upper = sql.upper()
-        if any(
-            kw in sql_upper for kw in ("DELETE", "UPDATE", "DROP", "TRUNCATE", "ALTER", "MERGE")
-        ):
-            raise ValueError("Mutating queries not allowed")
-
-        # Safety: add LIMIT if not present
-        if "LIMIT" not in sql_upper:
-            sql = f"{sql}\nLIMIT {limit}"
+        # Security: block mutating queries; safety: add LIMIT if not present
+        sql = ensure_safe_and_limited(
+            sql, limit, self.dialect, allowed=(exp.Insert,), trusted=trusted
+        )
 
         logger.info("executing_query", backend="bigquery", limit=limit)
 
         try:
             client = self._get_client()
-            query_job = client.query(sql, timeout=config.query_timeout_sec)
+            job_config = (
+                bigquery.QueryJobConfig(query_parameters=_query_parameters(params))
+                if params
+                else None
+            )
+            query_job = client.query(sql, job_config=job_config, timeout=config.query_timeout_sec)
             results = query_job.result()
 
-            rows = [dict(row) for row in results]
+            if _ARROW_AVAILABLE:
+                # Arrow batches over gRPC; rows are built in C rather than per-row Python
+                rows = results.to_arrow(create_bqstorage_client=True).to_pylist()
+            else:
+                rows = [dict(row) for row in results]
 
             logger.info("query_executed", row_count=len(rows))
 
@@ -187,6 +289,10 @@ QUALIFY ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY exposure_date) = 1"""
 
     def qualified_table(self, table: str) -> str:
         """Return BigQuery-style fully qualified table name."""
+        qualified = self._tables.get(table)
+        return qualified if qualified is not None else self._qualify(table)
+
+    def _qualify(self, table: str) -> str:
         return f"`{self.project_id}.{self.dataset_id}.{table}`"
 
     def age_calculation_sql(self, birth_col: str = "birth_datetime") -> str:
@@ -5,10 +5,13 @@ This module provides utilities to translate SQL between different dialects
 """
 
 import logging
+import re
+import sys
+from functools import lru_cache
 from typing import Any
 
-from sqlglot import exp, optimizer, parse_one
-from sqlglot.errors import ParseError
+from sqlglot import exp, optimizer, parse, parse_one
+from sqlglot.errors import ParseError, SqlglotError
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,36 @@ SUPPORTED_DIALECTS = {
     "trino": "trino",
     "presto": "presto",
 }
+# Interned lookup table: already-lowercase names (the common case) hit without allocating
+_CANON = {sys.intern(alias): sys.intern(name) for alias, name in SUPPORTED_DIALECTS.items()}
+
+
+def _canonical_dialect(dialect: str) -> str | None:
+    """Return the canonical dialect name for a dialect or alias, or None if unsupported."""
+    name = _CANON.get(dialect)
+    if name is None:
+        name = _CANON.get(dialect.lower())
+    return name
+
+
+# Statement types accepted by _validate_parsed_sql (tuple: faster isinstance than a union)
+_ALLOWED_STMT_TYPES = (exp.Select, exp.Insert, exp.Update, exp.Delete, exp.Create)
+
+# Node types that write to or restructure the database, with their leading keyword
+_MUTATION_KEYWORDS: dict[type[exp.Expression], str] = {
+    exp.Delete: "DELETE",
+    exp.Update: "UPDATE",
+    exp.Drop: "DROP",
+    exp.Alter: "ALTER",
+    exp.TruncateTable: "TRUNCATE",
+    exp.Insert: "INSERT",
+    exp.Merge: "MERGE",
+}
+_MUTATION_TYPES = tuple(_MUTATION_KEYWORDS)
+# Keyword fallback for SQL that SQLGlot cannot parse into a typed AST
+_MUTATION_KEYWORD_RE = re.compile(
+    r"\b(?:" + "|".join(_MUTATION_KEYWORDS.values()) + r")\b", re.IGNORECASE
+)
 
 
 class SQLDialectError(Exception):
@@ -34,6 +67,72 @@ class SQLDialectError(Exception):
     pass
 
 
+@lru_cache(maxsize=512)
+def _parse_cached(sql: str, dialect: str) -> exp.Expression:
+    """
+    Parse SQL once per (sql, dialect) pair.
+
+    The returned AST is shared between callers: treat it as read-only and
+    ``.copy()`` it before applying any transformation that mutates the tree.
+    """
+    return parse_one(sql, read=dialect)
+
+
+@lru_cache(maxsize=512)
+def _parse_statements_cached(sql: str, dialect: str) -> tuple[exp.Expression, ...]:
+    """Parse every statement of a (possibly multi-statement) script once per pair."""
+    return tuple(statement for statement in parse(sql, read=dialect) if statement is not None)
+
+
+@lru_cache(maxsize=512)
+def _tables_cached(sql: str, dialect: str) -> tuple[str, ...]:
+    """Extract table references from SQL, cached per (sql, dialect) pair."""
+    parsed = _parse_cached(sql, dialect)
+    # Join identifier parts directly instead of re-rendering each node with .sql()
+    return tuple(
+        ".".join(part for part in (table.catalog, table.db, table.name) if part)
+        for table in parsed.find_all(exp.Table)
+    )
+
+
+def contains_mutation(
+    sql: str,
+    dialect: str,
+    allowed: tuple[type[exp.Expression], ...] = (),
+) -> bool:
+    """
+    Check whether SQL contains a data- or schema-modifying statement.
+
+    Inspects the (cached) SQLGlot AST of every statement, so identifiers and string
+    literals such as ``dropped_at`` or ``'delete'`` never trigger a false positive.
+    SQL that does not tokenize or parse, or parses only as an opaque command, falls
+    back to a keyword scan.
+
+    Args:
+        sql: SQL query to check
+        dialect: SQL dialect to parse with
+        allowed: Mutation node types to permit (e.g. ``(exp.Insert,)``)
+
+    Returns:
+        True if a disallowed mutating statement is present
+    """
+    dialect_name = _canonical_dialect(dialect) or dialect
+    try:
+        statements = _parse_statements_cached(sql, dialect_name)
+    except SqlglotError:
+        statements = ()
+
+    if not statements or any(s.find(exp.Command) is not None for s in statements):
+        blocked = {kw for node, kw in _MUTATION_KEYWORDS.items() if not issubclass(node, allowed)}
+        return any(m.group(0).upper() in blocked for m in _MUTATION_KEYWORD_RE.finditer(sql))
+
+    return any(
+        not isinstance(node, allowed)
+        for statement in statements
+        for node in statement.find_all(*_MUTATION_TYPES)
+    )
+
+
 def translate_sql(
     sql: str,
     source_dialect: str,
@@ -62,8 +161,8 @@ def translate_sql(
         'SELECT DATE_TRUNC(\\'DAY\\', created_at) FROM users'
     """
     # Normalize dialect names
-    source = SUPPORTED_DIALECTS.get(source_dialect.lower())
-    target = SUPPORTED_DIALECTS.get(target_dialect.lower())
+    source = _canonical_dialect(source_dialect)
+    target = _canonical_dialect(target_dialect)
 
     if not source:
         raise ValueError(f"Unsupported source dialect: {source_dialect}")
@@ -74,11 +173,17 @@ def translate_sql(
     if source == target:
         return sql
 
+    return _translate_cached(sql, source, target, validate)
+
+
+@lru_cache(maxsize=512)
+def _translate_cached(sql: str, source: str, target: str, validate: bool) -> str:
+    """Translate SQL between canonical dialects, cached per (sql, source, target) triple."""
     logger.info(f"Translating SQL from {source} to {target}")
 
     try:
         # Parse SQL in source dialect
-        parsed = parse_one(sql, read=source)
+        parsed = _parse_cached(sql, source)
 
         # Validate if requested
         if validate:
@@ -98,13 +203,15 @@ def translate_sql(
         raise SQLDialectError(f"Translation failed: {e}") from e
 
 
-def validate_sql(sql: str, dialect: str) -> tuple[bool, str | None]:
+def validate_sql(sql: str, dialect: str, fast_path: bool = False) -> tuple[bool, str | None]:
     """
     Validate SQL syntax for a specific dialect.
 
     Args:
         sql: SQL query to validate
         dialect: SQL dialect to validate against
+        fast_path: Only check that the SQL parses, skipping the statement-type
+            check (for SQL built internally, e.g. by the cohort builder)
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -115,13 +222,14 @@ def validate_sql(sql: str, dialect: str) -> tuple[bool, str | None]:
         >>> validate_sql("SELECT FROM", "postgres")
         (False, "Expecting column or * in SELECT...")
     """
-    dialect_name = SUPPORTED_DIALECTS.get(dialect.lower())
+    dialect_name = _canonical_dialect(dialect)
     if not dialect_name:
         return False, f"Unsupported dialect: {dialect}"
 
     try:
-        parsed = parse_one(sql, read=dialect_name)
-        _validate_parsed_sql(parsed, dialect_name)
+        parsed = _parse_cached(sql, dialect_name)
+        if not fast_path:
+            _validate_parsed_sql(parsed, dialect_name)
         return True, None
     except ParseError as e:
         return False, str(e)
@@ -136,7 +244,7 @@ def _validate_parsed_sql(parsed: exp.Expression, dialect: str) -> None:
         raise SQLDialectError("Empty SQL expression")
 
     # Ensure it's a valid statement
-    if not isinstance(parsed, exp.Select | exp.Insert | exp.Update | exp.Delete | exp.Create):
+    if not isinstance(parsed, _ALLOWED_STMT_TYPES):
         raise SQLDialectError(f"Unsupported SQL statement type: {type(parsed).__name__}")
 
 
@@ -156,10 +264,10 @@ def format_sql(sql: str, dialect: str = "bigquery", pretty: bool = True) -> str:
         >>> format_sql("select a,b,c from t where x=1")
         'SELECT\\n  a,\\n  b,\\n  c\\nFROM t\\nWHERE\\n  x = 1'
     """
-    dialect_name = SUPPORTED_DIALECTS.get(dialect.lower(), "bigquery")
+    dialect_name = _canonical_dialect(dialect) or "bigquery"
 
     try:
-        parsed = parse_one(sql, read=dialect_name)
+        parsed = _parse_cached(sql, dialect_name)
         formatted: str = parsed.sql(dialect=dialect_name, pretty=pretty)
         return formatted
     except Exception as e:
@@ -182,18 +290,10 @@ def get_sql_tables(sql: str, dialect: str = "bigquery") -> list[str]:
         >>> get_sql_tables("SELECT * FROM dataset.table1 JOIN dataset.table2")
         ['dataset.table1', 'dataset.table2']
     """
-    dialect_name = SUPPORTED_DIALECTS.get(dialect.lower(), "bigquery")
+    dialect_name = _canonical_dialect(dialect) or "bigquery"
 
     try:
-        parsed = parse_one(sql, read=dialect_name)
-        tables = []
-
-        # Find all table references
-        for table in parsed.find_all(exp.Table):
-            table_name = table.sql(dialect=dialect_name)
-            tables.append(table_name)
-
-        return tables
+        return list(_tables_cached(sql, dialect_name))
     except Exception as e:
         logger.warning(f"Failed to extract tables: {e}")
         return []
@@ -216,10 +316,11 @@ def optimize_sql(sql: str, dialect: str = "bigquery") -> str:
         - Simplifying expressions
         - Normalizing syntax
     """
-    dialect_name = SUPPORTED_DIALECTS.get(dialect.lower(), "bigquery")
+    dialect_name = _canonical_dialect(dialect) or "bigquery"
 
     try:
-        parsed = parse_one(sql, read=dialect_name)
+        # Copy the cached AST: simplify rewrites the tree in place
+        parsed = _parse_cached(sql, dialect_name).copy()
 
         # Apply optimizations using simplify
         optimized = optimizer.simplify.simplify(parsed)
@@ -2,18 +2,46 @@
 
 from __future__ import annotations  # type: ignore[annotation-unchecked]
 
+import asyncio
+import importlib.util
 import logging
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any
 
-import duckdb
+from sqlglot import exp
 
-from omop_mcp.backends.base import Backend, CohortQueryParts
+from omop_mcp.backends.base import (
+    Backend,
+    CohortDialect,
+    CohortQueryParts,
+    build_cohort_parts,
+    ensure_safe_and_limited,
+)
 from omop_mcp.backends.dialect import translate_sql
 from omop_mcp.config import config
 from omop_mcp.models import SQLValidationResult
 
 logger = logging.getLogger(__name__)
 
+# Columnar result fetch when pyarrow is installed (rows are then built in C)
+_ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Rows pulled per batch; keeps the working set bounded for oversized result sets
+_FETCH_BATCH_ROWS = 4096
+
+
+# Cohort SQL fragments; concept IDs are bound as typed list parameters
+_COHORT_DIALECT = CohortDialect(
+    exposure_ids="(SELECT unnest($exposure_ids::BIGINT[]))",
+    outcome_ids="(SELECT unnest($outcome_ids::BIGINT[]))",
+    days_to_outcome="date_diff('day', e.exposure_date, o.outcome_date)",
+    window_end="e.exposure_date + INTERVAL '{days}' DAY",
+)
+
 
 class DuckDBBackend(Backend):
     """DuckDB implementation of Backend protocol."""
@@ -23,23 +51,106 @@ class DuckDBBackend(Backend):
 
     def __init__(self):
         """Initialize DuckDB backend."""
+        # Deferred import keeps server start-up cheap when DuckDB is never used
+        import duckdb
+
+        self._duckdb = duckdb
+        # Errors raised while parsing, binding or planning, i.e. the ones EXPLAIN would report
+        self._planning_errors = (
+            duckdb.ParserException,
+            duckdb.BinderException,
+            duckdb.CatalogException,
+        )
         self.database_path = config.duckdb_database_path
         self.schema = config.duckdb_schema
+        # In-memory databases cannot be opened read-only (nor shared between processes)
+        self.read_only = config.duckdb_read_only and self.database_path != ":memory:"
         self._conn: Any = None
+        # Idle per-query cursors on the shared database, handed out to worker threads
+        self._cursors: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._cursor_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        # Qualified names for the OMOP tables, rebuilt if the schema is reassigned
+        self._tables: dict[str, str] = {}
+        self._tables_schema: str | None = None
+        self._age_sql: dict[str, str] = {}
 
-        logger.info(f"DuckDB backend initialized (database={self.database_path})")
+        logger.info(
+            f"DuckDB backend initialized (database={self.database_path}, "
+            f"read_only={self.read_only})"
+        )
 
     def _get_connection(self) -> Any:
         """Get or create DuckDB connection."""  # type: ignore[misc]
         if self._conn is None:
-            self._conn = duckdb.connect(self.database_path)
+            self._conn = self._duckdb.connect(self.database_path, read_only=self.read_only)
             # Set schema if not default
             if self.schema != "main":
-                self._conn.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema}")
+                if not self.read_only:
+                    self._conn.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema}")
                 self._conn.execute(f"SET schema = {self.schema}")
 
         return self._conn
 
+    def _acquire_cursor(self) -> Any:
+        """Take an idle cursor from the pool, or open a new one on the shared database."""
+        try:
+            return self._cursors.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._cursor_lock:
+            cursor = self._get_connection().cursor()
+        if self.schema != "main":
+            # Settings are per-connection, so each cursor needs the schema
+            cursor.execute(f"SET schema = {self.schema}")
+        return cursor
+
+    def _release_cursor(self, cursor: Any) -> None:
+        """Return a cursor to the idle pool."""
+        self._cursors.put(cursor)
+
+    def _fetch(
+        self, sql: str, params: dict[str, Any] | None, max_rows: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Run a query on a pooled cursor (blocking; called from worker threads).
+
+        Results are streamed in batches and reading stops once ``max_rows`` rows are held.
+        """
+        cursor = self._acquire_cursor()
+        try:
+            result = cursor.execute(sql, params)
+            rows: list[dict[str, Any]] = []
+            if _ARROW_AVAILABLE:
+                for batch in result.fetch_record_batch(_FETCH_BATCH_ROWS):
+                    rows.extend(batch.to_pylist())
+                    if max_rows is not None and len(rows) >= max_rows:
+                        break
+            else:
+                columns = [desc[0] for desc in result.description] if result.description else []
+                while batch := result.fetchmany(_FETCH_BATCH_ROWS):
+                    rows.extend(dict(zip(columns, row, strict=False)) for row in batch)
+                    if max_rows is not None and len(rows) >= max_rows:
+                        break
+        except Exception:
+            cursor.close()
+            raise
+        self._release_cursor(cursor)
+        return rows if max_rows is None else rows[:max_rows]
+
+    async def _run_in_pool(
+        self, sql: str, params: dict[str, Any] | None, max_rows: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Run a query off the event loop so independent queries execute in parallel."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 4, thread_name_prefix="duckdb"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(self._fetch, sql, params, max_rows)
+        )
+
     async def build_cohort_sql(
         self,
         exposure_ids: list[int],
@@ -47,82 +158,46 @@ class DuckDBBackend(Backend):
         pre_outcome_days: int,
         cdm: str = "5.4",
     ) -> CohortQueryParts:
-        """Build DuckDB cohort SQL."""
-        exposure_list = ",".join(map(str, exposure_ids))
-        outcome_list = ",".join(map(str, outcome_ids))
-
-        exposure_cte = f"""WITH exposure AS (
-  SELECT DISTINCT
-    person_id,
-    drug_exposure_start_date AS exposure_date
-  FROM {self.qualified_table("drug_exposure")}
-  WHERE drug_concept_id IN ({exposure_list})
-)"""
-
-        outcome_cte = f"""outcome AS (
-  SELECT DISTINCT
-    person_id,
-    condition_start_date AS outcome_date
-  FROM {self.qualified_table("condition_occurrence")}
-  WHERE condition_concept_id IN ({outcome_list})
-)"""
-
-        # DuckDB uses date_diff() function
-        cohort_cte = f"""cohort AS (
-  SELECT
-    e.person_id,
-    e.exposure_date,
-    o.outcome_date,
-    date_diff('day', e.exposure_date, o.outcome_date) AS days_to_outcome
-  FROM exposure e
-  INNER JOIN outcome o ON e.person_id = o.person_id
-  WHERE e.exposure_date <= o.outcome_date
-    AND date_diff('day', e.exposure_date, o.outcome_date) <= {pre_outcome_days}
-)"""
-
-        # DuckDB supports QUALIFY like BigQuery/Snowflake
-        final_select = """SELECT * FROM cohort
-QUALIFY ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY exposure_date) = 1"""
-
-        return CohortQueryParts(
-            exposure_cte=exposure_cte,
-            outcome_cte=outcome_cte,
-            cohort_cte=cohort_cte,
-            final_select=final_select,
+        """Build DuckDB cohort SQL (concept IDs bound as $exposure_ids / $outcome_ids)."""
+        return build_cohort_parts(
+            _COHORT_DIALECT,
+            exposure_table=self.qualified_table("drug_exposure"),
+            outcome_table=self.qualified_table("condition_occurrence"),
+            exposure_ids=exposure_ids,
+            outcome_ids=outcome_ids,
+            pre_outcome_days=pre_outcome_days,
         )
 
-    async def validate_sql(self, sql: str) -> SQLValidationResult:
+    async def validate_sql(
+        self, sql: str, params: dict[str, Any] | None = None
+    ) -> SQLValidationResult:
         """Validate SQL query using DuckDB's EXPLAIN."""
         try:
-            with self._get_connection() as conn:
-                # Use EXPLAIN to validate without executing
-                _ = conn.execute(f"EXPLAIN {sql}").fetchall()  # Consume result
-                return SQLValidationResult(valid=True, estimated_cost_usd=0.0)
+            # Use EXPLAIN to validate without executing
+            await self._run_in_pool(f"EXPLAIN {sql}", params)
+            return SQLValidationResult(valid=True, estimated_cost_usd=0.0)
         except Exception as e:
             return SQLValidationResult(valid=False, error_message=str(e))
 
-    async def execute_query(self, sql: str, limit: int = 1000) -> list[dict[str, Any]]:
+    async def execute_query(
+        self,
+        sql: str,
+        limit: int = 1000,
+        params: dict[str, Any] | None = None,
+        *,
+        trusted: bool = False,
+    ) -> list[dict[str, Any]]:
         """Execute SQL and return results."""
-        # Security: block mutating queries (except CREATE for setup)
-        sql_upper = sql.upper()
-        dangerous_keywords = ["DELETE", "UPDATE", "DROP", "TRUNCATE", "ALTER"]
-        if any(kw in sql_upper for kw in dangerous_keywords):
-            # Allow CREATE for table setup
-            if "CREATE" not in sql_upper:
-                raise ValueError("Mutating queries not allowed")
-
-        # Safety: add LIMIT if not present
-        if "LIMIT" not in sql_upper:
-            sql = f"{sql}\nLIMIT {limit}"
+        # Security: block mutating queries (CREATE/INSERT stay allowed for table setup,
+        # unless the database is read-only); safety: add LIMIT if not present
+        allowed = () if self.read_only else (exp.Insert,)
+        sql = ensure_safe_and_limited(sql, limit, self.dialect, allowed=allowed, trusted=trusted)
 
         logger.info(f"Executing query on DuckDB (limit={limit})")
 
         try:
-            conn = self._get_connection()
-
-            result = conn.execute(sql)
-            columns = [desc[0] for desc in result.description]
-            rows = [dict(zip(columns, row, strict=False)) for row in result.fetchall()]
+            # Cap the rows read even when the SQL carries its own, larger LIMIT
+            rows = await self._run_in_pool(sql, params, max_rows=limit)
 
             logger.info(f"Query executed successfully, returned {len(rows)} rows")
 
@@ -132,22 +207,62 @@ QUALIFY ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY exposure_date) = 1"""
             logger.error(f"Query execution failed on DuckDB: {e}")
             raise
 
+    async def validate_and_execute(
+        self,
+        sql: str,
+        limit: int = 1000,
+        params: dict[str, Any] | None = None,
+        *,
+        trusted: bool = False,
+    ) -> tuple[SQLValidationResult, list[dict[str, Any]] | None]:
+        """Validate and execute SQL in one pass, without a separate EXPLAIN.
+
+        DuckDB parses, binds and plans the statement once as part of execution, so
+        errors from those phases are returned as an invalid result (with no rows)
+        rather than raised. Queries are free, so there is no cost to check first.
+        """
+        try:
+            rows = await self.execute_query(sql, limit, params, trusted=trusted)
+        except self._planning_errors as e:
+            return SQLValidationResult(valid=False, error_message=str(e)), None
+        return SQLValidationResult(valid=True, estimated_cost_usd=0.0), rows
+
     def qualified_table(self, table: str) -> str:
         """Return DuckDB-style qualified table name."""
+        if self._tables_schema != self.schema:
+            self._tables = {t: self._qualify(t) for t in config.omop_allowed_tables}
+            self._tables_schema = self.schema
+        qualified = self._tables.get(table)
+        return qualified if qualified is not None else self._qualify(table)
+
+    def _qualify(self, table: str) -> str:
         if self.schema == "main":
             return table
         return f"{self.schema}.{table}"
 
     def age_calculation_sql(self, birth_col: str = "birth_datetime") -> str:
         """Return DuckDB-specific age calculation."""
-        return f"date_diff('year', {birth_col}, current_date)"
+        age_sql = self._age_sql.get(birth_col)
+        if age_sql is None:
+            age_sql = self._age_sql[birth_col] = f"date_diff('year', {birth_col}, current_date)"
+        return age_sql
 
     def translate_from_bigquery(self, sql: str) -> str:
         """Translate BigQuery SQL to DuckDB SQL."""
         return translate_sql(sql, source_dialect="bigquery", target_dialect="duckdb")
 
     def close(self) -> None:
-        """Close DuckDB connection."""
+        """Close DuckDB connection, pooled cursors and worker threads."""
+        while True:
+            try:
+                self._cursors.get_nowait().close()
+            except queue.Empty:
+                break
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
         if self._conn is not None:
             self._conn.close()
             self._conn = None
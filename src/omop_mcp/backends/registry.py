@@ -1,6 +1,8 @@
 """Backend registry for managing database backends."""
 
 import logging
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from omop_mcp.backends.base import Backend
@@ -11,9 +13,24 @@ from omop_mcp.backends.snowflake import SnowflakeBackend
 
 logger = logging.getLogger(__name__)
 
-# Backend registry
+# Backend registry: factories are cheap to hold; instances are created on first use
+_factories: dict[str, Callable[[], Backend]] = {
+    "bigquery": BigQueryBackend,
+    "snowflake": SnowflakeBackend,
+    "duckdb": DuckDBBackend,
+}
 _backends: dict[str, Backend] = {}
 
+# Immutable, shared feature map (built once rather than on every list_backends() call)
+_BACKEND_FEATURES: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "bigquery": ("dry_run", "cost_estimate", "execute", "validate", "translate"),
+        "snowflake": ("explain", "execute", "validate", "translate"),
+        "duckdb": ("explain", "execute", "validate", "validate_execute", "translate", "local"),
+    }
+)
+_DEFAULT_FEATURES: tuple[str, ...] = ("execute",)
+
 
 def register_backend(backend: Backend) -> None:
     """Register a backend."""
@@ -21,31 +38,64 @@ def register_backend(backend: Backend) -> None:
     logger.info(f"Backend registered: {backend.name} (dialect={backend.dialect})")
 
 
+def register_backend_factory(name: str, factory: Callable[[], Backend]) -> None:
+    """Register a backend factory, instantiated on the first get_backend() call."""
+    _factories[name] = factory
+    _backends.pop(name, None)
+
+
 def get_backend(name: str) -> Backend:
-    """Get a backend by name."""
-    if name not in _backends:
-        raise ValueError(f"Backend '{name}' not found. Available: {list(_backends.keys())}")
-    return _backends[name]
+    """Get a backend by name, creating it on first use."""
+    backend = _backends.get(name)
+    if backend is not None:
+        return backend
+
+    factory = _factories.get(name)
+    if factory is None:
+        available = sorted(_backends.keys() | _factories.keys())
+        raise ValueError(f"Backend '{name}' not found. Available: {available}")
+
+    try:
+        backend = factory()
+    except Exception as e:
+        logger.warning(f"{name} backend init failed: {e}")
+        raise ValueError(f"Backend '{name}' is unavailable: {e}") from e
+
+    # setdefault keeps the first instance if two callers race on initialization
+    backend = _backends.setdefault(name, backend)
+    logger.info(f"Backend initialized: {backend.name} (dialect={backend.dialect})")
+    return backend
+
+
+def _backend_dialect(name: str) -> str:
+    """Return a backend's dialect, without instantiating it when possible."""
+    backend = _backends.get(name)
+    if backend is not None:
+        return backend.dialect
+    dialect = getattr(_factories.get(name), "dialect", None)
+    if isinstance(dialect, str):
+        return dialect
+    return get_backend(name).dialect
 
 
 def list_backends() -> dict[str, dict[str, Any]]:
     """List all registered backends with their capabilities."""
-    backend_features = {
-        "bigquery": ["dry_run", "cost_estimate", "execute", "validate", "translate"],
-        "snowflake": ["explain", "execute", "validate", "translate"],
-        "duckdb": ["explain", "execute", "validate", "translate", "local"],
-    }
-
+    names = dict.fromkeys([*_factories, *_backends])
     return {
         name: {
-            "name": backend.name,
-            "dialect": backend.dialect,
-            "features": backend_features.get(name, ["execute"]),
+            "name": name,
+            "dialect": _backend_dialect(name),
+            "features": _BACKEND_FEATURES.get(name, _DEFAULT_FEATURES),
         }
-        for name, backend in _backends.items()
+        for name in names
     }
 
 
+def backend_supports(name: str, feature: str) -> bool:
+    """Check whether a backend advertises a feature (without instantiating it)."""
+    return feature in _BACKEND_FEATURES.get(name, _DEFAULT_FEATURES)
+
+
 def get_supported_dialects() -> dict[str, Any]:
     """Get list of supported SQL dialects for translation."""
     return get_dialect_info()
@@ -70,37 +120,8 @@ def translate_query(
     Raises:
         ValueError: If backend not found
     """
-    source = get_backend(source_backend)
-    target = get_backend(target_backend)
-
-    return translate_sql(sql, source.dialect, target.dialect)
-
-
-# Initialize default backends
-def initialize_backends() -> None:
-    """Initialize and register default backends."""
-    # BigQuery
-    try:
-        bigquery_backend = BigQueryBackend()
-        register_backend(bigquery_backend)
-    except Exception as e:
-        logger.warning(f"BigQuery backend init failed: {e}")
-
-    # Snowflake
-    try:
-        snowflake_backend = SnowflakeBackend()
-        register_backend(snowflake_backend)
-    except Exception as e:
-        logger.warning(f"Snowflake backend init failed: {e}")
-
-    # DuckDB (always available - embedded)
-    try:
-        duckdb_backend = DuckDBBackend()
-        register_backend(duckdb_backend)
-        logger.info("DuckDB backend always available (embedded)")
-    except Exception as e:
-        logger.error(f"DuckDB backend init failed: {e}")
-
+    for name in (source_backend, target_backend):
+        if name not in _backends and name not in _factories:
+            get_backend(name)  # raises ValueError naming the available backends
 
-# Auto-initialize on module import
-initialize_backends()
+    return translate_sql(sql, _backend_dialect(source_backend), _backend_dialect(target_backend))
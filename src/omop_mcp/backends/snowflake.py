@@ -2,19 +2,71 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
-from typing import Any
+import queue
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-import snowflake.connector
-from snowflake.connector.errors import DatabaseError, ProgrammingError
+from cachetools import TTLCache
 
-from omop_mcp.backends.base import Backend, CohortQueryParts
+from omop_mcp.backends.base import (
+    Backend,
+    CohortDialect,
+    CohortQueryParts,
+    build_cohort_parts,
+    ensure_safe_and_limited,
+    sql_id_list,
+    validation_cache_key,
+)
 from omop_mcp.backends.dialect import translate_sql
 from omop_mcp.config import config
 from omop_mcp.models import SQLValidationResult
 
+if TYPE_CHECKING:
+    import snowflake.connector
+    from snowflake.connector.cursor import SnowflakeCursor
+
 logger = logging.getLogger(__name__)
 
+# Columnar result fetch when pyarrow is installed (rows are then built in C)
+_ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Backoff bounds (seconds) when polling the status of an asynchronously submitted query
+_POLL_INITIAL_S = 0.05
+_POLL_MAX_S = 1.0
+
+# Successful EXPLAIN validations are reused; each one is a warehouse round trip
+EXPLAIN_CACHE_MAXSIZE = 4096
+EXPLAIN_CACHE_TTL_SEC = 3600
+
+
+# Cohort SQL fragments; concept IDs are bound as JSON array strings expanded by FLATTEN
+_COHORT_DIALECT = CohortDialect(
+    exposure_ids="""(
+    SELECT value::NUMBER FROM TABLE(FLATTEN(input => PARSE_JSON(%(exposure_ids)s)))
+  )""",
+    outcome_ids="""(
+    SELECT value::NUMBER FROM TABLE(FLATTEN(input => PARSE_JSON(%(outcome_ids)s)))
+  )""",
+    days_to_outcome="DATEDIFF(DAY, e.exposure_date, o.outcome_date)",
+    window_end="DATEADD(DAY, {days}, e.exposure_date)",
+)
+
+
+def _bind_parameters(params: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Encode list parameters as one JSON array string (expanded server-side by FLATTEN)."""
+    if not params:
+        return params
+    return {
+        name: f"[{sql_id_list(value)}]" if isinstance(value, list | tuple) else value
+        for name, value in params.items()
+    }
+
 
 class SnowflakeBackend(Backend):
     """Snowflake implementation of Backend protocol."""
@@ -24,27 +76,122 @@ class SnowflakeBackend(Backend):
 
     def __init__(self):
         """Initialize Snowflake backend."""
+        # Deferred import: the connector (an optional extra) is slow to import
+        import snowflake.connector
+
+        self._connector = snowflake.connector
         self.account = config.snowflake_account
         self.user = config.snowflake_user
         self.password = config.snowflake_password
         self.database = config.snowflake_database
         self.schema = config.snowflake_schema
         self.warehouse = config.snowflake_warehouse
+        self.pool_size = config.snowflake_pool_size
+        # Idle authenticated connections, reused across queries
+        self._pool: queue.SimpleQueue[snowflake.connector.SnowflakeConnection] = queue.SimpleQueue()
+        self._executor: ThreadPoolExecutor | None = None
+        # Qualified names for the OMOP tables, rebuilt if database/schema are reassigned
+        self._tables: dict[str, str] = {}
+        self._tables_scope: tuple[str | None, str | None] | None = None
+        self._age_sql: dict[str, str] = {}
+        # Keyed on (database, schema, SQL hash): unqualified names resolve against the scope
+        self._validate_cache: TTLCache[tuple[str | None, str | None, bytes], bool] = TTLCache(
+            maxsize=EXPLAIN_CACHE_MAXSIZE, ttl=EXPLAIN_CACHE_TTL_SEC
+        )
 
         if not all([self.account, self.user, self.database, self.schema]):
             logger.warning("Snowflake not fully configured - some parameters missing")
 
     def _get_connection(self) -> snowflake.connector.SnowflakeConnection:
         """Create Snowflake connection."""
-        return snowflake.connector.connect(
+        return self._connector.connect(
             account=self.account,
             user=self.user,
             password=self.password,
             database=self.database,
             schema=self.schema,
             warehouse=self.warehouse,
+            client_session_keep_alive=True,
         )
 
+    @asynccontextmanager
+    async def _acquire(self) -> AsyncIterator[snowflake.connector.SnowflakeConnection]:
+        """Borrow a pooled connection, opening a new one if none are idle."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = await self._run(self._get_connection)
+
+        try:
+            yield conn
+        except self._connector.errors.ProgrammingError:
+            # SQL errors leave the session usable
+            self._release(conn)
+            raise
+        except BaseException:
+            # Includes cancellation: closing the session aborts any query still running
+            conn.close()
+            raise
+        else:
+            self._release(conn)
+
+    def _release(self, conn: snowflake.connector.SnowflakeConnection) -> None:
+        """Return a connection to the pool, closing it if the pool is full or it died."""
+        if conn.is_closed() or self._pool.qsize() >= self.pool_size:
+            conn.close()
+        else:
+            self._pool.put(conn)
+
+    async def _run(self, func: Any, *args: Any) -> Any:
+        """Run a blocking call in the backend's worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.pool_size, thread_name_prefix="snowflake"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def _execute(
+        self,
+        conn: snowflake.connector.SnowflakeConnection,
+        cursor: SnowflakeCursor,
+        sql: str,
+        params: dict[str, Any] | None,
+    ) -> None:
+        """Submit a query asynchronously and await completion without holding a worker thread."""
+        await self._run(cursor.execute_async, sql, _bind_parameters(params))
+        query_id = cursor.sfqid
+
+        delay = _POLL_INITIAL_S
+        # Raises ProgrammingError as soon as Snowflake reports the query failed
+        while conn.is_still_running(
+            await self._run(conn.get_query_status_throw_if_error, query_id)
+        ):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX_S)
+
+        await self._run(cursor.get_results_from_sfqid, query_id)
+
+    def _rows(self, cursor: SnowflakeCursor) -> list[dict[str, Any]]:
+        """Read a finished query's results (blocking; called from worker threads)."""
+        if _ARROW_AVAILABLE:
+            # fetch_arrow_all() returns None for an empty result set
+            arrow_table = cursor.fetch_arrow_all()
+            return arrow_table.to_pylist() if arrow_table is not None else []
+        columns = [desc[0] for desc in cursor.description]
+        return [dict(zip(columns, row, strict=False)) for row in cursor.fetchall()]
+
+    async def _query(self, sql: str, params: dict[str, Any] | None) -> list[dict[str, Any]]:
+        """Run a query on a pooled connection and return its rows."""
+        async with self._acquire() as conn:
+            cursor = conn.cursor()
+            try:
+                await self._execute(conn, cursor, sql, params)
+                rows: list[dict[str, Any]] = await self._run(self._rows, cursor)
+                return rows
+            finally:
+                cursor.close()
+
     async def build_cohort_sql(
         self,
         exposure_ids: list[int],
@@ -52,94 +199,54 @@ class SnowflakeBackend(Backend):
         pre_outcome_days: int,
         cdm: str = "5.4",
     ) -> CohortQueryParts:
-        """Build Snowflake cohort SQL."""
-        exposure_list = ",".join(map(str, exposure_ids))
-        outcome_list = ",".join(map(str, outcome_ids))
-
-        exposure_cte = f"""WITH exposure AS (
-  SELECT DISTINCT
-    person_id,
-    drug_exposure_start_date AS exposure_date
-  FROM {self.qualified_table("drug_exposure")}
-  WHERE drug_concept_id IN ({exposure_list})
-)"""
-
-        outcome_cte = f"""outcome AS (
-  SELECT DISTINCT
-    person_id,
-    condition_start_date AS outcome_date
-  FROM {self.qualified_table("condition_occurrence")}
-  WHERE condition_concept_id IN ({outcome_list})
-)"""
-
-        # Snowflake uses DATEDIFF(DAY, date1, date2) instead of DATE_DIFF
-        cohort_cte = f"""cohort AS (
-  SELECT
-    e.person_id,
-    e.exposure_date,
-    o.outcome_date,
-    DATEDIFF(DAY, e.exposure_date, o.outcome_date) AS days_to_outcome
-  FROM exposure e
-  INNER JOIN outcome o ON e.person_id = o.person_id
-  WHERE e.exposure_date <= o.outcome_date
-    AND DATEDIFF(DAY, e.exposure_date, o.outcome_date) <= {pre_outcome_days}
-)"""
-
-        # Snowflake uses QUALIFY with ROW_NUMBER() like BigQuery
-        final_select = """SELECT * FROM cohort
-QUALIFY ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY exposure_date) = 1"""
-
-        return CohortQueryParts(
-            exposure_cte=exposure_cte,
-            outcome_cte=outcome_cte,
-            cohort_cte=cohort_cte,
-            final_select=final_select,
+        """Build Snowflake cohort SQL (concept IDs bound as JSON arrays, expanded by FLATTEN)."""
+        return build_cohort_parts(
+            _COHORT_DIALECT,
+            exposure_table=self.qualified_table("drug_exposure"),
+            outcome_table=self.qualified_table("condition_occurrence"),
+            exposure_ids=exposure_ids,
+            outcome_ids=outcome_ids,
+            pre_outcome_days=pre_outcome_days,
         )
 
-    async def validate_sql(self, sql: str) -> SQLValidationResult:
-        """Validate SQL query using Snowflake's EXPLAIN."""
+    async def validate_sql(
+        self, sql: str, params: dict[str, Any] | None = None
+    ) -> SQLValidationResult:
+        """Validate SQL query using Snowflake's EXPLAIN (successful results cached by SQL hash)."""
+        cache_key = (self.database, self.schema, validation_cache_key(sql, params))
+        if cache_key in self._validate_cache:
+            return SQLValidationResult(valid=True)
+
         try:
-            with self._get_connection() as conn:
-                with conn.cursor() as cursor:
-                    # Use EXPLAIN to validate without executing
-                    cursor.execute(f"EXPLAIN {sql}")
-                    _ = cursor.fetchall()  # Consume result
-                    return SQLValidationResult(valid=True)
+            # Use EXPLAIN to validate without executing
+            await self._query(f"EXPLAIN {sql}", params)
+            self._validate_cache[cache_key] = True
+            return SQLValidationResult(valid=True)
         except Exception as e:
             return SQLValidationResult(valid=False, error_message=str(e))
 
-    async def execute_query(self, sql: str, limit: int = 1000) -> list[dict[str, Any]]:
+    async def execute_query(
+        self,
+        sql: str,
+        limit: int = 1000,
+        params: dict[str, Any] | None = None,
+        *,
+        trusted: bool = False,
+    ) -> list[dict[str, Any]]:
         """Execute SQL and return results."""
-        # Security: block mutating queries
-        sql_upper = sql.upper()
-        if any(
-            kw in sql_upper
-            for kw in ("DELETE", "UPDATE", "DROP", "TRUNCATE", "ALTER", "MERGE", "INSERT")
-        ):
-            raise ValueError("Mutating queries not allowed")
-
-        # Safety: add LIMIT if not present
-        if "LIMIT" not in sql_upper:
-            sql = f"{sql}\nLIMIT {limit}"
+        # Security: block mutating queries; safety: add LIMIT if not present
+        sql = ensure_safe_and_limited(sql, limit, self.dialect, trusted=trusted)
 
         logger.info(f"Executing query on Snowflake (limit={limit})")
 
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute(sql)
-            columns = [desc[0] for desc in cursor.description]
-            rows = [dict(zip(columns, row, strict=False)) for row in cursor.fetchall()]
-
-            cursor.close()
-            conn.close()
+            rows = await self._query(sql, params)
 
             logger.info(f"Query executed successfully, returned {len(rows)} rows")
 
             return rows
 
-        except (ProgrammingError, DatabaseError) as e:
+        except self._connector.errors.DatabaseError as e:
             logger.error(f"Query execution failed on Snowflake: {e}")
             raise
         except Exception as e:
@@ -148,12 +255,35 @@ QUALIFY ROW_NUMBER() OVER (PARTITION BY person_id ORDER BY exposure_date) = 1"""
 
     def qualified_table(self, table: str) -> str:
         """Return Snowflake-style fully qualified table name."""
+        scope = (self.database, self.schema)
+        if self._tables_scope != scope:
+            self._tables = {t: self._qualify(t) for t in config.omop_allowed_tables}
+            self._tables_scope = scope
+        qualified = self._tables.get(table)
+        return qualified if qualified is not None else self._qualify(table)
+
+    def _qualify(self, table: str) -> str:
         return f"{self.database}.{self.schema}.{table}"
 
     def age_calculation_sql(self, birth_col: str = "birth_datetime") -> str:
         """Return Snowflake-specific age calculation."""
-        return f"DATEDIFF(YEAR, {birth_col}, CURRENT_DATE())"
+        age_sql = self._age_sql.get(birth_col)
+        if age_sql is None:
+            age_sql = self._age_sql[birth_col] = f"DATEDIFF(YEAR, {birth_col}, CURRENT_DATE())"
+        return age_sql
 
     def translate_from_bigquery(self, sql: str) -> str:
         """Translate BigQuery SQL to Snowflake SQL."""
         return translate_sql(sql, source_dialect="bigquery", target_dialect="snowflake")
+
+    def close(self) -> None:
+        """Close pooled Snowflake connections and worker threads."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
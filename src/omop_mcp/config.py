@@ -1,6 +1,9 @@
 """Configuration management using pydantic-settings."""
 
-from pydantic import Field
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -31,10 +34,12 @@ class OMOPConfig(BaseSettings):
     snowflake_database: str | None = None
     snowflake_schema: str | None = None
     snowflake_warehouse: str | None = None
+    snowflake_pool_size: int = 4
 
     # DuckDB
     duckdb_database_path: str = ":memory:"  # Default to in-memory
     duckdb_schema: str = "main"
+    duckdb_read_only: bool = True  # File databases only; lets processes share one file
 
     # Postgres
     postgres_dsn: str | None = None
@@ -51,32 +56,36 @@ class OMOPConfig(BaseSettings):
 
     # SQL validation settings
     strict_table_validation: bool = False
-    omop_allowed_tables: list[str] = Field(
-        default=[
-            "person",
-            "condition_occurrence",
-            "drug_exposure",
-            "procedure_occurrence",
-            "measurement",
-            "observation",
-            "visit_occurrence",
-            "death",
-            "location",
-            "care_site",
-            "provider",
-            "concept",
-            "vocabulary",
-            "concept_relationship",
-            "concept_ancestor",
-        ]
+    omop_allowed_tables: frozenset[str] = Field(
+        default=frozenset(
+            [
+                "person",
+                "condition_occurrence",
+                "drug_exposure",
+                "procedure_occurrence",
+                "measurement",
+                "observation",
+                "visit_occurrence",
+                "death",
+                "location",
+                "care_site",
+                "provider",
+                "concept",
+                "vocabulary",
+                "concept_relationship",
+                "concept_ancestor",
+            ]
+        )
     )
-    omop_blocked_columns: list[str] = Field(
-        default=[
-            "person_source_value",
-            "provider_source_value",
-            "location_source_value",
-            "care_site_source_value",
-        ]
+    omop_blocked_columns: frozenset[str] = Field(
+        default=frozenset(
+            [
+                "person_source_value",
+                "provider_source_value",
+                "location_source_value",
+                "care_site_source_value",
+            ]
+        )
     )
     phi_mode: bool = False
 
@@ -89,6 +98,14 @@ class OMOPConfig(BaseSettings):
     # Logging
     log_level: str = "INFO"
 
+    @field_validator("omop_allowed_tables", "omop_blocked_columns", mode="before")
+    @classmethod
+    def _to_frozenset(cls, v: Any) -> Any:
+        """Store table/column lists as lowercased frozensets for O(1) membership checks."""
+        if isinstance(v, Iterable) and not isinstance(v, str):
+            return frozenset(str(item).lower() for item in v)
+        return v
+
 
 # Global config instance
 config = OMOPConfig()  # type: ignore[call-arg]
@@ -1,10 +1,16 @@
 """Pydantic models for OMOP MCP server."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware current time in UTC (skips the local-zone conversion)."""
+    return datetime.now(UTC)
 
 
 class OMOPDomain(str, Enum):
@@ -51,6 +57,13 @@ class ConceptRelationship(BaseModel):
     relationship_name: str
 
 
+# Dump whole concept/relationship lists in one pydantic-core call instead of per model
+CONCEPT_LIST_ADAPTER: TypeAdapter[list[OMOPConcept]] = TypeAdapter(list[OMOPConcept])
+RELATIONSHIP_LIST_ADAPTER: TypeAdapter[list[ConceptRelationship]] = TypeAdapter(
+    list[ConceptRelationship]
+)
+
+
 class ConceptDiscoveryRequest(BaseModel):
     """Input for concept discovery."""
 
@@ -68,14 +81,16 @@ class ConceptDiscoveryResult(BaseModel):
     concepts: list[OMOPConcept]
     relationships: dict[int, list[ConceptRelationship]] = Field(default_factory=dict)
     search_metadata: dict[str, Any] = Field(default_factory=dict)
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
-    @property
+    # Derived views are computed on first access and cached on the instance;
+    # ``concepts`` is not modified after a discovery result is built.
+    @cached_property
     def concept_ids(self) -> list[int]:
         """Get list of all concept IDs."""
         return [c.concept_id for c in self.concepts]
 
-    @property
+    @cached_property
     def standard_concepts(self) -> list[OMOPConcept]:
         """Get only standard concepts."""
         return [c for c in self.concepts if c.is_standard()]
@@ -106,11 +121,14 @@ class CohortSQLResult(BaseModel):
     """Output from SQL generation."""
 
     sql: str
+    query_params: dict[str, Any] = Field(
+        default_factory=dict, description="Named parameters referenced by the SQL"
+    )
     validation: SQLValidationResult | None = None
     concept_counts: dict[str, int] = Field(default_factory=dict)
     backend: str = "bigquery"
     dialect: str = "bigquery"
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
     @property
     def is_valid(self) -> bool:
@@ -145,4 +163,27 @@ class QueryOMOPResult(BaseModel):
     estimated_bytes: int | None = None
     backend: str
     dialect: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_utcnow)
+
+
+class CohortSQLPromptArgs(BaseModel):
+    """Arguments for the cohort/sql prompt."""
+
+    exposure_concepts: list[dict[str, Any]] = Field(..., description="Exposure concept dicts")
+    outcome_concepts: list[dict[str, Any]] = Field(..., description="Outcome concept dicts")
+    time_window_days: int = Field(..., description="Maximum days between exposure and outcome")
+    backend_dialect: str = Field(..., description="SQL dialect (bigquery, postgresql, etc.)")
+
+
+class AnalysisDiscoveryPromptArgs(BaseModel):
+    """Arguments for the analysis/discovery prompt."""
+
+    clinical_question: str = Field(..., description="Clinical question to investigate")
+    domains: list[str] | None = Field(None, description="OMOP domains to focus on")
+
+
+class MultiStepQueryPromptArgs(BaseModel):
+    """Arguments for the query/multi-step prompt."""
+
+    concept_ids: list[int] = Field(..., description="OMOP concept IDs")
+    domain: str = Field(..., description="OMOP domain")
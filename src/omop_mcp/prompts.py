@@ -6,8 +6,77 @@ Provides MCP prompts for:
 - prompt://analysis/discovery - Template for concept discovery workflow
 """
 
+import string
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Any
 
+from pydantic import BaseModel, ValidationError
+
+from omop_mcp.models import (
+    AnalysisDiscoveryPromptArgs,
+    CohortSQLPromptArgs,
+    MultiStepQueryPromptArgs,
+)
+
+# Hashable (concept_id, concept_name) pairs, so rendered prompts can be memoized
+_ConceptPairs = tuple[tuple[Any, Any], ...]
+
+# Static part of the cohort SQL prompt. It leads the prompt so providers that cache
+# on prompt prefixes (Anthropic cache_control, OpenAI automatic caching) can reuse it.
+_COHORT_SQL_STATIC_HEADER = """You are an expert OMOP CDM analyst. Generate SQL to identify an \
+exposure → outcome cohort.
+
+**Requirements**:
+- Use OMOP CDM v5.4 standard tables
+- Return: person_id, exposure_date, outcome_date, days_between
+- Include only patients with BOTH exposure and outcome
+- Filter: outcome_date BETWEEN exposure_date AND exposure_date + the time window
+- Deduplicate using QUALIFY ROW_NUMBER() (if the target dialect supports it)
+
+**Tables**:
+- drug_exposure (drug_concept_id)
+- condition_occurrence (condition_concept_id)
+- procedure_occurrence (procedure_concept_id)
+- measurement (measurement_concept_id)
+
+"""
+
+_COHORT_SQL_STATIC_FOOTER = """
+Generate production-ready SQL following this pattern.
+"""
+
+
+@dataclass(frozen=True)
+class PromptSegments:
+    """
+    A rendered prompt split into ordered segments.
+
+    Each segment is a ``{"text": str, "cacheable": bool}`` dict. Cacheable segments
+    are identical across calls, so serializers can mark them with Anthropic
+    ``cache_control`` blocks; OpenAI caches prefixes automatically, so it only
+    needs the concatenated ``text``.
+    """
+
+    segments: tuple[dict[str, Any], ...]
+
+    @cached_property
+    def text(self) -> str:
+        """Full prompt text, as sent to providers that take a single string."""
+        return "".join([segment["text"] for segment in self.segments])
+
+    def to_anthropic_content(self) -> list[dict[str, Any]]:
+        """Text content blocks with ``cache_control`` on the cacheable segments."""
+        blocks: list[dict[str, Any]] = []
+        for segment in self.segments:
+            block: dict[str, Any] = {"type": "text", "text": segment["text"]}
+            if segment["cacheable"]:
+                block["cache_control"] = {"type": "ephemeral"}
+            blocks.append(block)
+        return blocks
+
+
 # ============================================================================
 # Prompt Templates
 # ============================================================================
@@ -39,50 +108,63 @@ def get_cohort_sql_prompt(
         >>> outcome = [{"concept_id": 5678, "concept_name": "Myopathy"}]
         >>> prompt = get_cohort_sql_prompt(exposure, outcome, 180, "bigquery")
     """
-    exposure_list = "\n".join(
-        f"  - {c['concept_id']}: {c['concept_name']}" for c in exposure_concepts
-    )
-    outcome_list = "\n".join(
-        f"  - {c['concept_id']}: {c['concept_name']}" for c in outcome_concepts
+    return get_cohort_sql_prompt_segments(
+        exposure_concepts, outcome_concepts, time_window_days, backend_dialect
+    ).text
+
+
+def get_cohort_sql_prompt_segments(
+    exposure_concepts: list[dict[str, Any]],
+    outcome_concepts: list[dict[str, Any]],
+    time_window_days: int,
+    backend_dialect: str,
+) -> PromptSegments:
+    """
+    Generate the cohort SQL prompt as cacheable and per-request segments.
+
+    Same arguments as get_cohort_sql_prompt; the static requirements and table
+    list come first, followed by the concept lists and example SQL.
+    """
+    return _cohort_sql_prompt(
+        tuple((c["concept_id"], c["concept_name"]) for c in exposure_concepts),
+        tuple((c["concept_id"], c["concept_name"]) for c in outcome_concepts),
+        time_window_days,
+        backend_dialect,
     )
 
-    return f"""You are an expert OMOP CDM analyst. Generate SQL to identify a cohort where:
 
+_COHORT_SQL_DYNAMIC_TEMPLATE = string.Template(
+    """**Cohort**:
 1. **Exposure**: Patients have any of these concepts:
-{exposure_list}
+${exposure_list}
 
-2. **Outcome**: Followed by any of these outcomes within {time_window_days} days:
-{outcome_list}
+2. **Outcome**: Followed by any of these outcomes within ${time_window_days} days:
+${outcome_list}
 
-**Requirements**:
-- Use OMOP CDM v5.4 standard tables
-- Target SQL dialect: {backend_dialect}
-- Return: person_id, exposure_date, outcome_date, days_between
-- Include only patients with BOTH exposure and outcome
-- Filter: outcome_date BETWEEN exposure_date AND exposure_date + {time_window_days}
-- Deduplicate using QUALIFY ROW_NUMBER() (if {backend_dialect} supports it)
-
-**Tables**:
-- drug_exposure (drug_concept_id)
-- condition_occurrence (condition_concept_id)
-- procedure_occurrence (procedure_concept_id)
-- measurement (measurement_concept_id)
+- Target SQL dialect: ${backend_dialect}
+- Time window: ${time_window_days} days
 
 **Example Structure**:
 ```sql
-WITH exposures AS (
+${example_sql}```
+"""
+)
+
+_COHORT_SQL_EXAMPLE_CTES = """WITH exposures AS (
   SELECT person_id, drug_concept_id AS exposure_concept_id,
          drug_exposure_start_date AS exposure_date
   FROM drug_exposure
-  WHERE drug_concept_id IN ({", ".join(str(c["concept_id"]) for c in exposure_concepts)})
+  WHERE drug_concept_id IN (${exposure_ids_csv})
 ),
 outcomes AS (
   SELECT person_id, condition_concept_id AS outcome_concept_id,
          condition_start_date AS outcome_date
   FROM condition_occurrence
-  WHERE condition_concept_id IN ({", ".join(str(c["concept_id"]) for c in outcome_concepts)})
+  WHERE condition_concept_id IN (${outcome_ids_csv})
 )
-SELECT
+"""
+
+_BIGQUERY_EXAMPLE_SELECT = """SELECT
   e.person_id,
   e.exposure_date,
   o.outcome_date,
@@ -91,13 +173,101 @@ FROM exposures e
 JOIN outcomes o
   ON e.person_id = o.person_id
   AND o.outcome_date BETWEEN e.exposure_date
-      AND DATE_ADD(e.exposure_date, INTERVAL {time_window_days} DAY)
+      AND DATE_ADD(e.exposure_date, INTERVAL ${time_window_days} DAY)
 QUALIFY ROW_NUMBER() OVER (PARTITION BY e.person_id ORDER BY e.exposure_date) = 1
-```
+"""
 
-Generate production-ready SQL following this pattern.
+_POSTGRES_EXAMPLE_SELECT = """SELECT DISTINCT ON (e.person_id)
+  e.person_id,
+  e.exposure_date,
+  o.outcome_date,
+  o.outcome_date - e.exposure_date AS days_between
+FROM exposures e
+JOIN outcomes o
+  ON e.person_id = o.person_id
+  AND o.outcome_date BETWEEN e.exposure_date
+      AND e.exposure_date + ${time_window_days}
+ORDER BY e.person_id, e.exposure_date
+"""
+
+_SNOWFLAKE_EXAMPLE_SELECT = """SELECT
+  e.person_id,
+  e.exposure_date,
+  o.outcome_date,
+  DATEDIFF(day, e.exposure_date, o.outcome_date) AS days_between
+FROM exposures e
+JOIN outcomes o
+  ON e.person_id = o.person_id
+  AND o.outcome_date BETWEEN e.exposure_date
+      AND DATEADD(day, ${time_window_days}, e.exposure_date)
+QUALIFY ROW_NUMBER() OVER (PARTITION BY e.person_id ORDER BY e.exposure_date) = 1
 """
 
+_DUCKDB_EXAMPLE_SELECT = """SELECT
+  e.person_id,
+  e.exposure_date,
+  o.outcome_date,
+  date_diff('day', e.exposure_date, o.outcome_date) AS days_between
+FROM exposures e
+JOIN outcomes o
+  ON e.person_id = o.person_id
+  AND o.outcome_date BETWEEN e.exposure_date
+      AND e.exposure_date + INTERVAL ${time_window_days} DAY
+QUALIFY ROW_NUMBER() OVER (PARTITION BY e.person_id ORDER BY e.exposure_date) = 1
+"""
+
+# Example SQL written in each target dialect, so the model does not have to translate;
+# other dialects fall back to the BigQuery example
+_COHORT_SQL_EXAMPLES: dict[str, string.Template] = {
+    dialect: string.Template(_COHORT_SQL_EXAMPLE_CTES + select)
+    for dialect, select in {
+        "bigquery": _BIGQUERY_EXAMPLE_SELECT,
+        "postgres": _POSTGRES_EXAMPLE_SELECT,
+        "postgresql": _POSTGRES_EXAMPLE_SELECT,
+        "snowflake": _SNOWFLAKE_EXAMPLE_SELECT,
+        "duckdb": _DUCKDB_EXAMPLE_SELECT,
+    }.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _cohort_sql_prompt(
+    exposure_concepts: _ConceptPairs,
+    outcome_concepts: _ConceptPairs,
+    time_window_days: int,
+    backend_dialect: str,
+) -> PromptSegments:
+    """Render the cohort SQL prompt, memoized per concept sets, window and dialect."""
+    exposure_list = "\n".join([f"  - {cid}: {name}" for cid, name in exposure_concepts])
+    outcome_list = "\n".join([f"  - {cid}: {name}" for cid, name in outcome_concepts])
+    exposure_ids_csv = ", ".join([str(cid) for cid, _ in exposure_concepts])
+    outcome_ids_csv = ", ".join([str(cid) for cid, _ in outcome_concepts])
+
+    example = _COHORT_SQL_EXAMPLES.get(backend_dialect.lower(), _COHORT_SQL_EXAMPLES["bigquery"])
+    example_sql = example.substitute(
+        exposure_ids_csv=exposure_ids_csv,
+        outcome_ids_csv=outcome_ids_csv,
+        time_window_days=time_window_days,
+    )
+
+    dynamic_block = _COHORT_SQL_DYNAMIC_TEMPLATE.substitute(
+        exposure_list=exposure_list,
+        outcome_list=outcome_list,
+        time_window_days=time_window_days,
+        backend_dialect=backend_dialect,
+        example_sql=example_sql,
+    )
+
+    # Only the leading segment can be served from a prefix cache; the footer
+    # follows per-request text, so it is sent uncached.
+    return PromptSegments(
+        segments=(
+            {"text": _COHORT_SQL_STATIC_HEADER, "cacheable": True},
+            {"text": dynamic_block, "cacheable": False},
+            {"text": _COHORT_SQL_STATIC_FOOTER, "cacheable": False},
+        )
+    )
+
 
 def get_analysis_discovery_prompt(
     clinical_question: str,
@@ -122,14 +292,14 @@ def get_analysis_discovery_prompt(
         ...     domains=["Drug", "Condition"]
         ... )
     """
-    domain_filter = ""
-    if domains:
-        domain_filter = f"\n**Focus Domains**: {', '.join(domains)}"
+    return _analysis_discovery_prompt(clinical_question, tuple(domains) if domains else None)
+
 
-    return f"""You are conducting an OMOP CDM research analysis.
+_DISCOVERY_TEMPLATE = string.Template(
+    """You are conducting an OMOP CDM research analysis.
 
-**Clinical Question**: {clinical_question}
-{domain_filter}
+**Clinical Question**: ${clinical_question}
+${domain_filter}
 
 **Your Task**: Systematically discover relevant OMOP concepts using these steps:
 
@@ -165,6 +335,19 @@ def get_analysis_discovery_prompt(
 
 Begin by identifying the key entities in the clinical question.
 """
+)
+
+
+@lru_cache(maxsize=256)
+def _analysis_discovery_prompt(clinical_question: str, domains: tuple[str, ...] | None) -> str:
+    """Render the concept discovery prompt, memoized per question and domains."""
+    domain_filter = ""
+    if domains:
+        domain_filter = f"\n**Focus Domains**: {', '.join(domains)}"
+
+    return _DISCOVERY_TEMPLATE.substitute(
+        clinical_question=clinical_question, domain_filter=domain_filter
+    )
 
 
 def get_multi_step_query_prompt(
@@ -186,9 +369,13 @@ def get_multi_step_query_prompt(
     Example:
         >>> prompt = get_multi_step_query_prompt([313217, 316866], "Condition")
     """
-    return f"""You have discovered {len(concept_ids)} concepts in domain: {domain}
+    return _multi_step_query_prompt(tuple(concept_ids), domain)
 
-**Concept IDs**: {", ".join(map(str, concept_ids))}
+
+_MULTI_STEP_TEMPLATE = string.Template(
+    """You have discovered ${concept_count} concepts in domain: ${domain}
+
+**Concept IDs**: ${concept_ids_csv}
 
 **Next Steps - Cost-Aware Query Execution**:
 
@@ -196,8 +383,8 @@ def get_multi_step_query_prompt(
    ```
    query_omop(
        query_type="count",
-       concept_ids=[{", ".join(map(str, concept_ids))}],
-       domain="{domain}",
+       concept_ids=[${concept_ids_csv}],
+       domain="${domain}",
        execute=False  # DRY RUN - no data returned
    )
    ```
@@ -205,15 +392,15 @@ def get_multi_step_query_prompt(
 
 2. **Review Estimate**:
    - Check if estimated_cost_usd is acceptable
-   - Default cost cap: $1.00 USD (configurable via MAX_QUERY_COST_USD)
+   - Default cost cap: $$1.00 USD (configurable via MAX_QUERY_COST_USD)
    - Review generated SQL for correctness
 
 3. **Execute Query** (if cost acceptable):
    ```
    query_omop(
        query_type="count",
-       concept_ids=[{", ".join(map(str, concept_ids))}],
-       domain="{domain}",
+       concept_ids=[${concept_ids_csv}],
+       domain="${domain}",
        execute=True  # EXECUTE - returns results
    )
    ```
@@ -226,11 +413,22 @@ def get_multi_step_query_prompt(
 **Security Notes**:
 - All queries are read-only (no DELETE/UPDATE/DROP)
 - Row limit: 1000 rows maximum
-- Cost cap: $1.00 USD default (blocks expensive queries)
+- Cost cap: $$1.00 USD default (blocks expensive queries)
 - PHI protection: list_patients requires explicit permission
 
 Proceed with Step 1 (dry run) to estimate query cost.
 """
+)
+
+
+@lru_cache(maxsize=256)
+def _multi_step_query_prompt(concept_ids: tuple[int, ...], domain: str) -> str:
+    """Render the multi-step query prompt, memoized per concept IDs and domain."""
+    concept_ids_csv = ", ".join(map(str, concept_ids))
+
+    return _MULTI_STEP_TEMPLATE.substitute(
+        concept_count=len(concept_ids), concept_ids_csv=concept_ids_csv, domain=domain
+    )
 
 
 # ============================================================================
@@ -238,6 +436,138 @@ Proceed with Step 1 (dry run) to estimate query cost.
 # ============================================================================
 
 
+def _render_cohort_sql(args: CohortSQLPromptArgs) -> dict[str, Any]:
+    """Render cohort/sql content plus its cacheable segments."""
+    rendered = get_cohort_sql_prompt_segments(
+        exposure_concepts=args.exposure_concepts,
+        outcome_concepts=args.outcome_concepts,
+        time_window_days=args.time_window_days,
+        backend_dialect=args.backend_dialect,
+    )
+    return {"content": rendered.text, "segments": list(rendered.segments)}
+
+
+def _render_analysis_discovery(args: AnalysisDiscoveryPromptArgs) -> dict[str, Any]:
+    """Render analysis/discovery content."""
+    return {
+        "content": get_analysis_discovery_prompt(
+            clinical_question=args.clinical_question, domains=args.domains
+        )
+    }
+
+
+def _render_multi_step_query(args: MultiStepQueryPromptArgs) -> dict[str, Any]:
+    """Render query/multi-step content."""
+    return {
+        "content": get_multi_step_query_prompt(concept_ids=args.concept_ids, domain=args.domain)
+    }
+
+
+_PromptRenderer = Callable[[Any], dict[str, Any]]
+
+# Single source of truth per prompt: listed metadata plus its argument model and renderer
+_PROMPT_REGISTRY: dict[str, dict[str, Any]] = {
+    "cohort/sql": {
+        "id": "cohort/sql",
+        "name": "Cohort SQL Generation",
+        "description": "Template for generating OMOP CDM cohort identification SQL",
+        "arguments": [
+            {
+                "name": "exposure_concepts",
+                "type": "array",
+                "required": True,
+                "description": "List of exposure concept dictionaries",
+            },
+            {
+                "name": "outcome_concepts",
+                "type": "array",
+                "required": True,
+                "description": "List of outcome concept dictionaries",
+            },
+            {
+                "name": "time_window_days",
+                "type": "integer",
+                "required": True,
+                "description": "Maximum days between exposure and outcome",
+            },
+            {
+                "name": "backend_dialect",
+                "type": "string",
+                "required": True,
+                "description": "SQL dialect (bigquery, postgresql, etc.)",
+            },
+        ],
+        "args_model": CohortSQLPromptArgs,
+        "render": _render_cohort_sql,
+    },
+    "analysis/discovery": {
+        "id": "analysis/discovery",
+        "name": "Concept Discovery Workflow",
+        "description": "Systematic approach to discovering OMOP concepts for clinical questions",
+        "arguments": [
+            {
+                "name": "clinical_question",
+                "type": "string",
+                "required": True,
+                "description": "The clinical question to investigate",
+            },
+            {
+                "name": "domains",
+                "type": "array",
+                "required": False,
+                "description": "OMOP domains to focus on",
+            },
+        ],
+        "args_model": AnalysisDiscoveryPromptArgs,
+        "render": _render_analysis_discovery,
+    },
+    "query/multi-step": {
+        "id": "query/multi-step",
+        "name": "Multi-Step Query Execution",
+        "description": "Cost-aware workflow for executing analytical queries",
+        "arguments": [
+            {
+                "name": "concept_ids",
+                "type": "array",
+                "required": True,
+                "description": "List of OMOP concept IDs",
+            },
+            {
+                "name": "domain",
+                "type": "string",
+                "required": True,
+                "description": "OMOP domain",
+            },
+        ],
+        "args_model": MultiStepQueryPromptArgs,
+        "render": _render_multi_step_query,
+    },
+}
+
+# Keys that stay internal to get_prompt and are not listed to clients
+_INTERNAL_KEYS = frozenset({"args_model", "render"})
+
+# Prompt metadata is static, so list_prompts() hands out this shared list
+_PROMPT_LIST: list[dict[str, Any]] = [
+    {key: value for key, value in entry.items() if key not in _INTERNAL_KEYS}
+    for entry in _PROMPT_REGISTRY.values()
+]
+
+# prompt_id -> (argument model, renderer, name, description), resolved in a single lookup
+_PROMPT_DISPATCH: dict[str, tuple[type[BaseModel], _PromptRenderer, str, str]] = {
+    prompt_id: (entry["args_model"], entry["render"], entry["name"], entry["description"])
+    for prompt_id, entry in _PROMPT_REGISTRY.items()
+}
+
+# prompt_id -> required argument names, checked with one C-level set difference per call
+_PROMPT_REQUIRED: dict[str, frozenset[str]] = {
+    prompt_id: frozenset(
+        field for field, info in entry["args_model"].model_fields.items() if info.is_required()
+    )
+    for prompt_id, entry in _PROMPT_REGISTRY.items()
+}
+
+
 async def get_prompt(prompt_id: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """
     Get a prompt template by ID with arguments.
@@ -251,9 +581,11 @@ async def get_prompt(prompt_id: str, arguments: dict[str, Any]) -> dict[str, Any
         - name: Prompt name
         - description: Prompt description
         - content: Rendered prompt text
+        - segments: Cacheable/per-request prompt segments (cohort/sql only)
 
     Raises:
-        ValueError: If prompt_id is invalid or required arguments missing
+        ValueError: If prompt_id is invalid, or arguments are missing or fail
+            validation against the prompt's argument model
 
     Example:
         >>> prompt = await get_prompt(
@@ -266,64 +598,26 @@ async def get_prompt(prompt_id: str, arguments: dict[str, Any]) -> dict[str, Any
         ...     }
         ... )
     """
-    if prompt_id == "cohort/sql":
-        required = ["exposure_concepts", "outcome_concepts", "time_window_days", "backend_dialect"]
-        missing = [arg for arg in required if arg not in arguments]
-        if missing:
-            raise ValueError(f"Missing required arguments: {', '.join(missing)}")
-
-        content = get_cohort_sql_prompt(
-            exposure_concepts=arguments["exposure_concepts"],
-            outcome_concepts=arguments["outcome_concepts"],
-            time_window_days=arguments["time_window_days"],
-            backend_dialect=arguments["backend_dialect"],
-        )
+    try:
+        args_model, render, name, description = _PROMPT_DISPATCH[prompt_id]
+    except KeyError:
+        raise ValueError(f"Unknown prompt_id: {prompt_id}") from None
 
-        return {
-            "name": "Cohort SQL Generation",
-            "description": "Template for generating OMOP CDM cohort identification SQL",
-            "arguments": arguments,
-            "content": content,
-        }
-
-    elif prompt_id == "analysis/discovery":
-        required = ["clinical_question"]
-        missing = [arg for arg in required if arg not in arguments]
-        if missing:
-            raise ValueError(f"Missing required arguments: {', '.join(missing)}")
-
-        content = get_analysis_discovery_prompt(
-            clinical_question=arguments["clinical_question"],
-            domains=arguments.get("domains"),
-        )
-
-        return {
-            "name": "Concept Discovery Workflow",
-            "description": "Systematic approach to discovering OMOP concepts for clinical questions",
-            "arguments": arguments,
-            "content": content,
-        }
-
-    elif prompt_id == "query/multi-step":
-        required = ["concept_ids", "domain"]
-        missing = [arg for arg in required if arg not in arguments]
-        if missing:
-            raise ValueError(f"Missing required arguments: {', '.join(missing)}")
-
-        content = get_multi_step_query_prompt(
-            concept_ids=arguments["concept_ids"],
-            domain=arguments["domain"],
-        )
+    missing = _PROMPT_REQUIRED[prompt_id].difference(arguments)
+    if missing:
+        raise ValueError(f"Missing required arguments: {', '.join(sorted(missing))}")
 
-        return {
-            "name": "Multi-Step Query Execution",
-            "description": "Cost-aware workflow for executing analytical queries",
-            "arguments": arguments,
-            "content": content,
-        }
+    try:
+        args = args_model.model_validate(arguments)
+    except ValidationError as e:
+        raise ValueError(f"Invalid arguments for {prompt_id}: {e}") from e
 
-    else:
-        raise ValueError(f"Unknown prompt_id: {prompt_id}")
+    return {
+        "name": name,
+        "description": description,
+        "arguments": arguments,
+        **render(args),
+    }
 
 
 async def list_prompts() -> list[dict[str, Any]]:
@@ -331,81 +625,11 @@ async def list_prompts() -> list[dict[str, Any]]:
     List all available prompts.
 
     Returns:
-        List of prompt metadata dictionaries
+        List of prompt metadata dictionaries (shared; treat as read-only)
 
     Example:
         >>> prompts = await list_prompts()
         >>> for p in prompts:
         ...     print(f"{p['id']}: {p['name']}")
     """
-    return [
-        {
-            "id": "cohort/sql",
-            "name": "Cohort SQL Generation",
-            "description": "Template for generating OMOP CDM cohort identification SQL",
-            "arguments": [
-                {
-                    "name": "exposure_concepts",
-                    "type": "array",
-                    "required": True,
-                    "description": "List of exposure concept dictionaries",
-                },
-                {
-                    "name": "outcome_concepts",
-                    "type": "array",
-                    "required": True,
-                    "description": "List of outcome concept dictionaries",
-                },
-                {
-                    "name": "time_window_days",
-                    "type": "integer",
-                    "required": True,
-                    "description": "Maximum days between exposure and outcome",
-                },
-                {
-                    "name": "backend_dialect",
-                    "type": "string",
-                    "required": True,
-                    "description": "SQL dialect (bigquery, postgresql, etc.)",
-                },
-            ],
-        },
-        {
-            "id": "analysis/discovery",
-            "name": "Concept Discovery Workflow",
-            "description": "Systematic approach to discovering OMOP concepts for clinical questions",
-            "arguments": [
-                {
-                    "name": "clinical_question",
-                    "type": "string",
-                    "required": True,
-                    "description": "The clinical question to investigate",
-                },
-                {
-                    "name": "domains",
-                    "type": "array",
-                    "required": False,
-                    "description": "OMOP domains to focus on",
-                },
-            ],
-        },
-        {
-            "id": "query/multi-step",
-            "name": "Multi-Step Query Execution",
-            "description": "Cost-aware workflow for executing analytical queries",
-            "arguments": [
-                {
-                    "name": "concept_ids",
-                    "type": "array",
-                    "required": True,
-                    "description": "List of OMOP concept IDs",
-                },
-                {
-                    "name": "domain",
-                    "type": "string",
-                    "required": True,
-                    "description": "OMOP domain",
-                },
-            ],
-        },
-    ]
+    return _PROMPT_LIST
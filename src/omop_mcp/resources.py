@@ -5,18 +5,95 @@ Provides MCP resources for:
 - omop://concept/{id} - Concept details (JSON, cacheable)
 - athena://search?query={q}&cursor={c} - Paginated ATHENA search
 - backend://capabilities - Available backends and their features
+
+Also caches the ATHENA concept discovery and relationship lookups behind the
+discover_concepts and get_concept_relationships tools.
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from operator import attrgetter
 from typing import Any
 
 import structlog
+from cachetools import TTLCache
 
 from omop_mcp.backends.registry import get_backend, list_backends
 from omop_mcp.config import config
-from omop_mcp.tools.athena import AthenaAPIClient
+from omop_mcp.models import CONCEPT_LIST_ADAPTER, RELATIONSHIP_LIST_ADAPTER
+from omop_mcp.tools.athena import clear_search_cache, discover_concepts, get_athena_client
 
 logger = structlog.get_logger(__name__)
 
+# Concept metadata is effectively immutable; search results drift as vocabularies update.
+# Per-ID lookups only change with a vocabulary release; clear_athena_caches() drops them early.
+CONCEPT_CACHE_MAXSIZE = 10_000
+CONCEPT_CACHE_TTL_SEC = 7 * 86_400
+SEARCH_CACHE_MAXSIZE = 512
+SEARCH_CACHE_TTL_SEC = 300
+DISCOVERY_CACHE_MAXSIZE = 4096
+DISCOVERY_CACHE_TTL_SEC = 3600
+RELATIONSHIP_CACHE_MAXSIZE = 16_384
+RELATIONSHIP_CACHE_TTL_SEC = 7 * 86_400
+
+# ATHENA rate-limits clients; cap the worker threads calling it at once
+ATHENA_MAX_CONCURRENCY = 8
+_athena_slots = asyncio.Semaphore(ATHENA_MAX_CONCURRENCY)
+
+_concept_cache: TTLCache[int, dict[str, Any]] = TTLCache(
+    maxsize=CONCEPT_CACHE_MAXSIZE, ttl=CONCEPT_CACHE_TTL_SEC
+)
+# Search entries are (fetch limit, rows) so deeper pages can reuse a larger fetch
+_search_cache: TTLCache[tuple[Any, ...], tuple[int, list[Any]]] = TTLCache(
+    maxsize=SEARCH_CACHE_MAXSIZE, ttl=SEARCH_CACHE_TTL_SEC
+)
+# Discovery entries hold the finished tool response, so hits skip pydantic dumping
+_discovery_cache: TTLCache[tuple[Any, ...], dict[str, Any]] = TTLCache(
+    maxsize=DISCOVERY_CACHE_MAXSIZE, ttl=DISCOVERY_CACHE_TTL_SEC
+)
+# Relationship entries are already-dumped dicts keyed on (concept_id, relationship_id)
+_relationship_cache: TTLCache[tuple[int, str | None], list[dict[str, Any]]] = TTLCache(
+    maxsize=RELATIONSHIP_CACHE_MAXSIZE, ttl=RELATIONSHIP_CACHE_TTL_SEC
+)
+
+# ATHENA calls in flight, so concurrent identical requests share a single network call
+_concept_inflight: dict[int, asyncio.Task[Any]] = {}
+_search_inflight: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+_discovery_inflight: dict[tuple[Any, ...], asyncio.Task[Any]] = {}
+_relationship_inflight: dict[int, asyncio.Task[Any]] = {}
+
+# Capabilities response, kept once every registered backend has resolved
+_capabilities: dict[str, Any] | None = None
+
+# OMOPConcept fields exposed by the concept resources, read in one C-level call per row
+_CONCEPT_FIELDS = (
+    "concept_id",
+    "concept_name",
+    "concept_code",
+    "domain_id",
+    "vocabulary_id",
+    "concept_class_id",
+    "standard_concept",
+    "invalid_reason",
+)
+_concept_getter = attrgetter(*_CONCEPT_FIELDS)
+
+
+def clear_athena_caches() -> None:
+    """Forget every cached ATHENA result, e.g. after a vocabulary release."""
+    _concept_cache.clear()
+    _search_cache.clear()
+    _discovery_cache.clear()
+    _relationship_cache.clear()
+    clear_search_cache()
+
+
+async def _call_athena(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Run a synchronous athena-client call in a worker thread, within the concurrency cap."""
+    async with _athena_slots:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
 
 # ============================================================================
 # Resource Handlers
@@ -29,6 +106,8 @@ async def get_concept_resource(concept_id: int) -> dict[str, Any]:
 
     Resource URI: omop://concept/{concept_id}
 
+    Results are cached in memory for CONCEPT_CACHE_TTL_SEC seconds.
+
     Returns cacheable concept JSON with:
     - concept_id, concept_name, concept_code
     - domain_id, vocabulary_id, concept_class_id
@@ -51,36 +130,55 @@ async def get_concept_resource(concept_id: int) -> dict[str, Any]:
     if concept_id <= 0:
         raise ValueError(f"Invalid concept_id: {concept_id}")
 
-    logger.info("get_concept_resource", concept_id=concept_id)
+    cached = _concept_cache.get(concept_id)
+    if cached is not None:
+        logger.debug("get_concept_resource_cache_hit", concept_id=concept_id)
+        return dict(cached)
+
+    return dict(await _single_flight(_concept_inflight, concept_id, _fetch_concept, concept_id))
+
+
+async def _single_flight(
+    inflight: dict[Any, asyncio.Task[Any]],
+    key: Any,
+    func: Callable[..., Awaitable[Any]],
+    *args: Any,
+) -> Any:
+    """Await func(*args), sharing one in-flight call among concurrent callers with key."""
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(func(*args))
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+
+    # Shield the shared call so one cancelled caller does not cancel the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_concept(concept_id: int) -> dict[str, Any]:
+    """Fetch one concept from ATHENA off the event loop and cache it."""
+    log = logger.bind(concept_id=concept_id)
+    log.info("get_concept_resource")
 
     try:
-        client = AthenaAPIClient(base_url=config.athena_base_url)
+        client = get_athena_client()
 
-        # Get concept details using athena-client
-        concept = client.get_concept_by_id(concept_id)
+        # athena-client is synchronous; run it in a worker thread
+        concept = await _call_athena(client.get_concept_by_id, concept_id)
 
         if not concept:
             raise ValueError(f"Concept {concept_id} not found")
 
         # Convert OMOPConcept to dictionary
-        result = {
-            "concept_id": concept.concept_id,
-            "concept_name": concept.concept_name,
-            "concept_code": concept.concept_code,
-            "domain_id": concept.domain_id,
-            "vocabulary_id": concept.vocabulary_id,
-            "concept_class_id": concept.concept_class_id,
-            "standard_concept": concept.standard_concept,
-            "invalid_reason": concept.invalid_reason,
-        }
+        result = dict(zip(_CONCEPT_FIELDS, _concept_getter(concept), strict=True))
+        _concept_cache[concept_id] = result
 
-        logger.info("get_concept_resource_success", concept_id=concept_id)
+        log.info("get_concept_resource_success")
         return result
 
     except Exception as e:
-        logger.error(
+        log.error(
             "get_concept_resource_failed",
-            concept_id=concept_id,
             error=str(e),
             exc_info=True,
         )
@@ -114,7 +212,7 @@ async def search_concepts_resource(
         Dictionary with:
         - concepts: List of concept dictionaries
         - next_cursor: Cursor for next page (null if last page)
-        - total_count: Total results available
+        - total_count: Total results, or null until the last page is reached
         - page_size: Results in this page
 
     Example:
@@ -131,9 +229,10 @@ async def search_concepts_resource(
     # Validate pagination
     page_size = min(page_size, 100)  # Cap at 100
 
-    logger.info(
+    # Bind request context once; every event below reuses it
+    log = logger.bind(query=query)
+    log.info(
         "search_concepts_resource",
-        query=query,
         cursor=cursor,
         page_size=page_size,
         domain=domain,
@@ -141,56 +240,48 @@ async def search_concepts_resource(
     )
 
     try:
-        client = AthenaAPIClient(base_url=config.athena_base_url)
-
         # Parse cursor (format: "offset:{n}")
         offset = 0
         if cursor:
-            if cursor.startswith("offset:"):
-                try:
-                    offset = int(cursor.split(":")[1])
-                except (IndexError, ValueError) as e:
-                    raise ValueError(f"Invalid cursor format: {cursor}") from e
-            else:
+            prefix, sep, value = cursor.partition(":")
+            if not sep or prefix != "offset":
+                raise ValueError(f"Invalid cursor format: {cursor}")
+            try:
+                offset = int(value)
+            except ValueError as e:
+                raise ValueError(f"Invalid cursor format: {cursor}") from e
+            if offset < 0:
                 raise ValueError(f"Invalid cursor format: {cursor}")
 
-        # Search concepts - athena-client doesn't support pagination directly,
-        # so we fetch more than needed and slice
-        limit = offset + page_size + 100  # Fetch extra to check if there's more
-
-        result = client.search_concepts(
-            query=query,
-            domain=domain,
-            vocabulary=vocabulary,
-            standard_only=standard_only,
-            limit=limit,
-        )
+        # athena-client has no offset parameter, so fetch through the end of this
+        # page plus one sentinel row that tells us whether another page exists
+        limit = offset + page_size + 1
+
+        # Cached rows answer any request they cover: either enough were fetched,
+        # or the search ran out before the fetch limit (the full result set)
+        cache_key = (query, domain, vocabulary, standard_only)
+        cached = _search_cache.get(cache_key)
+        if cached is not None and (cached[0] >= limit or len(cached[1]) < cached[0]):
+            result = cached[1]
+        else:
+            result = await _single_flight(
+                _search_inflight, (*cache_key, limit), _search_athena, *cache_key, limit
+            )
+            _search_cache[cache_key] = (limit, result)
 
         # Slice to get current page
         concepts_page = result[offset : offset + page_size]
+        has_next = len(result) > offset + page_size
 
         # Convert to dictionaries
         concepts = [
-            {
-                "concept_id": c.concept_id,
-                "concept_name": c.concept_name,
-                "concept_code": c.concept_code,
-                "domain_id": c.domain_id,
-                "vocabulary_id": c.vocabulary_id,
-                "concept_class_id": c.concept_class_id,
-                "standard_concept": c.standard_concept,
-                "invalid_reason": c.invalid_reason,
-            }
-            for c in concepts_page
+            dict(zip(_CONCEPT_FIELDS, _concept_getter(c), strict=True)) for c in concepts_page
         ]
 
-        total_count = len(result)  # Approximate total
-
-        # Calculate next cursor
+        # The total is only known once the last page has been reached
         next_offset = offset + len(concepts)
-        next_cursor = None
-        if next_offset < total_count:
-            next_cursor = f"offset:{next_offset}"
+        next_cursor = f"offset:{next_offset}" if has_next else None
+        total_count = None if has_next else next_offset
 
         response = {
             "concepts": concepts,
@@ -203,9 +294,8 @@ async def search_concepts_resource(
             "standard_only": standard_only,
         }
 
-        logger.info(
+        log.info(
             "search_concepts_resource_success",
-            query=query,
             result_count=len(concepts),
             has_next=next_cursor is not None,
         )
@@ -213,15 +303,153 @@ async def search_concepts_resource(
         return response
 
     except Exception as e:
-        logger.error(
+        log.error(
             "search_concepts_resource_failed",
-            query=query,
             error=str(e),
             exc_info=True,
         )
         raise
 
 
+async def _search_athena(
+    query: str, domain: str | None, vocabulary: str | None, standard_only: bool, limit: int
+) -> list[Any]:
+    """Run one ATHENA search in a worker thread; athena-client is synchronous."""
+    return await _call_athena(
+        get_athena_client().search_concepts,
+        query=query,
+        domain=domain,
+        vocabulary=vocabulary,
+        standard_only=standard_only,
+        limit=limit,
+    )
+
+
+async def discover_concepts_response(
+    clinical_text: str,
+    domain: str | None = None,
+    vocabulary: str | None = None,
+    standard_only: bool = True,
+    limit: int = 50,
+) -> dict[str, Any]:
+    """
+    Run ATHENA concept discovery and build the discover_concepts tool response.
+
+    Responses are cached for DISCOVERY_CACHE_TTL_SEC seconds, keyed on the
+    case- and whitespace-normalized search text plus filters, and concurrent
+    identical searches share one ATHENA call.
+
+    Args:
+        clinical_text: Clinical term to search
+        domain: Filter by OMOP domain
+        vocabulary: Filter by vocabulary
+        standard_only: Return only standard concepts
+        limit: Maximum number of concepts to return
+
+    Returns:
+        Dictionary with query, concepts, concept_ids, standard_concepts,
+        search_metadata and timestamp (when this response was returned)
+    """
+    key = (clinical_text.strip().lower(), domain, vocabulary, standard_only, limit)
+    response = _discovery_cache.get(key)
+    if response is None:
+        response = await _single_flight(
+            _discovery_inflight,
+            key,
+            _discover,
+            clinical_text.strip(),
+            domain,
+            vocabulary,
+            standard_only,
+            limit,
+        )
+        _discovery_cache[key] = response
+
+    # Echo the caller's own text (the cached entry may come from a differently-cased
+    # query) and stamp the response itself rather than when the entry was cached
+    return {**response, "query": clinical_text, "timestamp": datetime.now(UTC)}
+
+
+async def _discover(
+    query: str, domain: str | None, vocabulary: str | None, standard_only: bool, limit: int
+) -> dict[str, Any]:
+    """Run discover_concepts in a worker thread and dump the result to plain data."""
+    result = await _call_athena(
+        discover_concepts,
+        query=query,
+        domain=domain,
+        vocabulary=vocabulary,
+        standard_only=standard_only,
+        limit=limit,
+    )
+    concepts = CONCEPT_LIST_ADAPTER.dump_python(result.concepts)
+    if standard_only:
+        # The search already kept only standard concepts, so the two lists are the same
+        concept_ids = [concept["concept_id"] for concept in concepts]
+        standard_concepts = concepts
+    else:
+        # One pass over the dumped dicts builds both derived lists; the models are not revisited
+        concept_ids = []
+        standard_concepts = []
+        for concept in concepts:
+            concept_ids.append(concept["concept_id"])
+            if concept["standard_concept"] == "S":
+                standard_concepts.append(concept)
+    return {
+        "query": result.query,
+        "concepts": concepts,
+        "concept_ids": concept_ids,
+        "standard_concepts": standard_concepts,
+        "search_metadata": result.search_metadata,
+        "timestamp": result.timestamp,
+    }
+
+
+async def get_concept_relationships(
+    concept_id: int, relationship_id: str | None = None
+) -> list[dict[str, Any]]:
+    """
+    Fetch a concept's relationships from ATHENA as plain dicts.
+
+    Relationships change only with vocabulary releases, so results are cached
+    for RELATIONSHIP_CACHE_TTL_SEC seconds and concurrent lookups share one call.
+
+    Args:
+        concept_id: OMOP concept ID
+        relationship_id: Filter by relationship type (optional)
+
+    Returns:
+        List of relationship dictionaries (shared; treat as read-only)
+    """
+    key = (concept_id, relationship_id)
+    relationships = _relationship_cache.get(key)
+    if relationships is None:
+        # ATHENA returns all of a concept's relationships and the type filter is applied
+        # client-side, so every filter for one concept is served from one unfiltered fetch
+        unfiltered = _relationship_cache.get((concept_id, None))
+        if unfiltered is None:
+            unfiltered = await _single_flight(
+                _relationship_inflight, concept_id, _fetch_relationships, concept_id
+            )
+            _relationship_cache[(concept_id, None)] = unfiltered
+        if relationship_id:
+            relationships = [r for r in unfiltered if r["relationship_name"] == relationship_id]
+        else:
+            relationships = unfiltered
+        _relationship_cache[key] = relationships
+    return relationships
+
+
+async def _fetch_relationships(concept_id: int) -> list[dict[str, Any]]:
+    """Fetch all of a concept's relationships in a worker thread and dump them once."""
+    relationships = await _call_athena(
+        get_athena_client().get_concept_relationships,
+        concept_id=concept_id,
+        relationship_id=None,
+    )
+    return RELATIONSHIP_LIST_ADAPTER.dump_python(relationships)
+
+
 async def get_backend_capabilities() -> dict[str, Any]:
     """
     List available backends and their capabilities.
@@ -240,6 +468,8 @@ async def get_backend_capabilities() -> dict[str, Any]:
     - execute: Can execute queries
     - mutations: Allows DELETE/UPDATE (always false for OMOP)
 
+    The response is computed on first use and cached for the process lifetime.
+
     Returns:
         Dictionary with:
         - backends: List of backend dictionaries
@@ -254,10 +484,26 @@ async def get_backend_capabilities() -> dict[str, Any]:
         postgres: postgresql
     """
     logger.info("get_backend_capabilities")
+    return _compute_capabilities()
+
+
+def _compute_capabilities() -> dict[str, Any]:
+    """
+    Build the capabilities response, reusing it once every backend resolved.
+
+    Registered backends and their features are fixed at import time, so a complete
+    result is shared across calls and must be treated as read-only. A response that
+    skipped a backend which failed to initialize is not kept, so a transient error
+    does not hide that backend until restart.
+    """
+    global _capabilities
+    if _capabilities is not None:
+        return _capabilities
 
     try:
         backend_names = list_backends()
         backends_info = []
+        degraded = False
 
         for name in backend_names:
             try:
@@ -290,6 +536,7 @@ async def get_backend_capabilities() -> dict[str, Any]:
                     backend=name,
                     error=str(e),
                 )
+                degraded = True
                 continue
 
         # Determine default backend
@@ -311,6 +558,8 @@ async def get_backend_capabilities() -> dict[str, Any]:
             default=default_backend,
         )
 
+        if not degraded:
+            _capabilities = response
         return response
 
     except Exception as e:
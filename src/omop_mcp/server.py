@@ -4,20 +4,26 @@ OMOP MCP Server - FastMCP implementation with stdio and HTTP transports.
 Provides tools for OMOP concept discovery, SQL generation, and analytical queries.
 """
 
+import asyncio
+import importlib
+import importlib.util
+import logging
+import re
+import time
 from typing import Any
 
+import orjson
 import structlog
 from mcp.server.fastmcp import Context, FastMCP
+from pydantic import BaseModel
 
 from omop_mcp import prompts, resources
+from omop_mcp.backends.registry import get_backend
 from omop_mcp.config import config
-from omop_mcp.models import (
-    ConceptDiscoveryResult,
-    QueryOMOPResult,
-)
-from omop_mcp.tools.athena import AthenaAPIClient
-from omop_mcp.tools.athena import discover_concepts as athena_discover_concepts
+from omop_mcp.models import QueryOMOPResult
+from omop_mcp.tools.query import query_by_concepts
 from omop_mcp.tools.schema import get_all_tables_schema, get_table_schema
+from omop_mcp.tools.sqlgen import generate_cohort_sql as generate_sql
 from omop_mcp.tools.sql_validator import validate_sql_comprehensive
 
 # Configure structured logging
@@ -25,12 +31,77 @@ structlog.configure(
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer(),
-    ]
+        # orjson renders straight to bytes, paired with the bytes logger below
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
+    ],
+    logger_factory=structlog.BytesLoggerFactory(),
+    # Drop events below the configured level before any processing happens
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.getLevelNamesMapping().get(config.log_level.upper(), logging.INFO)
+    ),
+    # Resolve each module logger's processor chain once instead of on every call
+    cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger(__name__)
 
+# LIMIT/FETCH keywords; a row-limit clause always sits in the last few chars of a statement
+_LIMIT_KEYWORD_RE = re.compile(r"\b(?:LIMIT|FETCH)\b", re.IGNORECASE)
+_LIMIT_TAIL_WINDOW = 64
+
+
+def _line_comment_start(sql: str, line_start: int) -> int:
+    """Index of the first ``--`` comment on the line at line_start outside quotes, or -1."""
+    quote = None
+    for i in range(line_start, len(sql)):
+        ch = sql[i]
+        if quote is not None:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"`":
+            quote = ch
+        elif ch == "-" and sql.startswith("--", i):
+            return i
+    return -1
+
+
+def _strip_sql_tail(sql: str) -> str:
+    """Drop trailing whitespace, semicolons and comments from the end of a statement."""
+    while True:
+        stripped = sql.rstrip().rstrip(";").rstrip()
+        if stripped.endswith("*/"):
+            start = stripped.rfind("/*")
+            if start == -1:
+                return stripped
+            stripped = stripped[:start]
+        else:
+            comment = _line_comment_start(stripped, stripped.rfind("\n") + 1)
+            if comment == -1:
+                return stripped
+            stripped = stripped[:comment]
+        sql = stripped
+
+
+def _apply_row_limit(sql: str, limit: int) -> str:
+    """
+    Append ``LIMIT limit`` unless the outer statement already limits its rows.
+
+    Any LIMIT or FETCH clause in the statement tail counts (``LIMIT ALL``,
+    ``LIMIT @n``, ``FETCH FIRST n ROWS ONLY``), unless an unmatched ``)`` after
+    it shows that it belongs to a subquery.
+    """
+    body = _strip_sql_tail(sql)
+    tail_start = max(0, len(body) - _LIMIT_TAIL_WINDOW)
+    last = None
+    for last in _LIMIT_KEYWORD_RE.finditer(body, tail_start):
+        pass
+    if last is not None:
+        after = body[last.end() :]
+        if after.count(")") <= after.count("("):
+            return sql
+    return f"{body}\nLIMIT {limit}"
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     "omop-mcp",
@@ -71,7 +142,8 @@ async def discover_concepts(
         - query: Original search term
         - concepts: List of matching OMOP concepts with metadata
         - concept_ids: List of concept IDs (for use in other tools)
-        - standard_concepts: Filtered list of standard concepts
+        - standard_concepts: Filtered list of standard concepts (the same list as
+          concepts when standard_only=True)
         - search_metadata: Search parameters used
 
     Example:
@@ -94,27 +166,18 @@ async def discover_concepts(
     )
 
     try:
-        result: ConceptDiscoveryResult = athena_discover_concepts(
-            query=clinical_text,
+        response = await resources.discover_concepts_response(
+            clinical_text=clinical_text,
             domain=domain,
             vocabulary=vocabulary,
             standard_only=standard_only,
             limit=limit,
         )
 
-        response = {
-            "query": result.query,
-            "concepts": [c.model_dump() for c in result.concepts],
-            "concept_ids": result.concept_ids,
-            "standard_concepts": [c.model_dump() for c in result.standard_concepts],
-            "search_metadata": result.search_metadata,
-            "timestamp": result.timestamp.isoformat(),
-        }
-
         logger.info(
             "discover_concepts_success",
             clinical_text=clinical_text,
-            concept_count=len(result.concepts),
+            concept_count=len(response["concepts"]),
         )
 
         return response
@@ -162,14 +225,11 @@ async def get_concept_relationships(
     )
 
     try:
-        client = AthenaAPIClient()
-        relationships = client.get_concept_relationships(
-            concept_id=concept_id, relationship_id=relationship_id
-        )
+        relationships = await resources.get_concept_relationships(concept_id, relationship_id)
 
         response = {
             "concept_id": concept_id,
-            "relationships": [r.model_dump() for r in relationships],
+            "relationships": relationships,
             "relationship_count": len(relationships),
         }
 
@@ -191,6 +251,78 @@ async def get_concept_relationships(
         raise
 
 
+@mcp.tool()
+async def get_concept_relationships_bulk(
+    ctx: Context,
+    concept_ids: list[int],
+    relationship_id: str | None = None,
+) -> dict[str, Any]:
+    """
+    Get relationships for several OMOP concepts in one call.
+
+    Lookups run concurrently (bounded by the ATHENA concurrency cap) and share
+    the same cache as get_concept_relationships, so building a concept set
+    costs roughly one round trip instead of one per concept.
+
+    Args:
+        concept_ids: OMOP concept IDs
+        relationship_id: Filter by relationship type (optional)
+
+    Returns:
+        Dictionary with:
+        - relationships: Relationship lists keyed by concept ID
+        - relationship_count: Total number of relationships found
+        - errors: Error messages keyed by concept ID, for lookups that failed
+
+    Example:
+        >>> result = await get_concept_relationships_bulk(ctx, concept_ids=[201826, 201820])
+        >>> print(f"Found {result['relationship_count']} relationships")
+    """
+    unique_concept_ids = list(dict.fromkeys(concept_ids))
+    logger.info(
+        "get_concept_relationships_bulk_called",
+        concept_count=len(unique_concept_ids),
+        relationship_id=relationship_id,
+    )
+
+    outcomes = await asyncio.gather(
+        *(
+            resources.get_concept_relationships(concept_id, relationship_id)
+            for concept_id in unique_concept_ids
+        ),
+        return_exceptions=True,
+    )
+
+    relationships: dict[int, list[dict[str, Any]]] = {}
+    errors: dict[int, str] = {}
+    for concept_id, outcome in zip(unique_concept_ids, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            logger.warning(
+                "get_concept_relationships_bulk_lookup_failed",
+                concept_id=concept_id,
+                error=str(outcome),
+            )
+            errors[concept_id] = str(outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            relationships[concept_id] = outcome
+
+    relationship_count = sum(len(rels) for rels in relationships.values())
+    logger.info(
+        "get_concept_relationships_bulk_success",
+        concept_count=len(unique_concept_ids),
+        relationship_count=relationship_count,
+        error_count=len(errors),
+    )
+
+    return {
+        "relationships": relationships,
+        "relationship_count": relationship_count,
+        "errors": errors,
+    }
+
+
 @mcp.tool()
 async def query_omop(
     ctx: Context,
@@ -269,12 +401,18 @@ async def query_omop(
     )
 
     try:
-        # Import here to avoid circular dependency
-        from omop_mcp.tools.query import query_by_concepts
+        # Overlapping discovery results repeat IDs; a deduplicated, sorted IN list is smaller
+        unique_concept_ids = sorted(set(concept_ids))
+        if len(unique_concept_ids) != len(concept_ids):
+            logger.debug(
+                "query_omop_concept_ids_deduplicated",
+                before=len(concept_ids),
+                after=len(unique_concept_ids),
+            )
 
         result: QueryOMOPResult = await query_by_concepts(
             query_type=query_type,
-            concept_ids=concept_ids,
+            concept_ids=unique_concept_ids,
             domain=domain,
             backend=backend,
             execute=execute,
@@ -289,7 +427,7 @@ async def query_omop(
             "estimated_bytes": result.estimated_bytes,
             "backend": result.backend,
             "dialect": result.dialect,
-            "timestamp": result.timestamp.isoformat(),
+            "timestamp": result.timestamp,
         }
 
         logger.info(
@@ -374,12 +512,10 @@ async def generate_cohort_sql(
     )
 
     try:
-        # Use dedicated sqlgen module
-        from omop_mcp.tools.sqlgen import generate_cohort_sql as generate_sql
-
+        # Same boundary dedup as query_omop; empty lists are rejected by sqlgen before any dry run
         result = await generate_sql(
-            exposure_concept_ids=exposure_concept_ids,
-            outcome_concept_ids=outcome_concept_ids,
+            exposure_concept_ids=sorted(set(exposure_concept_ids)),
+            outcome_concept_ids=sorted(set(outcome_concept_ids)),
             time_window_days=pre_outcome_days,
             backend=backend,
             validate=validate,
@@ -387,12 +523,13 @@ async def generate_cohort_sql(
 
         response = {
             "sql": result.sql,
+            "query_params": result.query_params,
             "validation": result.validation.model_dump() if result.validation else None,
             "concept_counts": result.concept_counts,
             "backend": result.backend,
             "dialect": result.dialect,
             "is_valid": result.is_valid,
-            "timestamp": result.timestamp.isoformat(),
+            "timestamp": result.timestamp,
         }
 
         logger.info(
@@ -540,10 +677,11 @@ async def select_query(
         limit=limit,
     )
 
+    backend_task: asyncio.Task[Any] | None = None
     try:
-        import time
-
-        from omop_mcp.backends.registry import get_backend
+        # Resolve the backend (first use may build a client) while validation runs
+        if execute:
+            backend_task = asyncio.create_task(asyncio.to_thread(get_backend, backend))
 
         # Validate SQL if requested
         validation_result = None
@@ -570,21 +708,19 @@ async def select_query(
         execution_time_ms = None
 
         if execute:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             try:
-                backend_impl = get_backend(backend)
+                backend_impl = await backend_task
 
-                # Apply row limit to SQL
-                sql_with_limit = sql
-                if "LIMIT" not in sql.upper():
-                    sql_with_limit = f"{sql.rstrip()}\nLIMIT {limit}"
+                # Apply row limit to SQL; only the statement tail can hold its LIMIT
+                sql_with_limit = _apply_row_limit(sql, limit)
 
                 # Execute query
                 results = await backend_impl.execute_query(sql_with_limit, limit)
                 row_count = len(results)
 
-                execution_time_ms = int((time.time() - start_time) * 1000)
+                execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             except Exception as e:
                 logger.error("query_execution_failed", error=str(e))
@@ -634,12 +770,35 @@ async def select_query(
         )
         raise
 
+    finally:
+        # Release a backend lookup that execution never awaited
+        if backend_task is not None:
+            if not backend_task.done():
+                backend_task.cancel()
+            elif not backend_task.cancelled():
+                backend_task.exception()
+
 
 # ============================================================================
 # MCP Resources
 # ============================================================================
 
 
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values orjson has no native support for (pydantic models, Decimal, ...)."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    return str(obj)
+
+
+def _to_json(payload: dict[str, Any]) -> str:
+    """Serialize a resource payload with orjson, keeping the indented layout."""
+    return orjson.dumps(payload, default=_json_default, option=_JSON_OPTIONS).decode()
+
+
 @mcp.resource("omop://concept/{concept_id}")
 async def get_concept(concept_id: int) -> str:
     """
@@ -648,9 +807,7 @@ async def get_concept(concept_id: int) -> str:
     Returns JSON with concept details from ATHENA API.
     """
     result = await resources.get_concept_resource(concept_id)
-    import json
-
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.resource("athena://search")
@@ -675,9 +832,7 @@ async def search_concepts(
         vocabulary=vocabulary,
         standard_only=standard_only,
     )
-    import json
-
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.resource("backend://capabilities")
@@ -688,9 +843,7 @@ async def backend_capabilities() -> str:
     Returns JSON with backend information.
     """
     result = await resources.get_backend_capabilities()
-    import json
-
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 # ============================================================================
@@ -767,6 +920,16 @@ async def multi_step_query_workflow(
 # ============================================================================
 
 
+def _install_fast_event_loop() -> str | None:
+    """Use uvloop (or winloop on Windows) for asyncio when the fast-loop extra is installed."""
+    for module_name in ("uvloop", "winloop"):
+        if importlib.util.find_spec(module_name) is not None:
+            loop_module = importlib.import_module(module_name)
+            asyncio.set_event_loop_policy(loop_module.EventLoopPolicy())
+            return module_name
+    return None
+
+
 def main():
     """Run the OMOP MCP server."""
     import argparse
@@ -780,10 +943,12 @@ def main():
     parser.add_argument("--host", default="0.0.0.0", help="HTTP server host (default: 0.0.0.0)")
 
     args = parser.parse_args()
+    event_loop = _install_fast_event_loop()
 
     logger.info(
         "omop_mcp_server_starting",
         log_level=config.log_level,
+        event_loop=event_loop or "asyncio",
         stdio=args.stdio,
         http=args.http,
         port=args.port if args.http else None,
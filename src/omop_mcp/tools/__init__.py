@@ -2,7 +2,7 @@
 OMOP MCP Tools - ATHENA API, query execution, and export tools.
 """
 
-from .athena import AthenaAPIClient, discover_concepts
+from .athena import AthenaAPIClient, discover_concepts, get_athena_client
 from .export import (
     export_cohort_definition,
     export_concept_set,
@@ -14,6 +14,7 @@ from .query import query_by_concepts
 __all__ = [
     "AthenaAPIClient",
     "discover_concepts",
+    "get_athena_client",
     "query_by_concepts",
     "export_concept_set",
     "export_sql_query",
@@ -6,11 +6,14 @@ Uses athena-client library to search for concepts and retrieve relationships.
 
 from __future__ import annotations
 
-from datetime import datetime
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 
 import structlog
 from athena_client import AthenaClient  # type: ignore[import-untyped]
 from athena_client.models import ConceptType  # type: ignore[import-untyped]
+from cachetools import TTLCache
 from pydantic import ValidationError
 
 from omop_mcp.config import config
@@ -22,6 +25,21 @@ from omop_mcp.models import (
 
 logger = structlog.get_logger(__name__)
 
+# ATHENA search results, already converted to OMOPConcept, keyed on (base_url, query).
+# Filters and limits are applied client-side, so every filter combination for a term
+# reuses one HTTP search and one round of conversions. The TTL must not exceed
+# resources.SEARCH_CACHE_TTL_SEC, or expiring that layer would replay stale results.
+SEARCH_RESULTS_CACHE_MAXSIZE = 1024
+SEARCH_RESULTS_CACHE_TTL_SEC = 300
+
+_search_results_cache: TTLCache[tuple[str, str], list[OMOPConcept]] = TTLCache(
+    maxsize=SEARCH_RESULTS_CACHE_MAXSIZE, ttl=SEARCH_RESULTS_CACHE_TTL_SEC
+)
+# Searches run in worker threads; cachetools caches are not thread-safe on their own
+_search_results_lock = threading.Lock()
+# Searches in flight, so threads missing the cache on the same term share one HTTP call
+_search_inflight: dict[tuple[str, str], Future[list[OMOPConcept]]] = {}
+
 
 class AthenaAPIClient:
     """
@@ -122,46 +140,75 @@ class AthenaAPIClient:
         )
 
         try:
-            # Use athena-client basic search
-            search_result = self.client.search(query)
-
-            # Convert athena-client results to our OMOPConcept model
-            # SearchResult itself is iterable
             concepts = []
-            for athena_concept in search_result:
-                try:
-                    concept = self._concept_to_omop(athena_concept)
+            for concept in self._search_results(query):
+                # Apply client-side filters
+                if domain and concept.domain_id != domain:
+                    continue
+                if vocabulary and concept.vocabulary_id != vocabulary:
+                    continue
+                if concept_class and concept.concept_class_id != concept_class:
+                    continue
+                if standard_only and not concept.is_standard():
+                    continue
 
-                    # Apply client-side filters
-                    if domain and concept.domain_id != domain:
-                        continue
-                    if vocabulary and concept.vocabulary_id != vocabulary:
-                        continue
-                    if concept_class and concept.concept_class_id != concept_class:
-                        continue
-                    if standard_only and not concept.is_standard():
-                        continue
+                concepts.append(concept)
 
-                    concepts.append(concept)
+                if len(concepts) >= limit:
+                    break
 
-                    if len(concepts) >= limit:
-                        break
+            logger.info("search_complete", query=query, result_count=len(concepts))
+            return concepts
 
+        except Exception as e:
+            logger.error("search_failed", query=query, error=str(e), exc_info=True)
+            raise
+
+    def _search_results(self, query: str) -> list[OMOPConcept]:
+        """
+        Run athena-client's basic search for a term as OMOPConcepts, reusing cached results.
+
+        Returns a new list each call, but the OMOPConcept instances are shared with the
+        cache and must be treated as read-only.
+        """
+        key = (self.base_url, query)
+        with _search_results_lock:
+            cached = _search_results_cache.get(key)
+            pending = None if cached is not None else _search_inflight.get(key)
+            if cached is None and pending is None:
+                owned: Future[list[OMOPConcept]] = Future()
+                _search_inflight[key] = owned
+        if cached is not None:
+            logger.debug("search_results_cache_hit", query=query)
+            return list(cached)
+        if pending is not None:
+            return list(pending.result())
+
+        try:
+            # Convert athena-client results to our OMOPConcept model
+            # SearchResult itself is iterable
+            concepts = []
+            for athena_concept in self.client.search(query):
+                try:
+                    concepts.append(self._concept_to_omop(athena_concept))
                 except (ValidationError, AttributeError) as e:
                     logger.warning(
                         "concept_validation_failed",
                         concept_id=getattr(athena_concept, "id", None),
                         error=str(e),
                     )
-                    continue
-
-            logger.info("search_complete", query=query, result_count=len(concepts))
-            return concepts
-
-        except Exception as e:
-            logger.error("search_failed", query=query, error=str(e), exc_info=True)
+        except BaseException as e:
+            with _search_results_lock:
+                del _search_inflight[key]
+            owned.set_exception(e)
             raise
 
+        with _search_results_lock:
+            _search_results_cache[key] = concepts
+            del _search_inflight[key]
+        owned.set_result(concepts)
+        return list(concepts)
+
     def get_concept_by_id(self, concept_id: int) -> OMOPConcept | None:
         """
         Retrieve a single concept by its ID.
@@ -260,6 +307,34 @@ class AthenaAPIClient:
             raise
 
 
+def get_athena_client(base_url: str | None = None) -> AthenaAPIClient:
+    """
+    Return a shared ATHENA client for base_url.
+
+    Reusing one client per base URL keeps the underlying HTTP connection pool
+    (and its TLS sessions) alive across requests.
+
+    Args:
+        base_url: ATHENA API base URL (defaults to config.athena_base_url)
+
+    Returns:
+        AthenaAPIClient shared by all callers using the same base URL
+    """
+    return _shared_client(base_url or config.athena_base_url)
+
+
+def clear_search_cache() -> None:
+    """Forget cached ATHENA search results."""
+    with _search_results_lock:
+        _search_results_cache.clear()
+
+
+@lru_cache(maxsize=4)
+def _shared_client(base_url: str) -> AthenaAPIClient:
+    """Build the AthenaAPIClient for a base URL once."""
+    return AthenaAPIClient(base_url=base_url)
+
+
 def discover_concepts(
     query: str,
     *,
@@ -298,7 +373,7 @@ def discover_concepts(
         limit=limit,
     )
 
-    client = AthenaAPIClient()
+    client = get_athena_client()
     concepts = client.search_concepts(
         query=query,
         domain=domain,
@@ -316,15 +391,15 @@ def discover_concepts(
             "standard_only": standard_only,
             "limit": limit,
         },
-        timestamp=datetime.now(),
     )
 
     logger.info(
         "discovery_complete",
         query=query,
         total_concepts=len(concepts),
-        standard_concepts=len(result.standard_concepts),
-        concept_ids=result.concept_ids,
+        standard_concepts=sum(c.is_standard() for c in concepts),
     )
+    # The full ID list can run to `limit` entries; keep it out of INFO payloads
+    logger.debug("discovery_concept_ids", query=query, concept_ids=result.concept_ids)
 
     return result
@@ -14,13 +14,31 @@ import gzip
 import json
 import logging
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-from omop_mcp.models import CohortSQLResult, ConceptDiscoveryResult, OMOPConcept
+from omop_mcp.models import (
+    CONCEPT_LIST_ADAPTER,
+    CohortSQLResult,
+    ConceptDiscoveryResult,
+    OMOPConcept,
+)
 
 logger = logging.getLogger(__name__)
 
+# Concept CSV columns; rows are read with one C-level attrgetter call per concept
+_CONCEPT_CSV_FIELDS = (
+    "concept_id",
+    "concept_name",
+    "domain_id",
+    "vocabulary_id",
+    "concept_class_id",
+    "standard_concept",
+    "concept_code",
+)
+_concept_csv_row = attrgetter(*_CONCEPT_CSV_FIELDS)
+
 
 class ExportError(Exception):
     """Exception raised when export operations fail."""
@@ -117,7 +135,7 @@ def _export_concepts_json(
 ) -> None:
     """Export concepts to JSON format."""
     data: dict[str, Any] = {
-        "concepts": [c.model_dump() for c in concepts],
+        "concepts": CONCEPT_LIST_ADAPTER.dump_python(concepts),
     }
 
     if include_metadata:
@@ -159,30 +177,10 @@ def _export_concepts_csv(
 
         # Write CSV
         if concepts:
-            fieldnames = [
-                "concept_id",
-                "concept_name",
-                "domain_id",
-                "vocabulary_id",
-                "concept_class_id",
-                "standard_concept",
-                "concept_code",
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)  # type: ignore[arg-type]
-            writer.writeheader()
-
-            for concept in concepts:
-                writer.writerow(
-                    {
-                        "concept_id": concept.concept_id,
-                        "concept_name": concept.concept_name,
-                        "domain_id": concept.domain_id,
-                        "vocabulary_id": concept.vocabulary_id,
-                        "concept_class_id": concept.concept_class_id,
-                        "standard_concept": concept.standard_concept or "",
-                        "concept_code": concept.concept_code,
-                    }
-                )
+            # csv.writer renders None (e.g. a non-standard concept's flag) as an empty field
+            writer = csv.writer(f)  # type: ignore[arg-type]
+            writer.writerow(_CONCEPT_CSV_FIELDS)
+            writer.writerows(map(_concept_csv_row, concepts))
 
 
 def export_sql_query(
@@ -8,11 +8,10 @@ Provides safe query execution with security guards:
 - PHI protection (list_patients requires flag)
 """
 
-from datetime import datetime
-
 import structlog
 
-from omop_mcp.backends.registry import get_backend
+from omop_mcp.backends.base import sql_id_list
+from omop_mcp.backends.registry import backend_supports, get_backend
 from omop_mcp.config import config
 from omop_mcp.models import QueryOMOPResult
 
@@ -102,7 +101,7 @@ async def query_by_concepts(
     # Security: Pydantic already validated concept_ids as List[int]
     # Convert to comma-separated string for SQL
     # TODO v1.1: Refactor to parameterized queries
-    concept_list = ",".join(map(str, concept_ids))
+    concept_list = sql_id_list(concept_ids)
 
     # Generate SQL based on query type
     if query_type == "count":
@@ -146,8 +145,16 @@ LIMIT {limit}
 
     logger.info("sql_generated", query_type=query_type, sql_length=len(sql))
 
-    # Validate SQL (dry-run)
-    validation = await backend_impl.validate_sql(sql)
+    results = None
+    row_count = None
+
+    if execute and backend_supports(backend_impl.name, "validate_execute"):
+        # Free local backends: one parse/plan serves both validation and execution
+        validate_and_execute = backend_impl.validate_and_execute  # type: ignore[attr-defined]
+        validation, results = await validate_and_execute(sql, limit, trusted=True)
+    else:
+        # Validate SQL (dry-run)
+        validation = await backend_impl.validate_sql(sql)
 
     if not validation.valid:
         logger.error(
@@ -163,14 +170,14 @@ LIMIT {limit}
             estimated_bytes=None,
             backend=backend_impl.name,
             dialect=backend_impl.dialect,
-            timestamp=datetime.now(),
         )
 
-    # Check cost limit if executing
-    results = None
-    row_count = None
+    if results is not None:
+        # Already executed as part of validation
+        row_count = len(results)
+        logger.info("query_executed", query_type=query_type, row_count=row_count)
 
-    if execute:
+    elif execute:
         # Security: enforce cost cap
         estimated_cost = validation.estimated_cost_usd or 0.0
         if estimated_cost > config.max_query_cost_usd:
@@ -188,8 +195,9 @@ LIMIT {limit}
             estimated_bytes=validation.estimated_bytes,
         )
 
-        # Execute with security guards (mutation blocking, LIMIT injection)
-        results = await backend_impl.execute_query(sql, limit)
+        # Execute with LIMIT injection; the SQL above is built only from fixed table/column
+        # names and integer IDs, so the mutation parse is skipped
+        results = await backend_impl.execute_query(sql, limit, trusted=True)
         row_count = len(results)
 
         logger.info(
@@ -207,5 +215,4 @@ LIMIT {limit}
         estimated_bytes=validation.estimated_bytes,
         backend=backend_impl.name,
         dialect=backend_impl.dialect,
-        timestamp=datetime.now(),
     )
@@ -8,12 +8,21 @@ including table structures, column definitions, and OMOP CDM metadata.
 from typing import Any
 
 import structlog
+from cachetools import TTLCache
 
 from omop_mcp.backends.registry import get_backend
 from omop_mcp.tools.sql_validator import get_omop_table_info
 
 logger = structlog.get_logger(__name__)
 
+# OMOP CDM table layouts only change when the warehouse is redeployed
+SCHEMA_CACHE_MAXSIZE = 512
+SCHEMA_CACHE_TTL_SEC = 86_400
+
+_schema_cache: TTLCache[tuple[str, str], dict[str, Any]] = TTLCache(
+    maxsize=SCHEMA_CACHE_MAXSIZE, ttl=SCHEMA_CACHE_TTL_SEC
+)
+
 # OMOP CDM table descriptions
 OMOP_TABLE_DESCRIPTIONS = get_omop_table_info()
 
@@ -134,8 +143,14 @@ async def get_table_schema(table_name: str, backend_name: str = "bigquery") -> d
         backend_name: Database backend to query
 
     Returns:
-        Dictionary containing table schema information
+        Dictionary containing table schema information (cached; treat as read-only)
     """
+    key = (backend_name, table_name)
+    cached = _schema_cache.get(key)
+    if cached is not None:
+        logger.debug("table_schema_cache_hit", table=table_name, backend=backend_name)
+        return cached
+
     logger.info("getting_table_schema", table=table_name, backend=backend_name)
 
     try:
@@ -182,6 +197,9 @@ async def get_table_schema(table_name: str, backend_name: str = "bigquery") -> d
             "schema_source": "INFORMATION_SCHEMA",
         }
 
+        # A missing table has no columns yet; don't hide it once it is created
+        if enhanced_columns:
+            _schema_cache[key] = result
         logger.info("table_schema_retrieved", table=table_name, columns=len(enhanced_columns))
         return result
 
@@ -190,6 +208,11 @@ async def get_table_schema(table_name: str, backend_name: str = "bigquery") -> d
         raise
 
 
+def clear_schema_cache() -> None:
+    """Forget cached table schemas, e.g. after the warehouse has been redeployed."""
+    _schema_cache.clear()
+
+
 async def get_all_tables_schema(
     backend_name: str = "bigquery", include_non_omop: bool = False
 ) -> dict[str, Any]:
@@ -225,8 +248,8 @@ async def get_all_tables_schema(
 
         # Filter OMOP tables if requested
         if not include_non_omop:
-            omop_tables = set(OMOP_TABLE_DESCRIPTIONS.keys())
-            tables = [t for t in tables if t["table_name"] in omop_tables]
+            # Dict membership is already a hash lookup; no need to copy the keys per call
+            tables = [t for t in tables if t["table_name"] in OMOP_TABLE_DESCRIPTIONS]
 
         # Get detailed schema for each table
         table_schemas = {}
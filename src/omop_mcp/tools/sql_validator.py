@@ -6,6 +6,7 @@ including syntax validation, security checks, table allowlisting, and
 column blocking for PHI protection.
 """
 
+import re
 from typing import Any
 
 import structlog
@@ -18,6 +19,25 @@ from omop_mcp.models import SQLValidationResult
 
 logger = structlog.get_logger(__name__)
 
+_DANGEROUS_KEYWORDS = (
+    "DELETE",
+    "UPDATE",
+    "DROP",
+    "TRUNCATE",
+    "ALTER",
+    "INSERT",
+    "MERGE",
+    "CREATE",
+    "REPLACE",
+)
+
+# One case-insensitive pass over the raw SQL instead of upper-casing it and
+# scanning once per keyword; a literal alternation cannot backtrack. Word
+# boundaries keep names like created_at or 'Concept replaced by' from matching.
+_MUTATION_RE = re.compile(r"\b(?:" + "|".join(_DANGEROUS_KEYWORDS) + r")\b", re.IGNORECASE)
+
+_READ_ONLY_PREFIXES = ("SELECT", "WITH")
+
 
 class SQLValidationError(Exception):
     """Base exception for SQL validation errors."""
@@ -55,18 +75,19 @@ class SQLSyntaxError(SQLValidationError):
     pass
 
 
-def extract_table_names(sql: str) -> set[str]:
+def extract_table_names(sql: str, *, tree: exp.Expression | None = None) -> set[str]:
     """
     Extract table names from SQL query.
 
     Args:
         sql: SQL query string
+        tree: Already-parsed SQL, to skip parsing it again
 
     Returns:
         Set of table names referenced in the query
     """
     try:
-        parsed = parse_one(sql)
+        parsed = tree if tree is not None else parse_one(sql)
         if not parsed:
             return set()
 
@@ -92,18 +113,19 @@ def extract_table_names(sql: str) -> set[str]:
         return set()
 
 
-def extract_column_names(sql: str) -> set[str]:
+def extract_column_names(sql: str, *, tree: exp.Expression | None = None) -> set[str]:
     """
     Extract column names from SQL query.
 
     Args:
         sql: SQL query string
+        tree: Already-parsed SQL, to skip parsing it again
 
     Returns:
         Set of column names referenced in the query
     """
     try:
-        parsed = parse_one(sql)
+        parsed = tree if tree is not None else parse_one(sql)
         if not parsed:
             return set()
 
@@ -120,13 +142,16 @@ def extract_column_names(sql: str) -> set[str]:
         return set()
 
 
-def validate_sql_syntax(sql: str | None) -> None:
+def validate_sql_syntax(sql: str | None) -> exp.Expression:
     """
     Validate SQL syntax using SQLGlot.
 
     Args:
         sql: SQL query string
 
+    Returns:
+        The parsed SQL, for reuse by the other checks
+
     Raises:
         SQLSyntaxError: If SQL syntax is invalid
     """
@@ -139,6 +164,21 @@ def validate_sql_syntax(sql: str | None) -> None:
             raise SQLSyntaxError("Empty or invalid SQL query")
     except ParseError as e:
         raise SQLSyntaxError(f"Invalid SQL syntax: {e}") from e
+    return parsed
+
+
+def fast_mutation_check(sql: str) -> str | None:
+    """
+    Find the first dangerous keyword in SQL without parsing it.
+
+    Args:
+        sql: SQL query string
+
+    Returns:
+        The matched keyword (upper-cased), or None if the SQL has none
+    """
+    match = _MUTATION_RE.search(sql)
+    return match.group().upper() if match else None
 
 
 def validate_security(sql: str) -> None:
@@ -151,39 +191,26 @@ def validate_security(sql: str) -> None:
     Raises:
         SecurityViolationError: If dangerous operations are detected
     """
-    sql_upper = sql.upper()
+    keyword = fast_mutation_check(sql)
+    if keyword is not None:
+        raise SecurityViolationError(f"Operation '{keyword}' not allowed")
 
-    # Block dangerous keywords
-    dangerous_keywords = [
-        "DELETE",
-        "UPDATE",
-        "DROP",
-        "TRUNCATE",
-        "ALTER",
-        "INSERT",
-        "MERGE",
-        "CREATE",
-        "REPLACE",
-    ]
-
-    for keyword in dangerous_keywords:
-        if keyword in sql_upper:
-            raise SecurityViolationError(f"Operation '{keyword}' not allowed")
+    _validate_read_only_prefix(sql)
 
-    # Ensure it's a read-only statement (SELECT, WITH, or other read-only patterns)
-    sql_stripped = sql_upper.strip()
-    read_only_patterns = ["SELECT", "WITH"]
 
-    if not any(sql_stripped.startswith(pattern) for pattern in read_only_patterns):
+def _validate_read_only_prefix(sql: str) -> None:
+    """Ensure it's a read-only statement (SELECT, WITH, or other read-only patterns)."""
+    if not sql.lstrip()[:6].upper().startswith(_READ_ONLY_PREFIXES):
         raise SecurityViolationError("Only SELECT and WITH (CTE) statements are allowed")
 
 
-def validate_table_allowlist(sql: str) -> None:
+def validate_table_allowlist(sql: str, *, tree: exp.Expression | None = None) -> None:
     """
     Validate that only allowlisted OMOP tables are accessed.
 
     Args:
         sql: SQL query string
+        tree: Already-parsed SQL, to skip parsing it again
 
     Raises:
         TableNotAllowedError: If non-allowlisted table is accessed
@@ -191,36 +218,38 @@ def validate_table_allowlist(sql: str) -> None:
     if not config.strict_table_validation:
         return
 
-    tables = extract_table_names(sql)
-    allowed_tables = {table.lower() for table in config.omop_allowed_tables}
+    tables = extract_table_names(sql, tree=tree)
+    allowed_tables = config.omop_allowed_tables
 
-    for table in tables:
-        if table not in allowed_tables:
-            raise TableNotAllowedError(
-                f"Table '{table}' not in allowlist. "
-                f"Allowed tables: {', '.join(sorted(allowed_tables))}"
-            )
+    # One C-level set operation instead of a membership test per table
+    disallowed = tables.difference(allowed_tables)
+    if disallowed:
+        raise TableNotAllowedError(
+            f"Table '{min(disallowed)}' not in allowlist. "
+            f"Allowed tables: {', '.join(sorted(allowed_tables))}"
+        )
 
 
-def validate_column_blocklist(sql: str) -> None:
+def validate_column_blocklist(sql: str, *, tree: exp.Expression | None = None) -> None:
     """
     Validate that blocked PHI columns are not accessed.
 
     Args:
         sql: SQL query string
+        tree: Already-parsed SQL, to skip parsing it again
 
     Raises:
         ColumnBlockedError: If blocked column is accessed
     """
-    columns = extract_column_names(sql)
-    blocked_columns = {col.lower() for col in config.omop_blocked_columns}
-
-    for column in columns:
-        if column in blocked_columns:
-            raise ColumnBlockedError(
-                f"Column '{column}' contains PHI and is blocked. "
-                f"Blocked columns: {', '.join(sorted(blocked_columns))}"
-            )
+    columns = extract_column_names(sql, tree=tree)
+    blocked_columns = config.omop_blocked_columns
+
+    blocked = columns.intersection(blocked_columns)
+    if blocked:
+        raise ColumnBlockedError(
+            f"Column '{min(blocked)}' contains PHI and is blocked. "
+            f"Blocked columns: {', '.join(sorted(blocked_columns))}"
+        )
 
 
 def validate_row_limit(sql: str, limit: int = 1000) -> str:
@@ -265,17 +294,22 @@ async def validate_sql_comprehensive(
     logger.info("validating_sql", sql_length=len(sql), backend=backend_name)
 
     try:
-        # 1. Syntax validation
-        validate_sql_syntax(sql)
+        # 0. Reject obvious mutations before paying for a full parse
+        keyword = fast_mutation_check(sql)
+        if keyword is not None:
+            raise SecurityViolationError(f"Operation '{keyword}' not allowed")
+
+        # 1. Syntax validation; the parsed tree is shared by steps 3 and 4
+        tree = validate_sql_syntax(sql)
 
-        # 2. Security validation
-        validate_security(sql)
+        # 2. Security validation; the keyword scan already ran in step 0
+        _validate_read_only_prefix(sql)
 
         # 3. Table allowlist validation
-        validate_table_allowlist(sql)
+        validate_table_allowlist(sql, tree=tree)
 
         # 4. Column blocklist validation
-        validate_column_blocklist(sql)
+        validate_column_blocklist(sql, tree=tree)
 
         # 5. Row limit enforcement
         sql_with_limit = validate_row_limit(sql, limit)
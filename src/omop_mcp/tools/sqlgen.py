@@ -11,6 +11,7 @@ from typing import Any
 
 import structlog
 
+from omop_mcp.backends.base import sql_id_list
 from omop_mcp.backends.registry import get_backend
 from omop_mcp.models import CohortSQLResult, OMOPDomain
 
@@ -48,6 +49,7 @@ async def generate_cohort_sql(
     Returns:
         CohortSQLResult with:
         - sql: Generated SQL query
+        - query_params: Named parameters the SQL references (e.g. BigQuery @exposure_ids)
         - validation: Validation result (cost, bytes, etc.)
         - concept_counts: Exposure/outcome concept counts
         - backend: Backend name
@@ -98,7 +100,7 @@ async def generate_cohort_sql(
         # Validate if requested
         validation_result = None
         if validate:
-            validation_result = await backend_impl.validate_sql(sql)
+            validation_result = await backend_impl.validate_sql(sql, params=cohort_parts.params)
             logger.info(
                 "sql_validated",
                 is_valid=validation_result.valid,
@@ -108,6 +110,7 @@ async def generate_cohort_sql(
 
         result = CohortSQLResult(
             sql=sql,
+            query_params=cohort_parts.params,
             validation=validation_result,
             concept_counts={
                 "exposure": len(exposure_concept_ids),
@@ -204,7 +207,7 @@ async def generate_simple_query(
         concept_col = f"{domain_str.lower()}_concept_id"
 
         # Generate SQL based on query type
-        concept_list = ",".join(map(str, concept_ids))
+        concept_list = sql_id_list(concept_ids)
 
         if query_type == "count":
             sql = f"""
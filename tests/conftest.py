@@ -14,3 +14,23 @@ def setup_test_env():
 
     if not os.getenv("ATHENA_BASE_URL"):
         os.environ["ATHENA_BASE_URL"] = "https://athena.ohdsi.org/api/v1"
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_athena_client():
+    """Drop the shared ATHENA client so each test builds one against its own mocks."""
+    from omop_mcp.tools.athena import _shared_client
+
+    _shared_client.cache_clear()
+    yield
+    _shared_client.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_search_results_cache():
+    """Start each test without cached ATHENA search results."""
+    from omop_mcp.tools.athena import clear_search_cache
+
+    clear_search_cache()
+    yield
+    clear_search_cache()
@@ -1,5 +1,8 @@
 """Tests for ATHENA API client."""
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
@@ -49,6 +52,60 @@ class TestAthenaAPIClient:
         assert isinstance(results[0], OMOPConcept)
         mock_client_instance.search.assert_called_once()
 
+    @patch("omop_mcp.tools.athena.AthenaClient")
+    def test_search_concepts_reuses_raw_search(self, mock_athena_client_class, mock_athena_concept):
+        """Different filters and limits for one term share a single ATHENA search."""
+        mock_client_instance = Mock()
+        mock_client_instance.search.return_value = [mock_athena_concept]
+        mock_athena_client_class.return_value = mock_client_instance
+
+        client = AthenaAPIClient()
+        first = client.search_concepts("diabetes", limit=10)
+        second = client.search_concepts("diabetes", domain="Condition", limit=5)
+        client.search_concepts("asthma", limit=10)
+
+        assert [c.concept_id for c in first] == [c.concept_id for c in second]
+        assert mock_client_instance.search.call_count == 2
+
+    @patch("omop_mcp.tools.athena.AthenaClient")
+    def test_cached_search_results_are_copied(self, mock_athena_client_class, mock_athena_concept):
+        """Mutating a returned result list does not change the cached search."""
+        mock_client_instance = Mock()
+        mock_client_instance.search.return_value = [mock_athena_concept]
+        mock_athena_client_class.return_value = mock_client_instance
+
+        client = AthenaAPIClient()
+        client._search_results("diabetes").clear()
+
+        assert len(client._search_results("diabetes")) == 1
+        mock_client_instance.search.assert_called_once()
+
+    @patch("omop_mcp.tools.athena.AthenaClient")
+    def test_concurrent_searches_share_one_call(
+        self, mock_athena_client_class, mock_athena_concept
+    ):
+        """Threads that miss the cache on the same term wait for a single ATHENA search."""
+        started = threading.Event()
+
+        def slow_search(query):
+            started.set()
+            time.sleep(0.05)
+            return [mock_athena_concept]
+
+        mock_client_instance = Mock()
+        mock_client_instance.search.side_effect = slow_search
+        mock_athena_client_class.return_value = mock_client_instance
+
+        client = AthenaAPIClient()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            first = pool.submit(client.search_concepts, "diabetes")
+            started.wait()
+            others = [pool.submit(client.search_concepts, "diabetes") for _ in range(3)]
+            results = [first.result()] + [f.result() for f in others]
+
+        assert all(len(r) == 1 for r in results)
+        mock_client_instance.search.assert_called_once_with("diabetes")
+
     @patch("omop_mcp.tools.athena.AthenaClient")
     @patch("omop_mcp.tools.athena.ConceptType")
     def test_search_concepts_with_filters(
@@ -161,3 +218,14 @@ def test_discover_concepts(mock_concept_type, mock_athena_client_class):
     assert len(result.concepts) > 0
     assert len(result.standard_concepts) > 0
     assert 201826 in result.concept_ids
+
+
+@patch("omop_mcp.tools.athena.AthenaClient")
+def test_get_athena_client_is_shared(mock_athena_client_class):
+    """One AthenaAPIClient is reused per base URL."""
+    from omop_mcp.tools.athena import get_athena_client
+
+    first = get_athena_client()
+    assert get_athena_client() is first
+    assert get_athena_client("https://example.org/api/v1") is not first
+    assert mock_athena_client_class.call_count == 2
@@ -2,12 +2,16 @@
 Tests for OAuth 2.1 authentication and authorization.
 """
 
+import asyncio
+import json
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import jwt
 import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
 from omop_mcp.auth import (
+    AsyncJWKSClient,
     AuthenticationError,
     AuthorizationError,
     OAuthValidator,
@@ -47,6 +51,13 @@ class TestParseBearerToken:
         token = parse_bearer_token(header)
         assert token == "test.token.here"
 
+    def test_extra_whitespace_tolerated(self):
+        """Accept surrounding whitespace, reject embedded whitespace in the token."""
+        assert parse_bearer_token("Bearer   test.token.here ") == "test.token.here"
+
+        with pytest.raises(AuthenticationError, match="Invalid Authorization header"):
+            parse_bearer_token("Bearer test.token\there")
+
 
 class TestOAuthValidator:
     """Tests for OAuth validator."""
@@ -63,6 +74,15 @@ class TestOAuthValidator:
         assert validator.issuer == "https://auth.example.com"
         assert validator.audience == "omop-mcp-api"
 
+    @patch("omop_mcp.auth.PyJWKClient")
+    def test_jwks_client_caches_parsed_keys(self, mock_jwks_client_class):
+        """The JWKS client keeps parsed signing keys per key ID."""
+        OAuthValidator(issuer="https://auth.example.com", audience="omop-mcp-api")
+
+        mock_jwks_client_class.assert_called_once_with(
+            "https://auth.example.com/.well-known/jwks.json", cache_keys=True
+        )
+
     def test_validate_token_returns_anonymous_when_disabled(self):
         """Return anonymous user when OAuth disabled."""
         validator = OAuthValidator(issuer=None, audience=None)
@@ -158,6 +178,77 @@ class TestOAuthValidator:
             with pytest.raises(AuthenticationError, match="issuer mismatch"):
                 validator.validate_token("wrong.issuer.token")
 
+    @patch("omop_mcp.auth.PyJWKClient")
+    def test_validate_token_caches_repeat_tokens(self, mock_jwks_client_class):
+        """Repeat tokens are served from cache without re-verifying."""
+        mock_signing_key = MagicMock()
+        mock_signing_key.key = "test-public-key"
+
+        mock_jwks_client = MagicMock()
+        mock_jwks_client.get_signing_key_from_jwt.return_value = mock_signing_key
+        mock_jwks_client_class.return_value = mock_jwks_client
+
+        validator = OAuthValidator(issuer="https://auth.example.com", audience="omop-mcp-api")
+
+        with patch("omop_mcp.auth.jwt.decode") as mock_decode:
+            mock_decode.return_value = {"sub": "user123", "exp": int(time.time()) + 3600}
+
+            first = validator.validate_token("repeat.jwt.token")
+            second = validator.validate_token("repeat.jwt.token")
+
+            assert first == second
+            assert mock_decode.call_count == 1
+
+    @patch("omop_mcp.auth.PyJWKClient")
+    def test_validate_token_caches_failures(self, mock_jwks_client_class):
+        """Failed validations are cached briefly."""
+        mock_signing_key = MagicMock()
+        mock_signing_key.key = "test-public-key"
+
+        mock_jwks_client = MagicMock()
+        mock_jwks_client.get_signing_key_from_jwt.return_value = mock_signing_key
+        mock_jwks_client_class.return_value = mock_jwks_client
+
+        validator = OAuthValidator(issuer="https://auth.example.com", audience="omop-mcp-api")
+
+        with patch("omop_mcp.auth.jwt.decode") as mock_decode:
+            mock_decode.side_effect = jwt.ExpiredSignatureError("Token expired")
+
+            for _ in range(3):
+                with pytest.raises(AuthenticationError, match="Token has expired"):
+                    validator.validate_token("expired.jwt.token")
+
+            assert mock_decode.call_count == 1
+
+    @patch("omop_mcp.auth.PyJWKClient")
+    def test_validate_token_keeps_claims_unchanged(self, mock_jwks_client_class):
+        """Validated payloads hold only the token's claims; roles come from the roles claim."""
+        mock_signing_key = MagicMock()
+        mock_signing_key.key = "test-public-key"
+
+        mock_jwks_client = MagicMock()
+        mock_jwks_client.get_signing_key_from_jwt.return_value = mock_signing_key
+        mock_jwks_client_class.return_value = mock_jwks_client
+
+        validator = OAuthValidator(issuer="https://auth.example.com", audience="omop-mcp-api")
+
+        with patch("omop_mcp.auth.jwt.decode") as mock_decode:
+            mock_decode.return_value = {"sub": "user123", "roles": ["researcher"]}
+
+            payload = validator.validate_token("roles.jwt.token")
+
+        assert payload == {"sub": "user123", "roles": ["researcher"]}
+        assert validator.check_permission(payload, "researcher") is True
+        assert validator.check_permission(payload, "admin") is False
+
+    def test_check_permission_string_roles_claim(self):
+        """A single-role string claim is matched whole, not as a substring."""
+        validator = OAuthValidator(issuer="https://auth.example.com", audience="omop-mcp-api")
+        payload = {"sub": "user123", "roles": "administrator"}
+
+        assert validator.check_permission(payload, "admin") is False
+        assert validator.check_permission(payload, "administrator") is True
+
     def test_check_permission_with_required_role(self):
         """Check user has required role."""
         validator = OAuthValidator(issuer="https://auth.example.com", audience="omop-mcp-api")
@@ -264,6 +355,71 @@ class TestGlobalValidator:
             assert payload["roles"] == ["researcher"]
 
 
+class TestAsyncJWKSClient:
+    """Tests for non-blocking JWKS fetching."""
+
+    def setup_method(self):
+        """Create an RSA key pair and its JWKS document."""
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        jwk.update({"kid": "key-1", "alg": "RS256", "use": "sig"})
+        self.jwks = {"keys": [jwk]}
+
+    def _mock_http_client(self):
+        response = MagicMock()
+        response.json.return_value = self.jwks
+        http_client = MagicMock()
+        http_client.get = AsyncMock(return_value=response)
+        return http_client
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Concurrent lookups for an uncached key trigger a single JWKS request."""
+        http_client = self._mock_http_client()
+        client = AsyncJWKSClient("https://auth.example.com/.well-known/jwks.json")
+
+        with patch("omop_mcp.auth._get_http_client", return_value=http_client):
+            keys = await asyncio.gather(*(client.get_signing_key("key-1") for _ in range(5)))
+
+        assert http_client.get.await_count == 1
+        assert all(key is keys[0] for key in keys)
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_raises(self):
+        """A key ID missing from the JWKS is an authentication error."""
+        http_client = self._mock_http_client()
+        client = AsyncJWKSClient("https://auth.example.com/.well-known/jwks.json")
+
+        with patch("omop_mcp.auth._get_http_client", return_value=http_client):
+            with pytest.raises(AuthenticationError, match="signing key"):
+                await client.get_signing_key("other-key")
+
+    @pytest.mark.asyncio
+    async def test_avalidate_token(self):
+        """Tokens signed by a JWKS key validate through the async path."""
+        http_client = self._mock_http_client()
+        validator = OAuthValidator(issuer="https://auth.example.com", audience="omop-mcp-api")
+        token = jwt.encode(
+            {
+                "sub": "user123",
+                "roles": ["researcher"],
+                "iss": "https://auth.example.com",
+                "aud": "omop-mcp-api",
+                "iat": int(time.time()),
+                "exp": int(time.time()) + 3600,
+            },
+            self.private_key,
+            algorithm="RS256",
+            headers={"kid": "key-1"},
+        )
+
+        with patch("omop_mcp.auth._get_http_client", return_value=http_client):
+            payload = await validator.avalidate_token(token)
+
+        assert payload["sub"] == "user123"
+        assert validator.check_permission(payload, "researcher") is True
+
+
 class TestAuthenticationScenarios:
     """Integration tests for authentication scenarios."""
 
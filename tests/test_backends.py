@@ -1,7 +1,18 @@
 """Tests for backend registry."""
 
+import subprocess
+import sys
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
 import pytest
-from omop_mcp.backends import get_backend, list_backends
+from omop_mcp.backends import BigQueryBackend, get_backend, list_backends
+from omop_mcp.backends.base import (
+    CohortDialect,
+    build_cohort_parts,
+    ensure_safe_and_limited,
+    sql_id_list,
+)
 
 
 def test_backend_registry_initialized():
@@ -29,6 +40,38 @@ def test_get_backend_invalid():
         get_backend("invalid_backend")
 
 
+def test_backends_instantiated_lazily():
+    """Backends are built on first get_backend() call, not at import."""
+    from omop_mcp.backends import registry
+
+    factory = MagicMock(return_value=MagicMock(dialect="duckdb"))
+    factory.dialect = "duckdb"
+    registry.register_backend_factory("lazy_test", factory)
+    try:
+        assert list_backends()["lazy_test"]["dialect"] == "duckdb"
+        factory.assert_not_called()
+
+        first = get_backend("lazy_test")
+        second = get_backend("lazy_test")
+        assert first is second
+        factory.assert_called_once()
+    finally:
+        registry._factories.pop("lazy_test", None)
+        registry._backends.pop("lazy_test", None)
+
+
+def test_backend_import_defers_driver_imports():
+    """Importing the backends package does not load the DuckDB or Snowflake drivers."""
+    code = (
+        "import sys, omop_mcp.backends; "
+        "print('duckdb' in sys.modules, 'snowflake.connector' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
 def test_list_backends_returns_dict():
     """Test that list_backends returns proper structure."""
     backends = list_backends()
@@ -42,3 +85,150 @@ def test_list_backends_returns_dict():
     assert "name" in bq
     assert bq["dialect"] == "bigquery"
     assert "cost_estimate" in bq["features"]
+
+
+def test_sql_id_list():
+    """Integer IDs render as a SQL list body; non-integers are rejected."""
+    assert sql_id_list([201826, 4329847, 1]) == "201826,4329847,1"
+    assert sql_id_list((7,)) == "7"
+    assert sql_id_list([]) == ""
+
+    with pytest.raises(TypeError):
+        sql_id_list(["1) OR (1=1"])  # type: ignore[list-item]
+    with pytest.raises(TypeError):
+        sql_id_list([1.9])  # type: ignore[list-item]
+    with pytest.raises(TypeError):
+        sql_id_list([Decimal("201826")])  # type: ignore[list-item]
+
+
+def test_ensure_safe_and_limited():
+    """Untrusted SQL gets the mutation check; all SQL gets a LIMIT when missing."""
+    assert ensure_safe_and_limited("SELECT 1", 10, "duckdb") == "SELECT 1\nLIMIT 10"
+    assert ensure_safe_and_limited("SELECT 1 LIMIT 5", 10, "duckdb") == "SELECT 1 LIMIT 5"
+
+    with pytest.raises(ValueError, match="Mutating queries not allowed"):
+        ensure_safe_and_limited("DELETE FROM person", 10, "duckdb")
+
+    with patch("omop_mcp.backends.base.contains_mutation") as mock_check:
+        sql = ensure_safe_and_limited("SELECT COUNT(*) FROM person", 10, "duckdb", trusted=True)
+    mock_check.assert_not_called()
+    assert sql.endswith("LIMIT 10")
+
+
+def test_build_cohort_parts_fills_dialect_fragments():
+    """The shared cohort template takes only the dialect's fragments and table names."""
+    dialect = CohortDialect(
+        exposure_ids="UNNEST(@exposure_ids)",
+        outcome_ids="UNNEST(@outcome_ids)",
+        days_to_outcome="DAYS(e.exposure_date, o.outcome_date)",
+        window_end="PLUS_DAYS(e.exposure_date, {days})",
+    )
+
+    parts = build_cohort_parts(
+        dialect,
+        exposure_table="cdm.drug_exposure",
+        outcome_table="cdm.condition_occurrence",
+        exposure_ids=(1503297,),
+        outcome_ids=[46271022],
+        pre_outcome_days=30,
+    )
+
+    assert "FROM cdm.drug_exposure" in parts.exposure_cte
+    assert "drug_concept_id IN UNNEST(@exposure_ids)" in parts.exposure_cte
+    assert "condition_concept_id IN UNNEST(@outcome_ids)" in parts.outcome_cte
+    assert "DAYS(e.exposure_date, o.outcome_date) AS days_to_outcome" in parts.cohort_cte
+    assert "o.outcome_date <= PLUS_DAYS(e.exposure_date, 30)" in parts.cohort_cte
+    assert parts.params == {"exposure_ids": [1503297], "outcome_ids": [46271022]}
+
+
+@pytest.mark.asyncio
+async def test_bigquery_execute_blocks_mutating_queries():
+    """Mutating statements are rejected before reaching BigQuery."""
+    backend = BigQueryBackend()
+
+    with pytest.raises(ValueError, match="Mutating queries not allowed"):
+        await backend.execute_query("delete from person where person_id = 1")
+
+
+@pytest.mark.asyncio
+async def test_bigquery_execute_allows_keyword_prefixed_columns():
+    """Columns such as updated_at do not trip the mutation check."""
+    backend = BigQueryBackend()
+    mock_client = MagicMock()
+    mock_client.query.return_value.result.return_value = [{"updated_at": "2024-01-01"}]
+
+    with patch.object(backend, "_get_client", return_value=mock_client):
+        rows = await backend.execute_query("SELECT updated_at FROM person", limit=5)
+
+    assert rows == [{"updated_at": "2024-01-01"}]
+    executed_sql = mock_client.query.call_args[0][0]
+    assert executed_sql.endswith("LIMIT 5")
+
+
+@pytest.mark.asyncio
+async def test_bigquery_cohort_sql_binds_concept_ids_as_parameters():
+    """Concept IDs are passed as array parameters, not interpolated into the SQL."""
+    backend = BigQueryBackend()
+
+    parts = await backend.build_cohort_sql(
+        exposure_ids=[1503297], outcome_ids=[46271022], pre_outcome_days=90
+    )
+
+    assert "IN UNNEST(@exposure_ids)" in parts.exposure_cte
+    assert "IN UNNEST(@outcome_ids)" in parts.outcome_cte
+    assert "1503297" not in parts.to_sql()
+    assert parts.params == {"exposure_ids": [1503297], "outcome_ids": [46271022]}
+
+    mock_client = MagicMock()
+    mock_client.query.return_value.total_bytes_processed = 0
+
+    with patch.object(backend, "_get_client", return_value=mock_client):
+        result = await backend.validate_sql(parts.to_sql(), params=parts.params)
+
+    assert result.valid is True
+    job_config = mock_client.query.call_args.kwargs["job_config"]
+    assert [p.name for p in job_config.query_parameters] == ["exposure_ids", "outcome_ids"]
+
+
+def test_bigquery_query_parameters_typed_by_value():
+    """Array parameters take their element type from the values instead of assuming INT64."""
+    from omop_mcp.backends.bigquery import _query_parameters
+
+    params = _query_parameters(
+        {
+            "ids": [1503297, 46271022],
+            "vocabularies": ["SNOMED", "RxNorm"],
+            "weights": [1, 2.5],
+            "empty": [],
+            "days": 90,
+            "flag": True,
+        }
+    )
+    by_name = {p.name: p for p in params}
+
+    assert by_name["ids"].array_type == "INT64"
+    assert by_name["vocabularies"].array_type == "STRING"
+    assert by_name["weights"].array_type == "FLOAT64"
+    assert by_name["empty"].array_type == "INT64"
+    assert by_name["days"].type_ == "INT64"
+    assert by_name["flag"].type_ == "BOOL"
+
+    with pytest.raises(ValueError, match="mixes element types"):
+        _query_parameters({"mixed": [1, "SNOMED"]})
+
+
+@pytest.mark.asyncio
+async def test_bigquery_validate_sql_caches_dry_runs():
+    """Repeat validations of the same SQL reuse the dry-run result."""
+    backend = BigQueryBackend()
+    mock_client = MagicMock()
+    mock_client.query.return_value.total_bytes_processed = 1_000_000
+
+    with patch.object(backend, "_get_client", return_value=mock_client):
+        first = await backend.validate_sql("SELECT 1")
+        second = await backend.validate_sql("SELECT 1")
+        reformatted = await backend.validate_sql("SELECT\n    1 ")
+        await backend.validate_sql("SELECT 2")
+
+    assert first == second == reformatted
+    assert mock_client.query.call_count == 2
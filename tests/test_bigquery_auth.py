@@ -101,6 +101,28 @@ class TestBigQueryAuthentication:
         mock_bigquery.Client.assert_called_once_with(project="detected-project")
         assert client == mock_client
 
+    @patch("omop_mcp.backends.bigquery.config")
+    @patch("omop_mcp.backends.bigquery.bigquery")
+    @patch("omop_mcp.backends.bigquery.google_auth_default")
+    def test_client_is_reused(self, mock_auth_default, mock_bigquery, mock_config):
+        """Test that the authenticated client is built once and cached."""
+        # Setup
+        mock_config.bigquery_project_id = self.test_project_id
+        mock_config.bigquery_dataset_id = self.test_dataset_id
+        mock_config.bigquery_credentials_path = None
+
+        mock_auth_default.return_value = (Mock(), "detected-project")
+
+        # Test
+        backend = BigQueryBackend()
+        first = backend._get_client()
+        second = backend._get_client()
+
+        # Verify
+        assert first is second
+        mock_auth_default.assert_called_once()
+        mock_bigquery.Client.assert_called_once_with(project=self.test_project_id)
+
     @patch("omop_mcp.backends.bigquery.config")
     @patch("omop_mcp.backends.bigquery.google_auth_default")
     def test_adc_authentication_failure(self, mock_auth_default, mock_config):
@@ -261,6 +283,36 @@ class TestBigQueryAuthentication:
         mock_client.query.assert_called_once()
         assert result == mock_results
 
+    @patch("omop_mcp.backends.bigquery._ARROW_AVAILABLE", True)
+    @patch("omop_mcp.backends.bigquery.config")
+    @patch("omop_mcp.backends.bigquery.bigquery")
+    async def test_execute_query_uses_arrow_when_available(self, mock_bigquery, mock_config):
+        """Test that execute_query fetches rows through Arrow when available."""
+        # Setup
+        mock_config.bigquery_project_id = self.test_project_id
+        mock_config.bigquery_dataset_id = self.test_dataset_id
+        mock_config.bigquery_credentials_path = None
+        mock_config.query_timeout_sec = 30
+
+        mock_rows = Mock()
+        mock_rows.to_arrow.return_value.to_pylist.return_value = [{"col1": "value1"}]
+        mock_client = Mock()
+        mock_client.query.return_value.result.return_value = mock_rows
+        mock_bigquery.Client.return_value = mock_client
+
+        # Test
+        backend = BigQueryBackend()
+
+        with patch(
+            "omop_mcp.backends.bigquery.google_auth_default",
+            return_value=(Mock(), "detected-project"),
+        ):
+            result = await backend.execute_query("SELECT 1")
+
+        # Verify
+        mock_rows.to_arrow.assert_called_once_with(create_bqstorage_client=True)
+        assert result == [{"col1": "value1"}]
+
 
 class TestBigQueryAuthenticationIntegration:
     """Integration tests for BigQuery authentication."""
@@ -34,3 +34,13 @@ def test_config_types():
     assert isinstance(config.allow_patient_list, bool)
     assert isinstance(config.query_timeout_sec, int)
     assert isinstance(config.max_concepts_per_query, int)
+
+
+def test_config_table_and_column_lists_are_frozensets():
+    """Allowlist/blocklist are normalized to lowercased frozensets."""
+    assert isinstance(config.omop_allowed_tables, frozenset)
+    assert isinstance(config.omop_blocked_columns, frozenset)
+    assert "person" in config.omop_allowed_tables
+
+    custom = OMOPConfig(openai_api_key="sk-test", omop_allowed_tables=["Person", "DEATH"])
+    assert custom.omop_allowed_tables == frozenset({"person", "death"})
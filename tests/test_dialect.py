@@ -1,6 +1,10 @@
 """Tests for SQL dialect translation and new backends."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from sqlglot import exp
 from omop_mcp.backends import (
     DuckDBBackend,
     SnowflakeBackend,
@@ -11,7 +15,13 @@ from omop_mcp.backends import (
     translate_sql,
     validate_sql,
 )
-from omop_mcp.backends.dialect import SQLDialectError
+from omop_mcp.backends.dialect import (
+    SQLDialectError,
+    _translate_cached,
+    contains_mutation,
+    get_sql_tables,
+    optimize_sql,
+)
 
 
 class TestSQLDialectTranslation:
@@ -53,6 +63,18 @@ class TestSQLDialectTranslation:
 
         assert "DATEDIFF" in snowflake_sql or "DATE_DIFF" in snowflake_sql
 
+    def test_translate_sql_memoizes_repeat_translations(self):
+        """Test that repeated translations, including via aliases, reuse the cached result."""
+        sql = "SELECT person_id FROM person WHERE year_of_birth > 1970"
+        _translate_cached.cache_clear()
+
+        first = translate_sql(sql, "bigquery", "postgres")
+        second = translate_sql(sql, "BigQuery", "postgresql")
+
+        assert first == second
+        info = _translate_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
     def test_translate_sql_same_dialect(self):
         """Test that translation between same dialect returns original."""
         sql = "SELECT * FROM users"
@@ -96,6 +118,13 @@ class TestSQLDialectTranslation:
         assert error is not None
         assert isinstance(error, str)
 
+    def test_validate_sql_fast_path_skips_statement_check(self):
+        """Test that fast_path only checks that the SQL parses."""
+        sql = "DROP TABLE person"
+
+        assert validate_sql(sql, "postgres")[0] is False
+        assert validate_sql(sql, "postgres", fast_path=True) == (True, None)
+
     def test_validate_sql_unsupported_dialect(self):
         """Test validation with unsupported dialect."""
         is_valid, error = validate_sql("SELECT 1", "unsupported")
@@ -125,6 +154,43 @@ class TestSQLDialectTranslation:
         assert "18" in formatted
         assert "active" in formatted
 
+    def test_get_sql_tables_returns_qualified_names(self):
+        """Test that table extraction returns qualified names without aliases."""
+        sql = "SELECT * FROM `proj.cdm.person` p JOIN cdm.death d ON p.person_id = d.person_id"
+
+        assert get_sql_tables(sql) == ["proj.cdm.person", "cdm.death"]
+
+    def test_optimize_sql_does_not_mutate_cached_parse(self):
+        """Test that optimizing leaves the memoized AST intact for later callers."""
+        sql = "SELECT a FROM t WHERE 1 = 1 AND x > 2"
+
+        optimize_sql(sql, dialect="postgres")
+        formatted = format_sql(sql, dialect="postgres")
+
+        assert "1 = 1" in formatted
+
+    def test_contains_mutation_uses_ast(self):
+        """Test that keywords in identifiers or literals are not treated as mutations."""
+        assert contains_mutation("SELECT 'drop' AS note, updated_at FROM t", "duckdb") is False
+        assert contains_mutation("SELECT 1; DROP TABLE person", "duckdb") is True
+        assert contains_mutation("DELETE FROM person", "snowflake") is True
+
+    def test_contains_mutation_allowed_types(self):
+        """Test that callers can permit specific statement types."""
+        sql = "INSERT INTO t VALUES (1)"
+
+        assert contains_mutation(sql, "duckdb") is True
+        assert contains_mutation(sql, "duckdb", allowed=(exp.Insert,)) is False
+
+    def test_contains_mutation_falls_back_on_unparseable_sql(self):
+        """Test that SQL SQLGlot cannot parse is checked by keyword."""
+        assert contains_mutation("SELECT FROM WHERE DROP", "duckdb") is True
+
+    def test_contains_mutation_falls_back_on_tokenizer_errors(self):
+        """Test that an unterminated string is keyword-scanned instead of raising."""
+        assert contains_mutation("SELECT 'unterminated FROM person", "duckdb") is False
+        assert contains_mutation("DROP TABLE person WHERE x = 'oops", "duckdb") is True
+
 
 class TestSnowflakeBackend:
     """Tests for Snowflake backend."""
@@ -170,12 +236,125 @@ class TestSnowflakeBackend:
         )
 
         assert "WITH exposure AS" in parts.exposure_cte
-        assert "1503297" in parts.exposure_cte
+        assert "FLATTEN(input => PARSE_JSON(%(exposure_ids)s))" in parts.exposure_cte
         assert "outcome AS" in parts.outcome_cte
-        assert "443530" in parts.outcome_cte
+        assert "%(outcome_ids)s" in parts.outcome_cte
+        assert parts.params == {"exposure_ids": [1503297], "outcome_ids": [443530]}
         assert "DATEDIFF(DAY" in parts.cohort_cte  # Snowflake syntax
         assert "90" in parts.cohort_cte
-        assert "QUALIFY ROW_NUMBER()" in parts.final_select
+        assert parts.final_select == "SELECT * FROM cohort"
+
+    @pytest.mark.asyncio
+    async def test_snowflake_execute_uses_arrow_fetch(self):
+        """Test that Snowflake results are fetched as Arrow when pyarrow is available."""
+        backend = SnowflakeBackend()
+        mock_cursor = MagicMock()
+        mock_cursor.fetch_arrow_all.return_value.to_pylist.return_value = [{"ID": 1}]
+        mock_conn = MagicMock()
+        mock_conn.is_still_running.return_value = False
+        mock_conn.cursor.return_value = mock_cursor
+
+        with (
+            patch("omop_mcp.backends.snowflake._ARROW_AVAILABLE", True),
+            patch.object(backend, "_get_connection", return_value=mock_conn),
+        ):
+            rows = await backend.execute_query("SELECT 1 AS id")
+
+        assert rows == [{"ID": 1}]
+        mock_cursor.fetchall.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_snowflake_reuses_pooled_connections(self):
+        """Test that queries reuse one authenticated connection instead of reconnecting."""
+        backend = SnowflakeBackend()
+        mock_cursor = MagicMock()
+        mock_cursor.description = [("ID",)]
+        mock_cursor.fetchall.return_value = [(1,)]
+        mock_conn = MagicMock()
+        mock_conn.is_closed.return_value = False
+        mock_conn.is_still_running.return_value = False
+        mock_conn.cursor.return_value = mock_cursor
+
+        with (
+            patch("omop_mcp.backends.snowflake._ARROW_AVAILABLE", False),
+            patch.object(backend, "_get_connection", return_value=mock_conn) as mock_connect,
+        ):
+            await backend.validate_sql("SELECT 1 AS id")
+            rows = await backend.execute_query("SELECT 1 AS id")
+
+        assert rows == [{"ID": 1}]
+        mock_connect.assert_called_once()
+        mock_conn.close.assert_not_called()
+        backend.close()
+        mock_conn.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_snowflake_execute_submits_async_and_polls(self):
+        """Test that queries are submitted with execute_async and polled until done."""
+        backend = SnowflakeBackend()
+        mock_cursor = MagicMock()
+        mock_cursor.sfqid = "01-query-id"
+        mock_cursor.description = [("ID",)]
+        mock_cursor.fetchall.return_value = [(1,)]
+        mock_conn = MagicMock()
+        mock_conn.is_closed.return_value = False
+        mock_conn.is_still_running.side_effect = [True, True, False]
+        mock_conn.cursor.return_value = mock_cursor
+
+        with (
+            patch("omop_mcp.backends.snowflake._ARROW_AVAILABLE", False),
+            patch("omop_mcp.backends.snowflake._POLL_INITIAL_S", 0),
+            patch.object(backend, "_get_connection", return_value=mock_conn),
+        ):
+            rows = await backend.execute_query("SELECT 1 AS id", limit=10)
+
+        assert rows == [{"ID": 1}]
+        mock_cursor.execute.assert_not_called()
+        assert mock_cursor.execute_async.call_args[0][0].endswith("LIMIT 10")
+        assert mock_conn.get_query_status_throw_if_error.call_count == 3
+        mock_cursor.get_results_from_sfqid.assert_called_once_with("01-query-id")
+        mock_cursor.close.assert_called_once()
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_snowflake_binds_concept_ids_as_json_arrays(self):
+        """Test that list parameters are sent as one JSON string, not expanded into the SQL."""
+        backend = SnowflakeBackend()
+        mock_cursor = MagicMock()
+        mock_cursor.description = [("PERSON_ID",)]
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.is_closed.return_value = False
+        mock_conn.is_still_running.return_value = False
+        mock_conn.cursor.return_value = mock_cursor
+
+        parts = await backend.build_cohort_sql(
+            exposure_ids=[1503297, 1502905], outcome_ids=[443530], pre_outcome_days=30
+        )
+        with (
+            patch("omop_mcp.backends.snowflake._ARROW_AVAILABLE", False),
+            patch.object(backend, "_get_connection", return_value=mock_conn),
+        ):
+            await backend.execute_query(parts.to_sql(), params=parts.params)
+
+        bound = mock_cursor.execute_async.call_args[0][1]
+        assert bound == {"exposure_ids": "[1503297,1502905]", "outcome_ids": "[443530]"}
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_snowflake_validate_sql_caches_explain(self):
+        """Successful EXPLAINs are reused for reformatted copies of the same SQL."""
+        backend = SnowflakeBackend()
+        backend.database, backend.schema = "OMOP", "CDM"
+
+        with patch.object(backend, "_query", new_callable=AsyncMock) as mock_query:
+            first = await backend.validate_sql("SELECT 1")
+            second = await backend.validate_sql("SELECT\n  1")
+            backend.schema = "OTHER"
+            await backend.validate_sql("SELECT 1")
+
+        assert first.valid is second.valid is True
+        assert mock_query.await_count == 2
 
     def test_snowflake_translate_from_bigquery(self):
         """Test translating BigQuery SQL to Snowflake."""
@@ -217,6 +396,17 @@ class TestDuckDBBackend:
 
         assert table_name == "omop.person"
 
+    def test_duckdb_qualified_table_follows_schema_change(self):
+        """Precomputed table names are rebuilt when the schema is reassigned."""
+        backend = DuckDBBackend()
+        backend.schema = "main"
+        assert backend.qualified_table("person") == "person"
+        assert backend.qualified_table("person") is backend.qualified_table("person")
+
+        backend.schema = "cdm"
+        assert backend.qualified_table("person") == "cdm.person"
+        assert backend.qualified_table("custom_table") == "cdm.custom_table"
+
     def test_duckdb_age_calculation(self):
         """Test DuckDB age calculation SQL."""
         backend = DuckDBBackend()
@@ -240,13 +430,62 @@ class TestDuckDBBackend:
         )
 
         assert "WITH exposure AS" in parts.exposure_cte
-        assert "1503297" in parts.exposure_cte
-        assert "1503298" in parts.exposure_cte
+        assert "$exposure_ids" in parts.exposure_cte
         assert "outcome AS" in parts.outcome_cte
-        assert "443530" in parts.outcome_cte
+        assert "$outcome_ids" in parts.outcome_cte
+        assert parts.params == {"exposure_ids": [1503297, 1503298], "outcome_ids": [443530]}
         assert "date_diff('day'" in parts.cohort_cte  # DuckDB syntax
         assert "30" in parts.cohort_cte
-        assert "QUALIFY ROW_NUMBER()" in parts.final_select
+        assert parts.final_select == "SELECT * FROM cohort"
+
+    @pytest.mark.asyncio
+    async def test_duckdb_cohort_sql_executes_with_bound_ids(self):
+        """Test that parameterized cohort SQL runs against DuckDB."""
+        backend = DuckDBBackend()
+        backend.schema = "main"
+        await backend.execute_query(
+            "CREATE TABLE drug_exposure AS SELECT 1 AS person_id, 1503297 AS drug_concept_id, "
+            "DATE '2024-01-01' AS drug_exposure_start_date"
+        )
+        await backend.execute_query(
+            "CREATE TABLE condition_occurrence AS SELECT 1 AS person_id, "
+            "443530 AS condition_concept_id, DATE '2024-01-11' AS condition_start_date"
+        )
+
+        parts = await backend.build_cohort_sql(
+            exposure_ids=[1503297], outcome_ids=[443530], pre_outcome_days=30
+        )
+        rows = await backend.execute_query(parts.to_sql(), params=parts.params)
+
+        assert [(row["person_id"], row["days_to_outcome"]) for row in rows] == [(1, 10)]
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_duckdb_cohort_uses_first_exposure_and_earliest_outcome(self):
+        """Test that each person gets one row: first exposure, earliest outcome in window."""
+        backend = DuckDBBackend()
+        await backend.execute_query(
+            "CREATE TABLE drug_exposure AS SELECT * FROM (VALUES "
+            "(1, 1503297, DATE '2024-01-01'), (1, 1503297, DATE '2024-01-01'), "
+            "(1, 1503297, DATE '2024-02-01'), (2, 1503297, DATE '2024-03-01')) "
+            "t(person_id, drug_concept_id, drug_exposure_start_date)"
+        )
+        await backend.execute_query(
+            "CREATE TABLE condition_occurrence AS SELECT * FROM (VALUES "
+            "(1, 443530, DATE '2024-01-20'), (1, 443530, DATE '2024-01-11'), "
+            "(2, 443530, DATE '2024-09-01')) "
+            "t(person_id, condition_concept_id, condition_start_date)"
+        )
+
+        parts = await backend.build_cohort_sql(
+            exposure_ids=[1503297], outcome_ids=[443530], pre_outcome_days=30
+        )
+        rows = await backend.execute_query(parts.to_sql(), params=parts.params)
+
+        assert [(r["person_id"], str(r["outcome_date"]), r["days_to_outcome"]) for r in rows] == [
+            (1, "2024-01-11", 10)
+        ]
+        backend.close()
 
     @pytest.mark.asyncio
     async def test_duckdb_validate_sql(self):
@@ -283,6 +522,61 @@ class TestDuckDBBackend:
         assert results[0]["id"] == 1
         assert results[0]["name"] == "test"
 
+    @pytest.mark.asyncio
+    async def test_duckdb_execute_caps_rows_at_limit(self):
+        """Test that an explicit, larger LIMIT in the SQL cannot exceed the row cap."""
+        backend = DuckDBBackend()
+        sql = "SELECT * FROM range(10000) t(id) LIMIT 10000"
+
+        results = await backend.execute_query(sql, limit=5000)
+
+        assert len(results) == 5000
+        assert results[-1] == {"id": 4999}
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_duckdb_validate_and_execute(self):
+        """Test that validation and execution share a single DuckDB run."""
+        backend = DuckDBBackend()
+
+        with patch.object(backend, "validate_sql") as mock_validate:
+            validation, rows = await backend.validate_and_execute("SELECT 1 AS id", limit=10)
+            invalid, no_rows = await backend.validate_and_execute("SELECT missing_col", limit=10)
+
+        mock_validate.assert_not_called()
+        assert validation.valid is True
+        assert validation.estimated_cost_usd == 0.0
+        assert rows == [{"id": 1}]
+        assert invalid.valid is False
+        assert "missing_col" in (invalid.error_message or "")
+        assert no_rows is None
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_duckdb_read_only_file_shared_by_readers(self, tmp_path):
+        """Test that a database file opened read-only serves several readers at once."""
+        db_path = str(tmp_path / "omop.duckdb")
+        with patch("omop_mcp.backends.duckdb.config") as mock_config:
+            mock_config.duckdb_database_path = db_path
+            mock_config.duckdb_schema = "main"
+            mock_config.duckdb_read_only = False
+            writer = DuckDBBackend()
+            await writer.execute_query("CREATE TABLE person AS SELECT 1 AS person_id")
+            writer.close()
+
+            mock_config.duckdb_read_only = True
+            readers = [DuckDBBackend(), DuckDBBackend()]
+
+        results = await asyncio.gather(
+            *(r.execute_query("SELECT person_id FROM person") for r in readers)
+        )
+        assert results == [[{"person_id": 1}], [{"person_id": 1}]]
+
+        with pytest.raises(ValueError, match="Mutating queries not allowed"):
+            await readers[0].execute_query("INSERT INTO person VALUES (2)")
+        for reader in readers:
+            reader.close()
+
     @pytest.mark.asyncio
     async def test_duckdb_blocks_dangerous_queries(self):
         """Test that DuckDB blocks dangerous queries."""
@@ -294,6 +588,30 @@ class TestDuckDBBackend:
         with pytest.raises(ValueError, match="Mutating queries not allowed"):
             await backend.execute_query("DROP TABLE users")
 
+    @pytest.mark.asyncio
+    async def test_duckdb_concurrent_queries_share_database(self):
+        """Test that pooled cursors run concurrently against one database."""
+        backend = DuckDBBackend()
+        await backend.execute_query("CREATE TABLE pool_test AS SELECT 42 AS answer")
+
+        validation = await backend.validate_sql("SELECT answer FROM pool_test")
+        results = await asyncio.gather(
+            *(backend.execute_query("SELECT answer FROM pool_test") for _ in range(8))
+        )
+
+        assert validation.valid is True
+        assert all(rows == [{"answer": 42}] for rows in results)
+        backend.close()
+
+    @pytest.mark.asyncio
+    async def test_duckdb_allows_keyword_prefixed_columns(self):
+        """Test that columns like updated_at do not trip the mutation check."""
+        backend = DuckDBBackend()
+
+        results = await backend.execute_query("SELECT 1 AS updated_at, 2 AS dropped_flag")
+
+        assert results == [{"updated_at": 1, "dropped_flag": 2}]
+
     def test_duckdb_translate_from_bigquery(self):
         """Test translating BigQuery SQL to DuckDB."""
         backend = DuckDBBackend()
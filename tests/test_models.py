@@ -1,6 +1,6 @@
 """Tests for OMOP MCP Pydantic models."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 from omop_mcp.models import (
@@ -164,6 +164,7 @@ class TestConceptDiscoveryResult:
         assert result.query == "diabetes"
         assert len(result.concepts) == 2
         assert isinstance(result.timestamp, datetime)
+        assert result.timestamp.utcoffset() == timedelta(0)
 
     def test_discovery_result_concept_ids_property(self):
         """Test concept_ids property."""
@@ -231,6 +232,29 @@ class TestConceptDiscoveryResult:
         assert len(standard) == 1
         assert standard[0].concept_id == 1
 
+    def test_discovery_result_derived_views_are_cached(self):
+        """Test concept_ids/standard_concepts are computed once and not serialized."""
+        concepts = [
+            OMOPConcept(
+                id=1,
+                name="Standard",
+                domain="Condition",
+                vocabulary="SNOMED",
+                className="Clinical Finding",
+                standardConcept="S",
+                code="123",
+                invalidReason=None,
+            ),
+        ]
+
+        result = ConceptDiscoveryResult(query="test", concepts=concepts)
+
+        assert result.concept_ids is result.concept_ids
+        assert result.standard_concepts is result.standard_concepts
+        dumped = result.model_dump()
+        assert "concept_ids" not in dumped
+        assert "standard_concepts" not in dumped
+
 
 class TestCohortSQLRequest:
     """Tests for CohortSQLRequest model."""
@@ -29,6 +29,69 @@ async def test_get_cohort_sql_prompt():
     assert "5678" in prompt_text
 
 
+def test_cohort_sql_prompt_is_memoized():
+    """Repeat renders with equal concept sets reuse the cached prompt."""
+    prompts._cohort_sql_prompt.cache_clear()
+    exposure = [{"concept_id": 1234, "concept_name": "Statin"}]
+    outcome = [{"concept_id": 5678, "concept_name": "Myopathy"}]
+
+    first = prompts.get_cohort_sql_prompt(exposure, outcome, 180, "bigquery")
+    second = prompts.get_cohort_sql_prompt([dict(c) for c in exposure], outcome, 180, "bigquery")
+
+    assert first is second
+    info = prompts._cohort_sql_prompt.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
+
+
+def test_cohort_sql_prompt_segments_lead_with_static_prefix():
+    """The static header is shared across concept sets and marked cacheable."""
+    first = prompts.get_cohort_sql_prompt_segments(
+        [{"concept_id": 1234, "concept_name": "Statin"}],
+        [{"concept_id": 5678, "concept_name": "Myopathy"}],
+        180,
+        "bigquery",
+    )
+    second = prompts.get_cohort_sql_prompt_segments(
+        [{"concept_id": 1, "concept_name": "Drug A"}],
+        [{"concept_id": 2, "concept_name": "Event B"}],
+        90,
+        "postgresql",
+    )
+
+    assert first.segments[0] == second.segments[0]
+    assert first.segments[0]["cacheable"] is True
+    assert "**Tables**" in first.segments[0]["text"]
+    assert "Statin" not in first.segments[0]["text"]
+    assert "Statin" in first.segments[1]["text"]
+
+    blocks = first.to_anthropic_content()
+    assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in blocks[1]
+    assert "".join(b["text"] for b in blocks) == first.text
+
+
+@pytest.mark.parametrize(
+    ("dialect", "expected", "absent"),
+    [
+        ("bigquery", "DATE_ADD(e.exposure_date, INTERVAL 30 DAY)", "DISTINCT ON"),
+        ("postgresql", "DISTINCT ON (e.person_id)", "DATE_DIFF("),
+        ("snowflake", "DATEADD(day, 30, e.exposure_date)", "DATE_DIFF("),
+        ("duckdb", "date_diff('day', e.exposure_date, o.outcome_date)", "DATE_DIFF("),
+    ],
+)
+def test_cohort_sql_prompt_example_matches_dialect(dialect, expected, absent):
+    """The example SQL is written in the requested dialect."""
+    prompt_text = prompts.get_cohort_sql_prompt(
+        [{"concept_id": 1, "concept_name": "Drug A"}],
+        [{"concept_id": 2, "concept_name": "Event B"}],
+        30,
+        dialect,
+    )
+
+    assert expected in prompt_text
+    assert absent not in prompt_text
+
+
 @pytest.mark.asyncio
 async def test_get_analysis_discovery_prompt():
     """Test analysis discovery prompt generation."""
@@ -62,6 +125,15 @@ async def test_get_multi_step_query_prompt():
     assert "query_omop" in prompt_text
 
 
+def test_multi_step_query_prompt_reuses_concept_id_list():
+    """The joined concept IDs appear in the header and both query_omop calls."""
+    prompt_text = prompts.get_multi_step_query_prompt([313217, 316866], "Condition")
+
+    assert "You have discovered 2 concepts" in prompt_text
+    assert prompt_text.count("313217, 316866") == 3
+    assert prompt_text.count("concept_ids=[313217, 316866]") == 2
+
+
 @pytest.mark.asyncio
 async def test_get_prompt_cohort_sql():
     """Test get_prompt with cohort/sql ID."""
@@ -80,6 +152,7 @@ async def test_get_prompt_cohort_sql():
     assert "Drug A" in result["content"]
     assert "Event B" in result["content"]
     assert "90 days" in result["content"]
+    assert "".join(seg["text"] for seg in result["segments"]) == result["content"]
 
 
 @pytest.mark.asyncio
@@ -130,6 +203,20 @@ async def test_get_prompt_missing_arguments():
         )
 
 
+@pytest.mark.asyncio
+async def test_get_prompt_validates_argument_types():
+    """Arguments are coerced by the prompt's model, and bad types are rejected."""
+    result = await prompts.get_prompt(
+        "query/multi-step", {"concept_ids": ["313217"], "domain": "Condition"}
+    )
+    assert "313217" in result["content"]
+
+    with pytest.raises(ValueError, match="Invalid arguments for query/multi-step"):
+        await prompts.get_prompt(
+            "query/multi-step", {"concept_ids": ["not-an-id"], "domain": "Condition"}
+        )
+
+
 @pytest.mark.asyncio
 async def test_get_prompt_invalid_id():
     """Test get_prompt with invalid prompt ID."""
@@ -154,6 +241,21 @@ async def test_list_prompts():
         assert "description" in prompt
         assert "arguments" in prompt
         assert isinstance(prompt["arguments"], list)
+        assert set(prompt) == {"id", "name", "description", "arguments"}
+
+
+@pytest.mark.asyncio
+async def test_list_and_get_prompt_share_metadata():
+    """list_prompts and get_prompt read names and required arguments from one registry."""
+    listed = {p["id"]: p for p in await prompts.list_prompts()}
+    result = await prompts.get_prompt(
+        "query/multi-step", {"concept_ids": [313217], "domain": "Condition"}
+    )
+
+    assert result["name"] == listed["query/multi-step"]["name"]
+    for prompt_id, prompt in listed.items():
+        required = {a["name"] for a in prompt["arguments"] if a["required"]}
+        assert required == prompts._PROMPT_REQUIRED[prompt_id]
 
 
 @pytest.mark.asyncio
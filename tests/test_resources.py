@@ -2,19 +2,33 @@
 Tests for MCP resources module.
 """
 
+import asyncio
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 from omop_mcp import resources
-from omop_mcp.models import OMOPConcept
+from omop_mcp.models import ConceptDiscoveryResult, ConceptRelationship, OMOPConcept
+
+
+@pytest.fixture(autouse=True)
+def reset_resource_caches():
+    """Start each test with empty resource caches."""
+    resources._concept_cache.clear()
+    resources._search_cache.clear()
+    resources._discovery_cache.clear()
+    resources._relationship_cache.clear()
+    resources._capabilities = None
+    yield
 
 
 @pytest.fixture
 def mock_athena_client():
-    """Mock AthenaAPIClient for testing."""
-    with patch("omop_mcp.resources.AthenaAPIClient") as mock_client_class:
+    """Mock the shared AthenaAPIClient for testing."""
+    with patch("omop_mcp.resources.get_athena_client") as mock_get_client:
         mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
         yield mock_client
 
 
@@ -47,6 +61,51 @@ async def test_get_concept_resource_success(mock_athena_client):
     mock_athena_client.get_concept_by_id.assert_called_once_with(313217)
 
 
+@pytest.mark.asyncio
+async def test_get_concept_resource_is_cached(mock_athena_client):
+    """Repeat lookups of the same concept skip the ATHENA call."""
+    mock_athena_client.get_concept_by_id.return_value = OMOPConcept(
+        id=313217,
+        name="Atrial fibrillation",
+        domain="Condition",
+        vocabulary="SNOMED",
+        className="Clinical Finding",
+        standardConcept="S",
+        code="49436004",
+        invalidReason=None,
+        score=None,
+    )
+
+    first = await resources.get_concept_resource(313217)
+    first["concept_name"] = "mutated by caller"
+    second = await resources.get_concept_resource(313217)
+
+    assert second["concept_name"] == "Atrial fibrillation"
+    mock_athena_client.get_concept_by_id.assert_called_once_with(313217)
+
+
+@pytest.mark.asyncio
+async def test_get_concept_resource_concurrent_requests_share_one_call(mock_athena_client):
+    """Concurrent lookups of one concept make a single ATHENA call."""
+    mock_athena_client.get_concept_by_id.return_value = OMOPConcept(
+        id=201826,
+        name="Type 2 diabetes mellitus",
+        domain="Condition",
+        vocabulary="SNOMED",
+        className="Clinical Finding",
+        standardConcept="S",
+        code="44054006",
+        invalidReason=None,
+        score=None,
+    )
+
+    results = await asyncio.gather(*(resources.get_concept_resource(201826) for _ in range(5)))
+
+    assert all(r["concept_name"] == "Type 2 diabetes mellitus" for r in results)
+    mock_athena_client.get_concept_by_id.assert_called_once_with(201826)
+    assert resources._concept_inflight == {}
+
+
 @pytest.mark.asyncio
 async def test_get_concept_resource_not_found(mock_athena_client):
     """Test concept not found."""
@@ -140,6 +199,31 @@ async def test_search_concepts_resource_with_pagination(mock_athena_client):
     assert len(result2["concepts"]) == 3
     assert result2["concepts"][0]["concept_id"] == 3
     assert result2["next_cursor"] == "offset:6"
+    assert result2["total_count"] is None
+
+    # Only rows through the page plus one sentinel are requested
+    assert mock_athena_client.search_concepts.call_args[1]["limit"] == 7
+
+    # Last page: the total becomes known
+    result3 = await resources.search_concepts_resource(query="test", cursor="offset:9", page_size=3)
+
+    assert [c["concept_id"] for c in result3["concepts"]] == [9]
+    assert result3["next_cursor"] is None
+    assert result3["total_count"] == 10
+
+
+@pytest.mark.asyncio
+async def test_search_concepts_resource_concurrent_searches_share_one_call(mock_athena_client):
+    """Concurrent identical searches make a single ATHENA call."""
+    mock_athena_client.search_concepts.return_value = []
+
+    pages = await asyncio.gather(
+        *(resources.search_concepts_resource(query="asthma", page_size=10) for _ in range(4))
+    )
+
+    assert all(page["concepts"] == [] for page in pages)
+    mock_athena_client.search_concepts.assert_called_once()
+    assert resources._search_inflight == {}
 
 
 @pytest.mark.asyncio
@@ -149,6 +233,14 @@ async def test_search_concepts_resource_invalid_cursor(mock_athena_client):
         await resources.search_concepts_resource(query="test", cursor="invalid")
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["offset:", "offset:abc", "offset:-5", "page:3"])
+async def test_search_concepts_resource_malformed_cursor(mock_athena_client, cursor):
+    """Cursors must be offset:<non-negative int>."""
+    with pytest.raises(ValueError, match="Invalid cursor format"):
+        await resources.search_concepts_resource(query="test", cursor=cursor)
+
+
 @pytest.mark.asyncio
 async def test_search_concepts_resource_page_size_cap(mock_athena_client):
     """Test page size is capped at 100."""
@@ -156,11 +248,162 @@ async def test_search_concepts_resource_page_size_cap(mock_athena_client):
 
     await resources.search_concepts_resource(query="test", page_size=200)
 
-    # Should request limit of 100 (capped from 200)
-    # Note: limit = offset + page_size + 100, with page_size capped at 100
-    # So limit = 0 + 100 + 100 = 200
+    # limit = offset(0) + capped_page_size(100) + one sentinel row
     call_args = mock_athena_client.search_concepts.call_args
-    assert call_args[1]["limit"] == 200  # offset(0) + capped_page_size(100) + buffer(100)
+    assert call_args[1]["limit"] == 101
+
+
+@pytest.mark.asyncio
+async def test_discover_concepts_response_is_cached():
+    """Repeat discovery for the same normalized text reuses the dumped response."""
+    concept = OMOPConcept(
+        id=201826,
+        name="Type 2 diabetes mellitus",
+        domain="Condition",
+        vocabulary="SNOMED",
+        className="Clinical Finding",
+        standardConcept="S",
+        code="44054006",
+        invalidReason=None,
+        score=None,
+    )
+    with patch("omop_mcp.resources.discover_concepts") as mock_discover:
+        mock_discover.return_value = ConceptDiscoveryResult(query="diabetes", concepts=[concept])
+
+        first = await resources.discover_concepts_response("diabetes", domain="Condition")
+        second = await resources.discover_concepts_response("  Diabetes ", domain="Condition")
+
+    mock_discover.assert_called_once()
+    assert first["concept_ids"] == second["concept_ids"] == [201826]
+    assert second["query"] == "  Diabetes "
+    assert second["standard_concepts"][0]["concept_name"] == "Type 2 diabetes mellitus"
+    assert second["timestamp"] >= first["timestamp"]
+    assert second["timestamp"] is not first["timestamp"]
+
+
+@pytest.mark.asyncio
+async def test_discover_concepts_response_standard_concepts():
+    """standard_only responses alias the concept list; others filter it."""
+    standard = OMOPConcept(
+        id=201826,
+        name="Type 2 diabetes mellitus",
+        domain="Condition",
+        vocabulary="SNOMED",
+        className="Clinical Finding",
+        standardConcept="S",
+        code="44054006",
+    )
+    source = OMOPConcept(
+        id=45552385,
+        name="Type 2 diabetes mellitus",
+        domain="Condition",
+        vocabulary="ICD10CM",
+        className="5-char billing code",
+        code="E11.9",
+    )
+    with patch("omop_mcp.resources.discover_concepts") as mock_discover:
+        mock_discover.return_value = ConceptDiscoveryResult(query="diabetes", concepts=[standard])
+        standard_only = await resources.discover_concepts_response("diabetes")
+
+        mock_discover.return_value = ConceptDiscoveryResult(
+            query="diabetes", concepts=[standard, source]
+        )
+        mixed = await resources.discover_concepts_response("diabetes", standard_only=False)
+
+    assert standard_only["standard_concepts"] is standard_only["concepts"]
+    assert mixed["concept_ids"] == [201826, 45552385]
+    assert [c["concept_id"] for c in mixed["standard_concepts"]] == [201826]
+
+
+@pytest.mark.asyncio
+async def test_get_concept_relationships_is_cached(mock_athena_client):
+    """Relationships are dumped once and served from cache afterwards."""
+    mock_athena_client.get_concept_relationships.return_value = [
+        ConceptRelationship(
+            concept_id_1=201826,
+            concept_id_2=201820,
+            relationship_id="Is a",
+            relationship_name="Is a",
+        )
+    ]
+
+    first = await resources.get_concept_relationships(201826)
+    second = await resources.get_concept_relationships(201826)
+
+    assert first is second
+    assert first[0]["concept_id_2"] == 201820
+    mock_athena_client.get_concept_relationships.assert_called_once_with(
+        concept_id=201826, relationship_id=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_concept_relationships_filters_share_one_fetch(mock_athena_client):
+    """Concurrent lookups with different type filters coalesce into one ATHENA call."""
+    mock_athena_client.get_concept_relationships.return_value = [
+        ConceptRelationship(
+            concept_id_1=201826,
+            concept_id_2=201820,
+            relationship_id="Is a",
+            relationship_name="Is a",
+        ),
+        ConceptRelationship(
+            concept_id_1=201826,
+            concept_id_2=443238,
+            relationship_id="Subsumes",
+            relationship_name="Subsumes",
+        ),
+    ]
+
+    everything, is_a, subsumes = await asyncio.gather(
+        resources.get_concept_relationships(201826),
+        resources.get_concept_relationships(201826, "Is a"),
+        resources.get_concept_relationships(201826, "Subsumes"),
+    )
+
+    assert len(everything) == 2
+    assert [r["concept_id_2"] for r in is_a] == [201820]
+    assert [r["concept_id_2"] for r in subsumes] == [443238]
+    mock_athena_client.get_concept_relationships.assert_called_once_with(
+        concept_id=201826, relationship_id=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_clear_athena_caches(mock_athena_client):
+    """Clearing the ATHENA caches forces the next lookup back to the API."""
+    mock_athena_client.get_concept_relationships.return_value = []
+
+    await resources.get_concept_relationships(201826)
+    resources.clear_athena_caches()
+    await resources.get_concept_relationships(201826)
+
+    assert mock_athena_client.get_concept_relationships.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_athena_calls_respect_concurrency_cap(mock_athena_client):
+    """Distinct lookups run in worker threads, but never more than the cap at once."""
+    lock = threading.Lock()
+    active = peak = 0
+
+    def slow_relationships(concept_id, relationship_id):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return []
+
+    mock_athena_client.get_concept_relationships.side_effect = slow_relationships
+
+    with patch.object(resources, "_athena_slots", asyncio.Semaphore(2)):
+        await asyncio.gather(*(resources.get_concept_relationships(i) for i in range(6)))
+
+    assert mock_athena_client.get_concept_relationships.call_count == 6
+    assert peak <= 2
 
 
 @pytest.mark.asyncio
@@ -216,3 +459,22 @@ async def test_get_backend_capabilities_unavailable_backend():
             assert result["count"] == 1
             assert len(result["backends"]) == 1
             assert result["backends"][0]["name"] == "bigquery"
+
+            # The degraded response is not kept; the next call probes again
+            await resources.get_backend_capabilities()
+            assert mock_get.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_get_backend_capabilities_is_cached():
+    """Backends are probed once; later calls reuse the response."""
+    with patch("omop_mcp.resources.list_backends", return_value=["duckdb"]) as mock_list:
+        with patch("omop_mcp.resources.get_backend") as mock_get:
+            mock_get.return_value = MagicMock(dialect="duckdb")
+
+            first = await resources.get_backend_capabilities()
+            second = await resources.get_backend_capabilities()
+
+    assert first is second
+    mock_list.assert_called_once()
+    mock_get.assert_called_once_with("duckdb")
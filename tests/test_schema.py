@@ -8,6 +8,7 @@ import pytest
 from omop_mcp.tools.schema import (
     OMOP_COLUMN_DESCRIPTIONS,
     OMOP_TABLE_DESCRIPTIONS,
+    clear_schema_cache,
     get_all_tables_schema,
     get_omop_cdm_info,
     get_table_schema,
@@ -15,6 +16,14 @@ from omop_mcp.tools.schema import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_schema_cache():
+    """Start every test without cached table schemas."""
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+
+
 class TestGetTableSchema:
     """Test get_table_schema function."""
 
@@ -73,6 +82,59 @@ class TestGetTableSchema:
         with pytest.raises(Exception, match="Database error"):
             await get_table_schema("person", "bigquery")
 
+    @pytest.mark.asyncio
+    @patch("omop_mcp.tools.schema.get_backend")
+    async def test_get_table_schema_cached(self, mock_get_backend):
+        """Repeat lookups reuse the schema until the cache is cleared; backends are keyed apart."""
+        mock_backend = AsyncMock()
+        mock_backend.execute_query.return_value = [
+            {
+                "column_name": "person_id",
+                "data_type": "INTEGER",
+                "is_nullable": "NO",
+                "column_default": None,
+                "ordinal_position": 1,
+            }
+        ]
+        mock_get_backend.return_value = mock_backend
+
+        first = await get_table_schema("person", "bigquery")
+        second = await get_table_schema("person", "bigquery")
+        await get_table_schema("person", "duckdb")
+
+        assert first is second
+        assert mock_backend.execute_query.call_count == 2
+
+        clear_schema_cache()
+        await get_table_schema("person", "bigquery")
+        assert mock_backend.execute_query.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch("omop_mcp.tools.schema.get_backend")
+    async def test_get_table_schema_empty_not_cached(self, mock_get_backend):
+        """A table with no columns yet is looked up again instead of cached."""
+        mock_backend = AsyncMock()
+        mock_backend.execute_query.side_effect = [
+            [],
+            [
+                {
+                    "column_name": "person_id",
+                    "data_type": "INTEGER",
+                    "is_nullable": "NO",
+                    "column_default": None,
+                    "ordinal_position": 1,
+                }
+            ],
+        ]
+        mock_get_backend.return_value = mock_backend
+
+        missing = await get_table_schema("person", "bigquery")
+        created = await get_table_schema("person", "bigquery")
+
+        assert missing["column_count"] == 0
+        assert created["column_count"] == 1
+        assert mock_backend.execute_query.call_count == 2
+
     @pytest.mark.asyncio
     @patch("omop_mcp.tools.schema.get_backend")
     async def test_get_non_omop_table(self, mock_get_backend):
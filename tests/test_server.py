@@ -0,0 +1,147 @@
+"""Tests for MCP server tools."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from omop_mcp import server
+from omop_mcp.models import QueryOMOPResult
+
+
+class TestApplyRowLimit:
+    """Tests for the LIMIT appended by select_query."""
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT * FROM person LIMIT 10",
+            "SELECT * FROM person LIMIT 10 -- top ten",
+            "SELECT * FROM person LIMIT 10 /* x */",
+            "SELECT * FROM person LIMIT 10;" + " " * 100,
+            "SELECT * FROM person LIMIT 10 OFFSET 20",
+            "select * from person limit 10; -- done\n",
+            "SELECT * FROM person LIMIT ALL",
+            "SELECT * FROM person FETCH FIRST 5 ROWS ONLY",
+            "SELECT * FROM person LIMIT @n",
+            "SELECT * FROM person WHERE x = '--' LIMIT 5 -- c",
+        ],
+    )
+    def test_existing_outer_limit_is_kept(self, sql):
+        """Test an outer LIMIT or FETCH is detected past comments, semicolons and whitespace."""
+        assert server._apply_row_limit(sql, 1000) == sql
+
+    def test_subquery_limit_gets_outer_limit(self):
+        """Test a LIMIT inside a subquery does not suppress the outer limit."""
+        sql = "SELECT * FROM (SELECT * FROM person LIMIT 5) p"
+
+        assert server._apply_row_limit(sql, 1000) == f"{sql}\nLIMIT 1000"
+
+    def test_limit_appended_before_trailing_comment(self):
+        """Test the appended LIMIT is not swallowed by a trailing comment or semicolon."""
+        sql = "SELECT * FROM person; -- all people"
+
+        assert server._apply_row_limit(sql, 50) == "SELECT * FROM person\nLIMIT 50"
+
+    def test_comment_marker_in_string_literal(self):
+        """Test '--' inside a string literal is not treated as a comment."""
+        sql = "SELECT * FROM person WHERE x = '--' LIMIT 10"
+
+        assert server._apply_row_limit(sql, 1000) == sql
+
+    async def test_select_query_sends_single_limit(self):
+        """Test select_query executes a commented LIMIT query without a second LIMIT."""
+        sql = "SELECT person_id FROM person LIMIT 10 -- top ten"
+        mock_backend = Mock()
+        mock_backend.execute_query = AsyncMock(return_value=[{"person_id": 1}])
+
+        with patch.object(server, "get_backend", return_value=mock_backend):
+            result = await server.select_query(Mock(), sql=sql, validate=False, execute=True)
+
+        mock_backend.execute_query.assert_awaited_once_with(sql, 1000)
+        assert result["row_count"] == 1
+
+
+class TestSelectQueryBackendTask:
+    """Tests for the backend lookup select_query starts alongside validation."""
+
+    async def test_backend_lookup_released_when_validation_raises(self):
+        """Test a failed backend lookup is consumed when validation raises first."""
+        with (
+            patch.object(server, "get_backend", side_effect=RuntimeError("no credentials")),
+            patch.object(
+                server,
+                "validate_sql_comprehensive",
+                AsyncMock(side_effect=ValueError("validator crashed")),
+            ),
+        ):
+            with pytest.raises(ValueError, match="validator crashed"):
+                await server.select_query(Mock(), sql="SELECT 1", execute=True)
+
+
+class TestQueryOMOP:
+    """Tests for the query_omop tool."""
+
+    async def test_concept_ids_deduplicated_and_sorted(self):
+        """Test overlapping discovery IDs reach the query builder once, in sorted order."""
+        mock_query = AsyncMock(
+            return_value=QueryOMOPResult(sql="SELECT 1", backend="duckdb", dialect="duckdb")
+        )
+
+        with patch.object(server, "query_by_concepts", mock_query):
+            await server.query_omop(
+                Mock(), query_type="count", concept_ids=[201826, 4329847, 201826], execute=False
+            )
+
+        assert mock_query.await_args.kwargs["concept_ids"] == [201826, 4329847]
+
+
+class TestGenerateCohortSQL:
+    """Tests for the generate_cohort_sql tool."""
+
+    async def test_concept_ids_deduplicated_before_counting(self):
+        """Test duplicate IDs are dropped, sorted, and excluded from concept_counts."""
+        mock_parts = Mock()
+        mock_parts.params = {}
+        mock_parts.to_sql.return_value = "SELECT * FROM cohort"
+        mock_backend = Mock()
+        mock_backend.name = "duckdb"
+        mock_backend.dialect = "duckdb"
+        mock_backend.build_cohort_sql = AsyncMock(return_value=mock_parts)
+
+        with patch("omop_mcp.tools.sqlgen.get_backend", return_value=mock_backend):
+            result = await server.generate_cohort_sql(
+                Mock(),
+                exposure_concept_ids=[1503297, 1115008, 1503297],
+                outcome_concept_ids=[46271022, 46271022],
+                backend="duckdb",
+                validate=False,
+            )
+
+        assert result["concept_counts"] == {"exposure": 2, "outcome": 1}
+        build_kwargs = mock_backend.build_cohort_sql.await_args.kwargs
+        assert build_kwargs["exposure_ids"] == [1115008, 1503297]
+        assert build_kwargs["outcome_ids"] == [46271022]
+
+
+class TestGetConceptRelationshipsBulk:
+    """Tests for the get_concept_relationships_bulk tool."""
+
+    async def test_duplicates_collapsed_and_failures_isolated(self):
+        """Test repeated IDs are fetched once and one failed lookup does not fail the rest."""
+
+        async def fake_relationships(concept_id, relationship_id=None):
+            if concept_id == 999:
+                raise RuntimeError("ATHENA unavailable")
+            return [{"concept_id_2": concept_id + 1}] * (2 if concept_id == 201826 else 1)
+
+        mock_relationships = AsyncMock(side_effect=fake_relationships)
+
+        with patch.object(server.resources, "get_concept_relationships", mock_relationships):
+            result = await server.get_concept_relationships_bulk(
+                Mock(), concept_ids=[201826, 201820, 201826, 999], relationship_id="Maps to"
+            )
+
+        assert mock_relationships.await_count == 3
+        mock_relationships.assert_any_await(201826, "Maps to")
+        assert list(result["relationships"]) == [201826, 201820]
+        assert result["relationship_count"] == 3
+        assert result["errors"] == {999: "ATHENA unavailable"}
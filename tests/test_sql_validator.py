@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from omop_mcp.models import SQLValidationResult
+from omop_mcp.tools import sql_validator
 from omop_mcp.tools.sql_validator import (
     ColumnBlockedError,
     SecurityViolationError,
@@ -13,6 +14,7 @@ from omop_mcp.tools.sql_validator import (
     TableNotAllowedError,
     extract_column_names,
     extract_table_names,
+    fast_mutation_check,
     validate_column_blocklist,
     validate_row_limit,
     validate_security,
@@ -96,6 +98,19 @@ class TestSecurityValidation:
         sql = "WITH RECURSIVE hierarchy AS (SELECT * FROM concept) SELECT * FROM hierarchy"
         validate_security(sql)  # Should not raise
 
+    def test_fast_mutation_check(self):
+        """Test the pre-parse scan reports the first dangerous keyword."""
+        assert fast_mutation_check("SELECT * FROM person") is None
+        assert fast_mutation_check("select 1; drop table person") == "DROP"
+        assert fast_mutation_check("SELECT 1 " * 10_000 + "; DELETE FROM person") == "DELETE"
+
+    def test_keywords_inside_names_and_literals_allowed(self):
+        """Test dangerous keywords only match as whole words."""
+        validate_security("SELECT person_id, created_at, updated_by FROM person")
+        validate_security(
+            "SELECT * FROM concept_relationship WHERE relationship_id = 'Concept replaced by'"
+        )
+
 
 class TestTableAllowlistValidation:
     """Test OMOP table allowlist validation."""
@@ -302,6 +317,42 @@ class TestComprehensiveValidation:
         assert result.error_message is not None
         assert "not allowed" in result.error_message
 
+    @pytest.mark.asyncio
+    @patch("omop_mcp.tools.sql_validator.config")
+    async def test_sql_parsed_once(self, mock_config):
+        """Syntax, allowlist and blocklist checks share a single parse."""
+        mock_config.strict_table_validation = True
+        mock_config.omop_allowed_tables = ["person"]
+        mock_config.omop_blocked_columns = ["person_source_value"]
+
+        with patch(
+            "omop_mcp.tools.sql_validator.parse_one", wraps=sql_validator.parse_one
+        ) as mock_parse:
+            result = await validate_sql_comprehensive(
+                "SELECT person_id FROM person", "bigquery", 1000, False
+            )
+
+        assert result.valid is True
+        assert mock_parse.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch("omop_mcp.tools.sql_validator.config")
+    async def test_keyword_scan_runs_once(self, mock_config):
+        """The mutation keyword scan is not repeated by the security step."""
+        mock_config.strict_table_validation = False
+        mock_config.omop_blocked_columns = []
+
+        with patch(
+            "omop_mcp.tools.sql_validator.fast_mutation_check",
+            wraps=sql_validator.fast_mutation_check,
+        ) as mock_scan:
+            result = await validate_sql_comprehensive(
+                "SELECT person_id FROM person", "bigquery", 1000, False
+            )
+
+        assert result.valid is True
+        assert mock_scan.call_count == 1
+
     @pytest.mark.asyncio
     @patch("omop_mcp.tools.sql_validator.config")
     @patch("omop_mcp.tools.sql_validator.get_backend")
@@ -30,6 +30,7 @@ class TestGenerateCohortSQL:
 
         # Mock cohort parts
         mock_parts = MagicMock()
+        mock_parts.params = {}
         mock_parts.to_sql.return_value = "SELECT * FROM cohort"
         mock_backend.build_cohort_sql = AsyncMock(return_value=mock_parts)
 
@@ -66,6 +67,7 @@ class TestGenerateCohortSQL:
         mock_backend.dialect = "postgresql"
 
         mock_parts = MagicMock()
+        mock_parts.params = {}
         mock_parts.to_sql.return_value = "SELECT * FROM cohort"
         mock_backend.build_cohort_sql = AsyncMock(return_value=mock_parts)
 
@@ -91,6 +93,7 @@ class TestGenerateCohortSQL:
         mock_backend.dialect = "bigquery"
 
         mock_parts = MagicMock()
+        mock_parts.params = {}
         mock_parts.to_sql.return_value = "SELECT * FROM invalid_table"
         mock_backend.build_cohort_sql = AsyncMock(return_value=mock_parts)
 